@@ -1,5 +1,9 @@
 import json
 from reactome_service import ReactomeService
+from reactome_crawler import crawl_pathway
+from reactome_store import SQLiteStore, SQLITE_FILENAME, migrate_folder_store
+from reactome_index import ReactomeIndex, INDEX_FILENAME
+from reactome_enrichment import PathwayEnrichment
 
 def load_config():
     try:
@@ -9,13 +13,59 @@ def load_config():
         print("ERROR: config.json not found. Please create with your email.")
         exit(1)
 
+def load_index(service, progress):
+    index_path = service.download_folder / INDEX_FILENAME
+    index = ReactomeIndex.load(index_path)
+    # Only entities downloaded since the last search are read and indexed
+    if index.update_from_store(service.store, progress):
+        index.save(index_path)
+    return index
+
+def search_offline(service, progress):
+    index = load_index(service, progress)
+
+    print("Search by:\n a. Gene / protein identifier\n b. Entities below a stable ID\n c. Name")
+    mode = input("Enter a, b or c: ").strip().lower()
+    if mode == "a":
+        gene = input("Gene name or UniProt ID: ").strip()
+        hits = index.pathways_with_gene(gene)
+    elif mode == "b":
+        st_id = input("Stable ID: ").strip()
+        schema = input("Only this type, e.g. Reaction (empty for all): ").strip()
+        hits = index.descendants(st_id, schema or None)
+    elif mode == "c":
+        hits = index.search(input("Words in the name: "))
+    else:
+        print("Invalid option.")
+        return
+
+    for st_id in sorted(hits):
+        record = index.records.get(st_id)
+        name = record["name"] if record else "(not downloaded)"
+        print(f"{st_id}\t{name}")
+    print(f"{len(hits)} results.")
+
+def enrichment_offline(service, progress):
+    index = load_index(service, progress)
+    genes = input("Enter gene symbols (comma or space separated): ").replace(",", " ").split()
+    engine = PathwayEnrichment.from_index(index)
+    results = engine.analyse(genes)
+    print(f"{len(engine.pathways)} pathways tested, {len(engine.genes)} genes in the background.")
+    print("Pathway\tFound/Size\tp-value\tFDR\tName")
+    for row in results[:20]:
+        print(f"{row['pathway']}\t{row['found']}/{row['size']}\t{row['p_value']:.2e}\t{row['fdr']:.2e}\t{row['name']}")
+
 def main():
     config = load_config()
     service = ReactomeService(config)
 
     print("=== Reactome Content Downloader ===")
-    print("Options:\n1. Get Reactome version\n2. Download entity/pathway JSON by stable ID")
-    choice = input("Enter choice (1 or 2): ").strip()
+    print("Options:\n1. Get Reactome version\n2. Download entity/pathway JSON by stable ID"
+          "\n3. Download full pathway hierarchy by stable ID"
+          "\n4. Migrate downloaded folders into a single SQLite archive"
+          "\n5. Search downloaded content (offline)"
+          "\n6. Pathway enrichment of a gene list (offline)")
+    choice = input("Enter choice (1-6): ").strip()
 
     def progress(msg):
         print(msg)
@@ -27,6 +77,32 @@ def main():
         st_id = input("Enter Reactome stable ID (e.g. R‑HSA‑199420): ").strip()
         service.download_pathway_json(st_id, progress)
         print("Finished. Check downloads on your Desktop.")
+    elif choice == "3":
+        st_id = input("Enter Reactome stable ID (e.g. R‑HSA‑199420): ").strip()
+        depth = input("Maximum depth (empty for no limit): ").strip()
+        if depth and not depth.isdigit():
+            print("Invalid depth, enter a whole number (0 or more) or leave it empty.")
+            return
+        types = input("Only follow these types, comma separated (e.g. Pathway,Reaction; empty for all): ").strip()
+        results = crawl_pathway(
+            service,
+            st_id,
+            max_depth=int(depth) if depth else None,
+            types={t.strip() for t in types.split(",")} if types else None,
+            progress_callback=progress,
+        )
+        failed = [k for k, v in results.items() if v is None]
+        print(f"Finished. Downloaded {len(results) - len(failed)} entities, {len(failed)} failed.")
+    elif choice == "4":
+        target = SQLiteStore(service.download_folder / SQLITE_FILENAME)
+        count = migrate_folder_store(service.download_folder, target, progress_callback=progress)
+        target.close()
+        print(f"Finished. {count} entities copied to {target.path}.")
+        print('Set "storage": "sqlite" in config.json to download into the archive from now on.')
+    elif choice == "5":
+        search_offline(service, progress)
+    elif choice == "6":
+        enrichment_offline(service, progress)
     else:
         print("Invalid option.")
 
@@ -0,0 +1,123 @@
+"""
+Breadth-first crawler over a Reactome pathway hierarchy.
+
+Starting from one stable ID, every downloaded JSON is scanned for nested
+objects that carry their own `stId` (sub-events, reactions, participants,
+...). Those are fetched in turn by a pool of worker threads. A visited set
+makes sure entities shared between branches are downloaded only once.
+"""
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+
+# Keys that point sideways or upwards in Reactome instead of down the tree.
+# Following them would turn a single pathway into a crawl of the whole database.
+SKIP_KEYS = {
+    "orthologousEvent",
+    "inferredFrom",
+    "inferredTo",
+    "precedingEvent",
+    "followingEvent",
+    "normalPathway",
+    "normalReaction",
+    "normalEntity",
+    "species",
+    "relatedSpecies",
+    "compartment",
+}
+
+
+def extract_references(data, types=None):
+    """
+    Return [(stId, schemaClass), ...] for every entity referenced by `data`.
+    A nested object with its own `stId` is reported but not descended into;
+    its children are found once that entity is downloaded itself.
+    If `types` is given only entities whose schemaClass is in it are kept.
+    """
+    refs = []
+
+    def walk(value, is_root=False):
+        if isinstance(value, dict):
+            if not is_root and "stId" in value:
+                schema = value.get("schemaClass") or value.get("className")
+                if types is None or schema in types:
+                    refs.append((value["stId"], schema))
+                return
+            for key, child in value.items():
+                if key not in SKIP_KEYS:
+                    walk(child)
+        elif isinstance(value, list):
+            for child in value:
+                walk(child)
+
+    walk(data, is_root=True)
+    return refs
+
+
+def crawl_pathway(service, root_id, max_depth=None, types=None, workers=8,
+                  progress_callback=None, retries=2):
+    """
+    Download `root_id` and everything below it.
+
+    max_depth: how many levels below the root to follow (None = unlimited)
+    types:     schemaClass names to follow, e.g. {"Pathway", "Reaction"}
+    workers:   number of concurrent downloads
+    retries:   extra attempts for an entity after a network error
+
+    Returns a dict {stId: filepath} (filepath is None if the download failed).
+    A failing entity (network error, bad JSON, ...) is reported and skipped;
+    the rest of the crawl goes on.
+    """
+    results = {}
+    visited = {root_id}
+    queue = deque([(root_id, 0)])
+    running = {}
+
+    def fetch(st_id):
+        for attempt in range(retries + 1):
+            try:
+                text = service.fetch_pathway_json(st_id, progress_callback)
+                break
+            except requests.RequestException:
+                if attempt == retries:
+                    raise
+        if text is None:
+            return None, None
+        data = json.loads(text)
+        return service.save_pathway_json(st_id, text), data
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while queue or running:
+            # Keep a bounded number of requests in flight, oldest level first
+            while queue and len(running) < workers * 2:
+                st_id, depth = queue.popleft()
+                running[pool.submit(fetch, st_id)] = (st_id, depth)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                st_id, depth = running.pop(future)
+                try:
+                    filepath, data = future.result()
+                except Exception as error:
+                    results[st_id] = None
+                    if progress_callback:
+                        progress_callback(f"Error: {error!r} when downloading {st_id}")
+                    continue
+                results[st_id] = filepath
+                if filepath is None:
+                    continue
+
+                if progress_callback:
+                    progress_callback(f"[{len(results)}] depth {depth}: saved {st_id}")
+
+                if max_depth is not None and depth >= max_depth:
+                    continue
+
+                for ref_id, _schema in extract_references(data, types):
+                    if ref_id not in visited:
+                        visited.add(ref_id)
+                        queue.append((ref_id, depth + 1))
+
+    return results
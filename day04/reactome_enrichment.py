@@ -0,0 +1,224 @@
+"""
+Offline pathway over-representation analysis on top of the local index.
+
+Pathway membership is stored as one packed bitset per pathway (one bit per
+gene of the universe). For a gene list only the bit columns of its genes are
+read, which gives the overlap with every pathway at once. The hypergeometric
+p-values of all pathways are then computed in one vectorised pass from a table
+of log-factorials, and Benjamini-Hochberg FDR is applied on top.
+"""
+import re
+
+import numpy as np
+
+from reactome_index import PATHWAY_CLASSES
+
+# Number of set bits for every possible byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def log_factorials(n):
+    """Table with log(k!) for k = 0..n."""
+    return np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n + 1)))))
+
+
+def _log_pmf(k, K, n, universe, log_fact):
+    lf = log_fact
+    return (
+        lf[K] - lf[k] - lf[K - k]
+        + lf[universe - K] - lf[n - k] - lf[universe - K - n + k]
+        - (lf[universe] - lf[n] - lf[universe - n])
+    )
+
+
+def _tail_series(k, stop, K, n, universe, step):
+    """
+    Sum of pmf(j) / pmf(k) for j = k, k+step, ... up to `stop`, for every row.
+    Walking away from the mode the terms only shrink, so a row stops as soon
+    as its next term no longer changes the sum.
+    """
+    k = k.astype(float)
+    K, n = K.astype(float), n.astype(float)
+    term = np.ones(len(k))
+    total = np.ones(len(k))
+    while True:
+        done = (k == stop) | (term < 1e-17 * total)
+        if done.all():
+            return total
+        if step > 0:
+            ratio = (K - k) * (n - k) / ((k + 1) * (universe - K - n + k + 1))
+        else:
+            ratio = k * (universe - K - n + k) / ((K - k + 1) * (n - k + 1))
+        term = np.where(done, 0.0, term * ratio)
+        total += term
+        k = np.where(done, k, k + step)
+
+
+def hypergeom_sf(found, universe, sizes, drawn, log_fact=None):
+    """
+    P(X >= found) for X ~ Hypergeometric(universe, sizes, drawn), element-wise.
+    Above the mean the upper tail is summed directly; below it we use
+    1 - P(X <= found - 1), so both sums run away from the mode and stay short.
+    """
+    if log_fact is None:
+        log_fact = log_factorials(universe)
+    found, sizes, drawn = (np.asarray(a, dtype=np.int64) for a in np.broadcast_arrays(found, sizes, drawn))
+    found, sizes, drawn = found.ravel(), sizes.ravel(), drawn.ravel()
+    p_values = np.ones(found.shape)
+
+    lowest = np.maximum(0, drawn - (universe - sizes))
+    upper = (found > 0) & (found * universe > sizes * drawn)
+    lower = (found > 0) & ~upper & (found - 1 >= lowest)
+
+    x, K, n = found[upper], sizes[upper], drawn[upper]
+    if x.size:
+        head = np.exp(_log_pmf(x, K, n, universe, log_fact))
+        p_values[upper] = head * _tail_series(x, np.minimum(K, n), K, n, universe, +1)
+
+    x, K, n = found[lower] - 1, sizes[lower], drawn[lower]
+    if x.size:
+        head = np.exp(_log_pmf(x, K, n, universe, log_fact))
+        p_values[lower] = 1.0 - head * _tail_series(x, lowest[lower], K, n, universe, -1)
+
+    return np.clip(p_values, 0.0, 1.0).reshape(np.shape(found))
+
+
+def benjamini_hochberg(p_values):
+    """FDR-adjusted p-values (Benjamini-Hochberg), along the last axis."""
+    p_values = np.asarray(p_values, dtype=float)
+    m = p_values.shape[-1]
+    if m == 0:
+        return p_values.copy()
+    order = np.argsort(p_values, axis=-1)
+    ranked = np.take_along_axis(p_values, order, axis=-1) * m / np.arange(1, m + 1)
+    # Enforce monotonicity from the largest p-value down
+    ranked = np.minimum.accumulate(ranked[..., ::-1], axis=-1)[..., ::-1]
+    adjusted = np.empty_like(ranked)
+    np.put_along_axis(adjusted, order, np.minimum(ranked, 1.0), axis=-1)
+    return adjusted
+
+
+# UniProt accession format, see https://www.uniprot.org/help/accession_numbers
+UNIPROT_RE = re.compile(r"^([OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9]([A-Z][A-Z0-9]{2}[0-9]){1,2})(-\d+)?$")
+
+
+def pathway_gene_sets(index, namespace="symbol"):
+    """
+    {pathway stId: set of genes anywhere below it} from a ReactomeIndex.
+    The index mixes gene symbols and UniProt accessions; `namespace` keeps only
+    one of them ("symbol" or "uniprot") so a protein is not counted twice.
+    Shared sub-trees are only expanded once.
+    """
+    if namespace == "symbol":
+        keep = lambda gene: not UNIPROT_RE.match(gene)
+    elif namespace == "uniprot":
+        keep = lambda gene: bool(UNIPROT_RE.match(gene))
+    else:
+        raise ValueError(f"Unknown namespace: {namespace!r} (use 'symbol' or 'uniprot')")
+    memo = {}
+
+    def genes_below(st_id, path):
+        if st_id in memo:
+            return memo[st_id]
+        record = index.records.get(st_id)
+        if record is None or st_id in path:  # not downloaded, or a cycle
+            return set()
+        path.add(st_id)
+        genes = {gene for gene in record["genes"] if keep(gene)}
+        for child in record["children"]:
+            genes |= genes_below(child, path)
+        path.discard(st_id)
+        memo[st_id] = genes
+        return genes
+
+    return {
+        st_id: genes_below(st_id, set())
+        for st_id, record in index.records.items()
+        if record["schema"] in PATHWAY_CLASSES
+    }
+
+
+class PathwayEnrichment:
+    def __init__(self, pathway_genes, names=None, min_size=5, max_size=2000):
+        """
+        pathway_genes: {pathway id: iterable of gene identifiers}
+        Pathways with fewer than `min_size` or more than `max_size` genes are not tested.
+        """
+        pathway_genes = {
+            pathway: {g.upper() for g in genes}
+            for pathway, genes in pathway_genes.items()
+            if min_size <= len(set(genes)) <= max_size
+        }
+        self.names = names or {}
+        self.pathways = sorted(pathway_genes)
+        self.genes = sorted(set().union(*pathway_genes.values())) if pathway_genes else []
+        self.gene_ids = {gene: i for i, gene in enumerate(self.genes)}
+
+        n_bytes = (len(self.genes) + 7) // 8
+        self.membership = np.zeros((len(self.pathways), n_bytes), dtype=np.uint8)
+        for row, pathway in enumerate(self.pathways):
+            self.membership[row] = self._pack(pathway_genes[pathway])
+        self.sizes = _POPCOUNT[self.membership].sum(axis=1, dtype=np.int64)
+        self.log_fact = log_factorials(len(self.genes))
+
+    @classmethod
+    def from_index(cls, index, namespace="symbol", **kwargs):
+        names = {st_id: record["name"] for st_id, record in index.records.items()}
+        return cls(pathway_gene_sets(index, namespace), names=names, **kwargs)
+
+    def _pack(self, genes):
+        bits = np.zeros(len(self.genes), dtype=bool)
+        ids = [self.gene_ids[g] for g in genes if g in self.gene_ids]
+        bits[ids] = True
+        return np.packbits(bits)
+
+    def overlaps(self, genes):
+        """Number of query genes in every pathway, plus the query size inside the universe."""
+        ids = np.array(sorted({self.gene_ids[g] for g in map(str.upper, genes) if g in self.gene_ids}),
+                       dtype=np.int64)
+        # Bit `id` lives in byte id // 8, most significant bit first (np.packbits order)
+        columns = self.membership[:, ids >> 3]
+        bits = (columns >> (7 - (ids & 7)).astype(np.uint8)) & 1
+        return bits.sum(axis=1, dtype=np.int64), len(ids)
+
+    def analyse_many(self, gene_lists, max_fdr=1.0):
+        """
+        Run the analysis for many gene lists at once.
+        Returns one list per gene list of result dicts sorted by p-value,
+        only for pathways with at least one gene found and fdr <= max_fdr.
+        """
+        if not gene_lists or not self.pathways:
+            return [[] for _ in gene_lists]
+
+        found = np.empty((len(gene_lists), len(self.pathways)), dtype=np.int64)
+        p_values = np.empty(found.shape)
+        for i, genes in enumerate(gene_lists):
+            found[i], drawn = self.overlaps(genes)
+            p_values[i] = hypergeom_sf(found[i], len(self.genes), self.sizes, drawn, self.log_fact)
+        fdr = benjamini_hochberg(p_values)
+
+        results = []
+        for i in range(len(gene_lists)):
+            hits = np.flatnonzero((found[i] > 0) & (fdr[i] <= max_fdr))
+            hits = hits[np.argsort(p_values[i, hits], kind="stable")]
+            results.append([
+                {
+                    "pathway": self.pathways[j],
+                    "name": self.names.get(self.pathways[j], ""),
+                    "found": hit_found,
+                    "size": size,
+                    "p_value": p_value,
+                    "fdr": q_value,
+                }
+                for j, hit_found, size, p_value, q_value in zip(
+                    hits.tolist(),
+                    found[i, hits].tolist(),
+                    self.sizes[hits].tolist(),
+                    p_values[i, hits].tolist(),
+                    fdr[i, hits].tolist(),
+                )
+            ])
+        return results
+
+    def analyse(self, genes, max_fdr=1.0):
+        return self.analyse_many([genes], max_fdr)[0]
@@ -0,0 +1,195 @@
+"""
+Offline inverted index over downloaded Reactome JSON.
+
+Each stored entity is reduced to a small record (type, name, species, genes,
+children). From those records we keep inverted indexes so questions like
+"which pathways contain gene X" or "all reactions under R-HSA-..." are answered
+from memory without touching the network or re-reading any JSON.
+"""
+import json
+import re
+from collections import defaultdict, deque
+from pathlib import Path
+
+from reactome_crawler import extract_references
+
+PATHWAY_CLASSES = {"Pathway", "TopLevelPathway"}
+INDEX_FILENAME = "reactome_index.json"
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text):
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+def summarize_entity(data):
+    """
+    Reduce one entity JSON to the fields we index.
+    Genes are collected from the entity itself and its reference entities
+    (UniProt/Ensembl `identifier` and `geneName`), not from nested entities
+    that have their own stable ID - those are indexed when they are downloaded.
+    """
+    genes = set()
+
+    def walk(value, is_root=False):
+        if isinstance(value, dict):
+            if not is_root and "stId" in value:
+                return
+            names = value.get("geneName") or []
+            if isinstance(names, str):
+                names = [names]
+            for name in names:
+                genes.add(str(name).upper())
+            if "identifier" in value and "databaseName" in value:
+                genes.add(str(value["identifier"]).upper())
+            for child in value.values():
+                walk(child)
+        elif isinstance(value, list):
+            for child in value:
+                walk(child)
+
+    walk(data, is_root=True)
+
+    species = data.get("speciesName")
+    if species is None and data.get("species"):
+        species = data["species"][0].get("displayName")
+
+    return {
+        "schema": data.get("schemaClass") or data.get("className"),
+        "name": data.get("displayName", ""),
+        "species": species,
+        "genes": sorted(genes),
+        "children": [st_id for st_id, _ in extract_references(data)],
+    }
+
+
+class ReactomeIndex:
+    def __init__(self):
+        self.records = {}
+        self.by_gene = defaultdict(set)
+        self.by_token = defaultdict(set)
+        self.by_species = defaultdict(set)
+        self.parents = defaultdict(set)
+
+    # -----------------------
+    # Building
+    # -----------------------
+
+    def add(self, st_id, data):
+        """Index (or re-index) one entity from its parsed JSON."""
+        self._add_record(st_id, summarize_entity(data))
+
+    def _add_record(self, st_id, record):
+        if st_id in self.records:
+            self.remove(st_id)
+        self.records[st_id] = record
+        for gene in record["genes"]:
+            self.by_gene[gene].add(st_id)
+        for token in _tokens(record["name"]):
+            self.by_token[token].add(st_id)
+        if record["species"]:
+            self.by_species[record["species"].lower()].add(st_id)
+        for child in record["children"]:
+            self.parents[child].add(st_id)
+
+    def remove(self, st_id):
+        record = self.records.pop(st_id)
+        for gene in record["genes"]:
+            self.by_gene[gene].discard(st_id)
+        for token in _tokens(record["name"]):
+            self.by_token[token].discard(st_id)
+        if record["species"]:
+            self.by_species[record["species"].lower()].discard(st_id)
+        for child in record["children"]:
+            self.parents[child].discard(st_id)
+
+    def update_from_store(self, store, progress_callback=None):
+        """Index only the entities in `store` that are not indexed yet."""
+        added = 0
+        for st_id in store.ids():
+            if st_id in self.records:
+                continue
+            text = store.get(st_id)
+            if text is None:
+                continue
+            self.add(st_id, json.loads(text))
+            added += 1
+        if progress_callback:
+            progress_callback(f"Indexed {added} new entities ({len(self.records)} total)")
+        return added
+
+    # -----------------------
+    # Persistence
+    # -----------------------
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.records, f)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved index, or return an empty one if the file does not exist."""
+        index = cls()
+        if Path(path).is_file():
+            with open(path, "r", encoding="utf-8") as f:
+                for st_id, record in json.load(f).items():
+                    index._add_record(st_id, record)
+        return index
+
+    # -----------------------
+    # Queries
+    # -----------------------
+
+    def entities_with_gene(self, gene):
+        return set(self.by_gene.get(gene.upper(), ()))
+
+    def ancestors(self, *st_ids):
+        """Everything that has one of `st_ids` somewhere below it."""
+        seen = set()
+        queue = deque(st_ids)
+        while queue:
+            for parent in self.parents.get(queue.popleft(), ()):
+                if parent not in seen:
+                    seen.add(parent)
+                    queue.append(parent)
+        return seen
+
+    def descendants(self, st_id, schema=None):
+        """All indexed entities below `st_id`, optionally only of one schemaClass."""
+        seen = set()
+        queue = deque([st_id])
+        while queue:
+            record = self.records.get(queue.popleft())
+            if record is None:
+                continue
+            for child in record["children"]:
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        if schema is not None:
+            seen = {s for s in seen if s in self.records and self.records[s]["schema"] == schema}
+        return seen
+
+    def pathways_with_gene(self, gene):
+        """Pathways that contain `gene` anywhere below them."""
+        hits = self.entities_with_gene(gene)
+        candidates = hits | self.ancestors(*hits)
+        return {
+            st_id for st_id in candidates
+            if st_id in self.records and self.records[st_id]["schema"] in PATHWAY_CLASSES
+        }
+
+    def search(self, text):
+        """Entities whose name contains every word of `text`."""
+        tokens = _tokens(text)
+        if not tokens:
+            return set()
+        result = None
+        for token in tokens:
+            hits = self.by_token.get(token, set())
+            result = set(hits) if result is None else result & hits
+        return result
+
+    def entities_in_species(self, species):
+        return set(self.by_species.get(species.lower(), ()))
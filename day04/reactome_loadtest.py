@@ -0,0 +1,90 @@
+"""
+Load harness for the downloader, meant to run against reactome_stub.py.
+
+For each concurrency level the same list of stable IDs is fetched through
+`ReactomeService.fetch_pathway_json` and we report requests/sec, p50/p99
+latency and bytes/sec.
+
+    python reactome_loadtest.py --requests 2000 --latency 0.02 --levels 1,4,16,64
+"""
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from reactome_service import ReactomeService
+from reactome_stub import start_stub_server
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list (q in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def run_load(service, st_ids, workers):
+    """Fetch every ID in `st_ids` with `workers` threads and return the statistics."""
+
+    def timed_fetch(st_id):
+        start = time.perf_counter()
+        text = service.fetch_pathway_json(st_id)
+        return time.perf_counter() - start, text
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(timed_fetch, st_ids))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, text in results if text is None)
+    total_bytes = sum(len(text.encode("utf-8")) for _, text in results if text is not None)
+    return {
+        "workers": workers,
+        "requests": len(st_ids),
+        "errors": errors,
+        "seconds": elapsed,
+        "requests_per_sec": len(st_ids) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "bytes_per_sec": total_bytes / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Reactome downloader against the local stub")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--levels", default="1,2,4,8,16,32", help="comma separated worker counts")
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=20000)
+    parser.add_argument("--fixtures", help="serve these fixture files instead of synthetic entities")
+    args = parser.parse_args()
+
+    server = start_stub_server(
+        fixtures=args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+        seed=0,
+    )
+    st_ids = [f"R-HSA-{i}" for i in range(args.requests)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ReactomeService({"base_url": server.base_url, "download_folder": tmp})
+        print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'MB/s':>8} {'errors':>7}")
+        for workers in (int(level) for level in args.levels.split(",")):
+            stats = run_load(service, st_ids, workers)
+            print(
+                f"{stats['workers']:>8} {stats['requests_per_sec']:>10.1f} "
+                f"{stats['p50_ms']:>9.2f} {stats['p99_ms']:>9.2f} "
+                f"{stats['bytes_per_sec'] / 1e6:>8.2f} {stats['errors']:>7}"
+            )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
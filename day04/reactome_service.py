@@ -1,15 +1,35 @@
+import threading
+
 import requests
 from pathlib import Path
 
+from reactome_store import open_store
+
 class ReactomeService:
     # Updated base URL
     BASE_URL = "https://reactome.org/ContentService"
 
     def __init__(self, config):
         self.email = config.get("contact_email", "")
+        # Both can be overridden, e.g. to point at the local stub server
+        self.base_url = config.get("base_url", self.BASE_URL).rstrip("/")
         self.desktop = Path.home() / "Desktop"
-        self.download_folder = self.desktop / "Reactome_Downloads"
+        self.download_folder = Path(config.get("download_folder", self.desktop / "Reactome_Downloads"))
         self.download_folder.mkdir(parents=True, exist_ok=True)
+        self.store = open_store(config, self.download_folder)
+        # Seconds to wait for the server; without it a stalled connection blocks a worker forever
+        self.timeout = config.get("timeout", 30)
+        # One HTTP session per thread so crawler workers reuse connections
+        self._local = threading.local()
+
+    def _session(self):
+        """Return the requests session owned by the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = f"ReactomeDownloader/1.0 ({self.email})"
+            self._local.session = session
+        return session
 
     def get_pathway_folder(self, st_id):
         """Create folder for a given pathway (stable ID)."""
@@ -17,25 +37,33 @@ class ReactomeService:
         folder.mkdir(parents=True, exist_ok=True)
         return folder
 
-    def download_pathway_json(self, st_id, progress_callback=None):
+    def fetch_pathway_json(self, st_id, progress_callback=None):
         """
-        Download Reactome pathway or event as JSON from the ContentService API.
-        `st_id` is stable identifier, like "R‑HSA‑199420" or any event ID.
+        Fetch the raw JSON text of a Reactome entity without saving it.
+        Returns None if the ContentService does not answer with 200.
         """
-        url = f"{self.BASE_URL}/data/query/{st_id}"
-        headers = {"User-Agent": f"ReactomeDownloader/1.0 ({self.email})"}
-        resp = requests.get(url, headers=headers)
+        url = f"{self.base_url}/data/query/{st_id}"
+        resp = self._session().get(url, timeout=self.timeout)
         if resp.status_code != 200:
             if progress_callback:
                 progress_callback(f"Error: {resp.status_code} when downloading {st_id}")
             return None
+        return resp.text
+
+    def save_pathway_json(self, st_id, text):
+        """Write already fetched JSON text to the configured store."""
+        return self.store.put(st_id, text)
 
-        data = resp.json()
-        folder = self.get_pathway_folder(st_id)
-        filepath = folder / f"{st_id}.json"
+    def download_pathway_json(self, st_id, progress_callback=None):
+        """
+        Download Reactome pathway or event as JSON from the ContentService API.
+        `st_id` is stable identifier, like "R‑HSA‑199420" or any event ID.
+        """
+        text = self.fetch_pathway_json(st_id, progress_callback)
+        if text is None:
+            return None
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(resp.text)
+        filepath = self.save_pathway_json(st_id, text)
 
         if progress_callback:
             progress_callback(f"Saved JSON for {st_id} to {filepath}")
@@ -45,9 +73,8 @@ class ReactomeService:
         """
         Download the current Reactome database version.
         """
-        url = f"{self.BASE_URL}/data/database/version"
-        headers = {"User-Agent": f"ReactomeDownloader/1.0 ({self.email})"}
-        resp = requests.get(url, headers=headers)
+        url = f"{self.base_url}/data/database/version"
+        resp = self._session().get(url, timeout=self.timeout)
         if resp.status_code != 200:
             if progress_callback:
                 progress_callback(f"Error retrieving version: {resp.status_code}")
@@ -0,0 +1,205 @@
+"""
+Storage backends for downloaded Reactome JSON.
+
+FolderStore keeps the original layout (one folder + one file per stable ID).
+SQLiteStore keeps everything in a single compressed SQLite file, which is much
+kinder to the filesystem once a crawl reaches hundreds of thousands of entities.
+Both offer the same small interface: put / get / `in` / ids / items / close.
+"""
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is used when it is not installed
+    zstandard = None
+
+
+class FolderStore:
+    """Original layout: <root>/<stId>/<stId>.json"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, st_id):
+        return self.root / st_id / f"{st_id}.json"
+
+    def put(self, st_id, text):
+        filepath = self.path_for(st_id)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(text)
+        return filepath
+
+    def put_many(self, pairs):
+        count = 0
+        for st_id, text in pairs:
+            self.put(st_id, text)
+            count += 1
+        return count
+
+    def get(self, st_id):
+        try:
+            with open(self.path_for(st_id), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def __contains__(self, st_id):
+        return self.path_for(st_id).is_file()
+
+    def __len__(self):
+        return sum(1 for _ in self.ids())
+
+    def ids(self):
+        for folder in sorted(self.root.iterdir()):
+            if folder.is_dir() and (folder / f"{folder.name}.json").is_file():
+                yield folder.name
+
+    def items(self):
+        for st_id in self.ids():
+            yield st_id, self.get(st_id)
+
+    def close(self):
+        pass
+
+
+class SQLiteStore:
+    """
+    All entities in one SQLite file, keyed by stable ID (primary key lookup).
+    Blobs are compressed with zstd when `zstandard` is installed, else zlib.
+    The codec is stored per row, so files written with either stay readable.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Crawler workers share the connection, writes are serialised by the lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entities ("
+                " st_id TEXT PRIMARY KEY, codec TEXT NOT NULL, data BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _compress(text):
+        raw = text.encode("utf-8")
+        if zstandard is not None:
+            return "zstd", zstandard.ZstdCompressor(level=9).compress(raw)
+        return "zlib", zlib.compress(raw, 6)
+
+    @staticmethod
+    def _decompress(codec, blob):
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("This store was written with zstd. Please install `zstandard`.")
+            return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+        return zlib.decompress(blob).decode("utf-8")
+
+    def put(self, st_id, text):
+        codec, blob = self._compress(text)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entities (st_id, codec, data) VALUES (?, ?, ?)",
+                (st_id, codec, blob),
+            )
+            self._conn.commit()
+        return f"{self.path}#{st_id}"
+
+    def put_many(self, pairs):
+        """Insert many (stId, text) pairs in a single transaction."""
+        rows = [(st_id, *self._compress(text)) for st_id, text in pairs]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities (st_id, codec, data) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def get(self, st_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT codec, data FROM entities WHERE st_id = ?", (st_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._decompress(*row)
+
+    def __contains__(self, st_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entities WHERE st_id = ?", (st_id,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
+    def ids(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT st_id FROM entities ORDER BY st_id").fetchall()
+        for (st_id,) in rows:
+            yield st_id
+
+    def items(self, batch_size=500):
+        # Separate cursor so a long iteration does not hold the lock
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT st_id, codec, data FROM entities ORDER BY st_id")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for st_id, codec, blob in rows:
+                yield st_id, self._decompress(codec, blob)
+
+    def close(self):
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+SQLITE_FILENAME = "reactome.sqlite"
+
+
+def open_store(config, download_folder):
+    """Create the backend selected by `"storage"` in config.json (default: folder)."""
+    storage = config.get("storage", "folder")
+    if storage == "folder":
+        return FolderStore(download_folder)
+    if storage == "sqlite":
+        return SQLiteStore(Path(download_folder) / SQLITE_FILENAME)
+    raise ValueError(f"Unknown storage backend: {storage!r} (use 'folder' or 'sqlite')")
+
+
+def migrate_folder_store(download_folder, target, batch_size=500, progress_callback=None):
+    """
+    Copy every <stId>/<stId>.json under `download_folder` into `target`.
+    The original files are left untouched. Returns the number of entities copied.
+    """
+    source = FolderStore(download_folder)
+    batch = []
+    copied = 0
+    for st_id, text in source.items():
+        batch.append((st_id, text))
+        if len(batch) >= batch_size:
+            copied += target.put_many(batch)
+            batch = []
+            if progress_callback:
+                progress_callback(f"Migrated {copied} entities")
+    if batch:
+        copied += target.put_many(batch)
+    if progress_callback:
+        progress_callback(f"Migration finished: {copied} entities")
+    return copied
@@ -0,0 +1,160 @@
+"""
+Local stand-in for the Reactome ContentService.
+
+Serves `/data/query/{id}` and `/data/database/version` so the downloader,
+crawler and index can be tested and benchmarked without reactome.org.
+Responses come from `<fixtures>/<stId>.json` files; IDs without a fixture get
+a small synthetic entity (or 404 with `synthetic=False`). Latency, error rate
+and payload size are configurable.
+
+Run it with e.g.
+    python reactome_stub.py --fixtures fixtures/ --latency 0.05 --error-rate 0.01
+and set "base_url": "http://127.0.0.1:8080/ContentService" in config.json.
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+def synthetic_entity(st_id, fanout=0):
+    """A minimal Reaction-like entity, optionally with `fanout` child events."""
+    return {
+        "stId": st_id,
+        "schemaClass": "Pathway" if fanout else "Reaction",
+        "displayName": f"Synthetic event {st_id}",
+        "speciesName": "Homo sapiens",
+        "hasEvent": [
+            {"stId": f"{st_id}.{i}", "schemaClass": "Reaction"} for i in range(fanout)
+        ],
+    }
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under high concurrency
+    request_queue_size = 256
+
+    def __init__(self, address, fixtures=None, latency=0.0, jitter=0.0,
+                 error_rate=0.0, payload_size=0, synthetic=True, fanout=0,
+                 version="94", seed=None):
+        super().__init__(address, StubHandler)
+        self.fixtures = Path(fixtures) if fixtures else None
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.payload_size = payload_size
+        self.synthetic = synthetic
+        self.fanout = fanout
+        self.version = version
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/ContentService"
+
+    def body_for(self, st_id):
+        """JSON text for `st_id`, or None if the ID is unknown."""
+        if self.fixtures is not None:
+            path = self.fixtures / f"{st_id}.json"
+            if path.is_file():
+                text = path.read_text(encoding="utf-8")
+                return self.pad(text)
+        if not self.synthetic:
+            return None
+        # Only the root of a synthetic tree fans out, so the tree has 2 levels
+        fanout = self.fanout if "." not in st_id else 0
+        return self.pad(json.dumps(synthetic_entity(st_id, fanout)))
+
+    def pad(self, text):
+        """Grow a JSON object to roughly `payload_size` bytes."""
+        missing = self.payload_size - len(text)
+        if missing <= 0:
+            return text
+        data = json.loads(text)
+        data["padding"] = "x" * missing
+        return json.dumps(data)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # keep benchmark output readable
+
+    def send_text(self, status, text, content_type="application/json"):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.random_lock:
+            delay = server.latency + server.random.uniform(0, server.jitter)
+            fail = server.random.random() < server.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            self.send_text(500, '{"code": 500, "reason": "stub error"}')
+            return
+
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/ContentService"):
+            path = path[len("/ContentService"):]
+
+        if path == "/data/database/version":
+            self.send_text(200, server.version, "text/plain")
+        elif path.startswith("/data/query/"):
+            body = server.body_for(path[len("/data/query/"):])
+            if body is None:
+                self.send_text(404, '{"code": 404, "reason": "Not Found"}')
+            else:
+                self.send_text(200, body)
+        else:
+            self.send_text(404, '{"code": 404, "reason": "Not Found"}')
+
+
+def start_stub_server(host="127.0.0.1", port=0, **options):
+    """Start a stub server in a background thread. Call `.shutdown()` when done."""
+    server = StubServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Reactome ContentService stub")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", help="folder with <stId>.json files")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--payload-size", type=int, default=0, help="pad responses to this many bytes")
+    parser.add_argument("--fanout", type=int, default=0, help="children of synthetic root entities")
+    parser.add_argument("--no-synthetic", action="store_true", help="404 for IDs without a fixture")
+    args = parser.parse_args()
+
+    server = StubServer(
+        ("127.0.0.1", args.port),
+        fixtures=args.fixtures,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+        synthetic=not args.no_synthetic,
+        fanout=args.fanout,
+    )
+    print(f"Serving on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
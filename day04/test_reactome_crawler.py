@@ -0,0 +1,109 @@
+# test_reactome_crawler.py
+import json
+import threading
+
+import requests
+
+from reactome_crawler import extract_references, crawl_pathway
+
+# A tiny fake hierarchy: pathway -> 2 reactions that share one participant
+ENTITIES = {
+    "R-HSA-1": {
+        "stId": "R-HSA-1", "schemaClass": "Pathway",
+        "hasEvent": [
+            {"stId": "R-HSA-2", "schemaClass": "Reaction"},
+            {"stId": "R-HSA-3", "schemaClass": "Reaction"},
+        ],
+        "species": [{"stId": "R-NUL-9606", "schemaClass": "Species"}],
+    },
+    "R-HSA-2": {
+        "stId": "R-HSA-2", "schemaClass": "Reaction",
+        "input": [{"stId": "R-HSA-10", "schemaClass": "EntityWithAccessionedSequence"}],
+    },
+    "R-HSA-3": {
+        "stId": "R-HSA-3", "schemaClass": "Reaction",
+        "output": [{"stId": "R-HSA-10", "schemaClass": "EntityWithAccessionedSequence"}],
+    },
+    "R-HSA-10": {"stId": "R-HSA-10", "schemaClass": "EntityWithAccessionedSequence"},
+}
+
+
+class FakeService:
+    def __init__(self):
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def fetch_pathway_json(self, st_id, progress_callback=None):
+        with self.lock:
+            self.fetched.append(st_id)
+        if st_id not in ENTITIES:
+            return None
+        return json.dumps(ENTITIES[st_id])
+
+    def save_pathway_json(self, st_id, text):
+        return f"/tmp/{st_id}.json"
+
+
+# -----------------------------
+# extract_references
+# -----------------------------
+
+def test_extract_references_skips_species():
+    refs = extract_references(ENTITIES["R-HSA-1"])
+    assert refs == [("R-HSA-2", "Reaction"), ("R-HSA-3", "Reaction")]
+
+def test_extract_references_type_filter():
+    assert extract_references(ENTITIES["R-HSA-1"], types={"Pathway"}) == []
+
+
+# -----------------------------
+# crawl_pathway
+# -----------------------------
+
+def test_crawl_fetches_shared_entity_once():
+    service = FakeService()
+    results = crawl_pathway(service, "R-HSA-1", workers=4)
+    assert set(results) == {"R-HSA-1", "R-HSA-2", "R-HSA-3", "R-HSA-10"}
+    assert service.fetched.count("R-HSA-10") == 1
+
+def test_crawl_max_depth():
+    service = FakeService()
+    results = crawl_pathway(service, "R-HSA-1", max_depth=1)
+    assert set(results) == {"R-HSA-1", "R-HSA-2", "R-HSA-3"}
+
+def test_crawl_records_failures():
+    service = FakeService()
+    results = crawl_pathway(service, "R-HSA-404")
+    assert results == {"R-HSA-404": None}
+
+class FlakyService(FakeService):
+    """R-HSA-2 fails once, R-HSA-3 always fails, R-HSA-1 references a broken entity."""
+
+    def __init__(self):
+        super().__init__()
+        self.failures = {"R-HSA-2": 1, "R-HSA-3": 99}
+
+    def fetch_pathway_json(self, st_id, progress_callback=None):
+        with self.lock:
+            self.fetched.append(st_id)
+            if self.failures.get(st_id, 0) > 0:
+                self.failures[st_id] -= 1
+                raise requests.ConnectionError(f"connection reset for {st_id}")
+        if st_id == "R-HSA-BAD":
+            return "{not json"
+        data = dict(ENTITIES[st_id])
+        if st_id == "R-HSA-1":
+            data["hasEvent"] = data["hasEvent"] + [{"stId": "R-HSA-BAD", "schemaClass": "Reaction"}]
+        return json.dumps(data)
+
+def test_crawl_survives_errors():
+    service = FlakyService()
+    messages = []
+    results = crawl_pathway(service, "R-HSA-1", retries=2, progress_callback=messages.append)
+    # R-HSA-2 succeeded on the retry and its child was still crawled
+    assert results["R-HSA-2"] == "/tmp/R-HSA-2.json"
+    assert results["R-HSA-10"] == "/tmp/R-HSA-10.json"
+    assert results["R-HSA-3"] is None
+    assert results["R-HSA-BAD"] is None
+    assert service.fetched.count("R-HSA-3") == 3
+    assert any("R-HSA-3" in m and m.startswith("Error") for m in messages)
@@ -0,0 +1,69 @@
+# test_reactome_enrichment.py
+from math import comb
+
+import numpy as np
+import pytest
+
+from reactome_enrichment import PathwayEnrichment, benjamini_hochberg, hypergeom_sf, pathway_gene_sets
+from reactome_index import ReactomeIndex
+
+def exact_sf(found, universe, size, drawn):
+    """P(X >= found) computed exactly with integer binomials."""
+    total = sum(comb(size, k) * comb(universe - size, drawn - k) for k in range(found, min(size, drawn) + 1))
+    return total / comb(universe, drawn)
+
+
+GENES = [f"G{i}" for i in range(100)]
+PATHWAYS = {
+    "P-A": GENES[:10],
+    "P-B": GENES[10:40],
+    "P-C": GENES[40:100],
+}
+
+
+# -----------------------------
+# Statistics
+# -----------------------------
+
+def test_benjamini_hochberg():
+    adjusted = benjamini_hochberg([0.01, 0.04, 0.03, 0.5])
+    assert np.allclose(adjusted, [0.04, 0.0533333, 0.0533333, 0.5])
+
+def test_hypergeom_sf_exact():
+    found = np.array([0, 1, 3, 8, 10, 2])
+    sizes = np.array([10, 40, 40, 25, 10, 95])
+    expected = [exact_sf(x, 100, k, 12) for x, k in zip(found, sizes)]
+    assert np.allclose(hypergeom_sf(found, 100, sizes, 12), expected, rtol=1e-9)
+
+def test_p_values():
+    engine = PathwayEnrichment(PATHWAYS)
+    query = GENES[:6] + GENES[50:52]
+    result = {r["pathway"]: r for r in engine.analyse(query)}
+    assert result["P-A"]["found"] == 6
+    assert result["P-A"]["p_value"] == pytest.approx(exact_sf(6, 100, 10, 8))
+    assert "P-B" not in result  # nothing found
+    assert engine.analyse(query)[0]["pathway"] == "P-A"
+
+def test_analyse_many_matches_single():
+    engine = PathwayEnrichment(PATHWAYS)
+    lists = [GENES[:5], GENES[30:45], ["UNKNOWN"]]
+    assert engine.analyse_many(lists) == [engine.analyse(genes) for genes in lists]
+    assert engine.analyse(["UNKNOWN"]) == []
+
+def test_size_filter():
+    engine = PathwayEnrichment(PATHWAYS, min_size=20, max_size=40)
+    assert engine.pathways == ["P-B"]
+
+
+# -----------------------------
+# Building from the index
+# -----------------------------
+
+def test_pathway_gene_sets_include_sub_events():
+    index = ReactomeIndex()
+    index.add("R-1", {"schemaClass": "Pathway", "hasEvent": [{"stId": "R-2"}]})
+    index.add("R-2", {"schemaClass": "Reaction", "input": [{"stId": "R-3"}]})
+    index.add("R-3", {"schemaClass": "EntityWithAccessionedSequence",
+                      "referenceEntity": {"identifier": "P00533", "databaseName": "UniProt", "geneName": ["EGFR"]}})
+    assert pathway_gene_sets(index) == {"R-1": {"EGFR"}}
+    assert pathway_gene_sets(index, namespace="uniprot") == {"R-1": {"P00533"}}
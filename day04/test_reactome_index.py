@@ -0,0 +1,86 @@
+# test_reactome_index.py
+import json
+
+from reactome_index import ReactomeIndex, summarize_entity
+from reactome_store import FolderStore
+
+PATHWAY = {
+    "stId": "R-HSA-1", "schemaClass": "TopLevelPathway", "displayName": "Signal Transduction",
+    "speciesName": "Homo sapiens",
+    "hasEvent": [{"stId": "R-HSA-2", "schemaClass": "Reaction"}],
+}
+REACTION = {
+    "stId": "R-HSA-2", "schemaClass": "Reaction", "displayName": "EGFR binds EGF",
+    "speciesName": "Homo sapiens",
+    "input": [{"stId": "R-HSA-3", "schemaClass": "EntityWithAccessionedSequence"}],
+}
+PROTEIN = {
+    "stId": "R-HSA-3", "schemaClass": "EntityWithAccessionedSequence", "displayName": "EGFR [plasma membrane]",
+    "species": [{"displayName": "Homo sapiens"}],
+    "referenceEntity": {"identifier": "P00533", "databaseName": "UniProt", "geneName": ["EGFR", "ERBB1"]},
+}
+
+
+def build_index():
+    index = ReactomeIndex()
+    for entity in (PATHWAY, REACTION, PROTEIN):
+        index.add(entity["stId"], entity)
+    return index
+
+
+# -----------------------------
+# Extraction
+# -----------------------------
+
+def test_summarize_entity_genes_and_children():
+    record = summarize_entity(PROTEIN)
+    assert record["genes"] == ["EGFR", "ERBB1", "P00533"]
+    assert record["species"] == "Homo sapiens"
+    assert summarize_entity(REACTION)["children"] == ["R-HSA-3"]
+
+
+# -----------------------------
+# Queries
+# -----------------------------
+
+def test_pathways_with_gene():
+    index = build_index()
+    assert index.pathways_with_gene("egfr") == {"R-HSA-1"}
+    assert index.pathways_with_gene("P00533") == {"R-HSA-1"}
+    assert index.pathways_with_gene("TP53") == set()
+
+def test_descendants_by_type():
+    index = build_index()
+    assert index.descendants("R-HSA-1") == {"R-HSA-2", "R-HSA-3"}
+    assert index.descendants("R-HSA-1", schema="Reaction") == {"R-HSA-2"}
+
+def test_search_and_species():
+    index = build_index()
+    assert index.search("egfr binds") == {"R-HSA-2"}
+    assert index.entities_in_species("homo sapiens") == {"R-HSA-1", "R-HSA-2", "R-HSA-3"}
+
+def test_reindex_replaces_postings():
+    index = build_index()
+    index.add("R-HSA-3", dict(PROTEIN, referenceEntity={"identifier": "P04637", "databaseName": "UniProt", "geneName": ["TP53"]}))
+    assert index.entities_with_gene("EGFR") == set()
+    assert index.entities_with_gene("TP53") == {"R-HSA-3"}
+
+
+# -----------------------------
+# Incremental updates & persistence
+# -----------------------------
+
+def test_update_from_store_is_incremental(tmp_path):
+    store = FolderStore(tmp_path / "downloads")
+    store.put("R-HSA-1", json.dumps(PATHWAY))
+    index = ReactomeIndex()
+    assert index.update_from_store(store) == 1
+
+    store.put("R-HSA-2", json.dumps(REACTION))
+    store.put("R-HSA-3", json.dumps(PROTEIN))
+    assert index.update_from_store(store) == 2
+    assert index.pathways_with_gene("EGFR") == {"R-HSA-1"}
+
+    index.save(tmp_path / "index.json")
+    loaded = ReactomeIndex.load(tmp_path / "index.json")
+    assert loaded.pathways_with_gene("EGFR") == {"R-HSA-1"}
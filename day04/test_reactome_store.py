@@ -0,0 +1,53 @@
+# test_reactome_store.py
+import pytest
+
+from reactome_store import FolderStore, SQLiteStore, open_store, migrate_folder_store
+
+
+@pytest.fixture(params=["folder", "sqlite"])
+def store(request, tmp_path):
+    backend = open_store({"storage": request.param}, tmp_path)
+    yield backend
+    backend.close()
+
+
+# -----------------------------
+# Common store interface
+# -----------------------------
+
+def test_put_and_get(store):
+    store.put("R-HSA-1", '{"stId": "R-HSA-1"}')
+    assert store.get("R-HSA-1") == '{"stId": "R-HSA-1"}'
+    assert "R-HSA-1" in store
+    assert store.get("R-HSA-2") is None
+    assert "R-HSA-2" not in store
+
+def test_put_overwrites(store):
+    store.put("R-HSA-1", "old")
+    store.put("R-HSA-1", "new")
+    assert store.get("R-HSA-1") == "new"
+    assert len(store) == 1
+
+def test_items_in_id_order(store):
+    store.put_many([("R-HSA-2", "b"), ("R-HSA-1", "a")])
+    assert list(store.items()) == [("R-HSA-1", "a"), ("R-HSA-2", "b")]
+
+def test_unknown_backend(tmp_path):
+    with pytest.raises(ValueError):
+        open_store({"storage": "tape"}, tmp_path)
+
+
+# -----------------------------
+# Migration
+# -----------------------------
+
+def test_migrate_folder_store(tmp_path):
+    folders = FolderStore(tmp_path / "downloads")
+    for i in range(5):
+        folders.put(f"R-HSA-{i}", f'{{"n": {i}}}')
+
+    target = SQLiteStore(tmp_path / "reactome.sqlite")
+    assert migrate_folder_store(folders.root, target, batch_size=2) == 5
+    assert target.get("R-HSA-3") == '{"n": 3}'
+    assert list(target.ids()) == list(folders.ids())
+    target.close()
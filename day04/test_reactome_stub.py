@@ -0,0 +1,70 @@
+# test_reactome_stub.py
+import json
+
+import pytest
+
+from reactome_crawler import crawl_pathway
+from reactome_loadtest import percentile, run_load
+from reactome_service import ReactomeService
+from reactome_stub import start_stub_server
+
+
+@pytest.fixture
+def stub(tmp_path):
+    fixtures = tmp_path / "fixtures"
+    fixtures.mkdir()
+    (fixtures / "R-HSA-1.json").write_text(json.dumps({"stId": "R-HSA-1", "displayName": "Fixture"}))
+    server = start_stub_server(fixtures=fixtures, synthetic=False)
+    yield server
+    server.shutdown()
+
+
+def make_service(server, tmp_path):
+    return ReactomeService({"base_url": server.base_url, "download_folder": tmp_path / "downloads"})
+
+
+# -----------------------------
+# Stub server
+# -----------------------------
+
+def test_stub_serves_fixtures_and_version(stub, tmp_path):
+    service = make_service(stub, tmp_path)
+    assert json.loads(service.fetch_pathway_json("R-HSA-1"))["displayName"] == "Fixture"
+    assert service.fetch_pathway_json("R-HSA-2") is None
+    assert service.download_database_version() == "94"
+
+def test_stub_error_rate_and_payload_size(tmp_path):
+    server = start_stub_server(error_rate=1.0)
+    assert make_service(server, tmp_path).fetch_pathway_json("R-HSA-1") is None
+    server.shutdown()
+
+    server = start_stub_server(payload_size=5000)
+    assert len(make_service(server, tmp_path).fetch_pathway_json("R-HSA-1")) >= 5000
+    server.shutdown()
+
+def test_crawl_synthetic_tree(tmp_path):
+    server = start_stub_server(fanout=5)
+    results = crawl_pathway(make_service(server, tmp_path), "R-HSA-1", workers=4)
+    server.shutdown()
+    assert len(results) == 6
+    assert all(results.values())
+
+
+# -----------------------------
+# Load harness
+# -----------------------------
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+
+def test_run_load_reports_statistics(tmp_path):
+    server = start_stub_server(error_rate=0.5, seed=1)
+    stats = run_load(make_service(server, tmp_path), [f"R-HSA-{i}" for i in range(40)], workers=4)
+    server.shutdown()
+    assert stats["requests"] == 40
+    assert 0 < stats["errors"] < 40
+    assert stats["requests_per_sec"] > 0
+    assert stats["p99_ms"] >= stats["p50_ms"]
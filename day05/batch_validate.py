@@ -0,0 +1,124 @@
+from collections import defaultdict
+from itertools import chain
+
+import numpy as np
+
+from ladder_solver import ladder_distance
+from puzzles import bfs_distances
+from word_ladder import WordLadderEngine
+from word_matrix import encode_words
+
+
+# -----------------------
+# Batch ladder validation
+# -----------------------
+
+STATUS_NAMES = ("ok", "empty", "not-in-dictionary", "not-one-letter")
+OK, EMPTY, NOT_IN_DICTIONARY, NOT_ONE_LETTER = range(len(STATUS_NAMES))
+
+# From this many ladders with the same start word, one full BFS from the start
+# is cheaper than a bidirectional search per (start, end) pair
+BFS_PER_START = 8
+
+
+def _shortest_moves(graph, pairs: list) -> dict:
+    """(start_id, end_id) -> minimum number of moves (-1 if unreachable)."""
+    by_start = defaultdict(set)
+    for start, end in pairs:
+        by_start[start].add(end)
+
+    result = {}
+    for start, ends in by_start.items():
+        if len(ends) >= BFS_PER_START:
+            dist = bfs_distances(graph, start)
+            for end in ends:
+                result[start, end] = int(dist[end])
+        else:
+            for end in ends:
+                moves = ladder_distance(graph, graph.words[start], graph.words[end])
+                result[start, end] = -1 if moves is None else moves
+    return result
+
+
+def _validate_group(engine: WordLadderEngine, ladders: list, length: int) -> dict:
+    """Validate ladders whose start word has `length` letters (all non-empty)."""
+    counts = np.fromiter(map(len, ladders), dtype=np.int64, count=len(ladders))
+    offsets = np.cumsum(counts) - counts
+    flat = list(chain.from_iterable(ladders))
+
+    codes, valid = encode_words(flat, length, ignore_case=True)
+    ids = engine.matrix(length).lookup_codes(codes, valid)
+    in_dictionary = ids >= 0
+
+    # A step is word k-1 -> word k inside the same ladder; the first word of a ladder has no step
+    one_letter = np.ones(len(flat), dtype=bool)
+    one_letter[1:] = (codes[1:] != codes[:-1]).sum(axis=1) == 1
+    one_letter[offsets] = True
+
+    bad = ~in_dictionary | ~one_letter
+    position = np.arange(len(flat)) - np.repeat(offsets, counts)
+    first_bad = np.minimum.reduceat(np.where(bad, position, np.iinfo(np.int64).max), offsets)
+    is_bad = first_bad < counts
+
+    status = np.full(len(ladders), OK, dtype=np.int8)
+    bad_index = offsets[is_bad] + first_bad[is_bad]
+    status[is_bad] = np.where(in_dictionary[bad_index], NOT_ONE_LETTER, NOT_IN_DICTIONARY)
+
+    shortest = np.full(len(ladders), -1, dtype=np.int64)
+    ok = np.flatnonzero(~is_bad)
+    starts, ends = ids[offsets[ok]], ids[offsets[ok] + counts[ok] - 1]
+    pairs = list(zip(starts.tolist(), ends.tolist()))
+    distances = _shortest_moves(engine.graph(length), pairs)
+    shortest[ok] = [distances[pair] for pair in pairs]
+
+    return {
+        "status": status,
+        "first_invalid": np.where(is_bad, first_bad, -1),
+        "moves": counts - 1,
+        "shortest": shortest,
+    }
+
+
+def validate_ladders(engine: WordLadderEngine, ladders) -> dict:
+    """
+    Check many submitted ladders (lists of words) at once.
+
+    Returns a dict of arrays with one entry per ladder:
+      status         index into STATUS_NAMES ("ok", "empty", "not-in-dictionary", "not-one-letter")
+      first_invalid  position of the first word that breaks the ladder, -1 if valid
+      moves          number of moves in the submitted ladder
+      shortest       minimum number of moves between its first and last word (-1 if invalid)
+      optimal        True for valid ladders that are as short as possible
+    The word length of each ladder is the length of its first word; words are
+    compared case-insensitively.
+    """
+    ladders = ladders if isinstance(ladders, list) else list(ladders)
+    n = len(ladders)
+    result = {
+        "status": np.full(n, EMPTY, dtype=np.int8),
+        "first_invalid": np.zeros(n, dtype=np.int64),
+        "moves": np.zeros(n, dtype=np.int64),
+        "shortest": np.full(n, -1, dtype=np.int64),
+    }
+
+    first_lengths = np.array([len(ladder[0]) if ladder else 0 for ladder in ladders], dtype=np.int64)
+    for length in np.unique(first_lengths[first_lengths > 0]).tolist():
+        members = np.flatnonzero(first_lengths == length)
+        group_ladders = ladders if len(members) == n else [ladders[i] for i in members.tolist()]
+        try:
+            engine.graph(length)
+        except ValueError:  # unsupported word length: nothing can be in the dictionary
+            result["status"][members] = NOT_IN_DICTIONARY
+            result["moves"][members] = [len(ladder) - 1 for ladder in group_ladders]
+            continue
+        group = _validate_group(engine, group_ladders, length)
+        for key, values in group.items():
+            result[key][members] = values
+
+    result["optimal"] = (result["status"] == OK) & (result["moves"] == result["shortest"])
+    return result
+
+
+def status_names(result: dict) -> list:
+    """Readable status of every ladder in a validate_ladders result."""
+    return [STATUS_NAMES[code] for code in result["status"].tolist()]
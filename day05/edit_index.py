@@ -0,0 +1,91 @@
+from collections import defaultdict
+
+from word_graph import wildcard_patterns
+
+
+# -----------------------
+# Deletion neighbourhood
+# -----------------------
+
+def deletion_variants(word: str) -> list:
+    """All words with one letter removed, e.g. cart -> art, crt, cat, car (without repeats)."""
+    return list(dict.fromkeys(word[:i] + word[i + 1:] for i in range(len(word))))
+
+
+def one_edit_diff(word1: str, word2: str) -> bool:
+    """True if word2 is word1 with exactly one letter changed, added or removed."""
+    if len(word1) == len(word2):
+        return sum(1 for a, b in zip(word1, word2) if a != b) == 1
+    if abs(len(word1) - len(word2)) != 1:
+        return False
+    shorter, longer = sorted((word1, word2), key=len)
+    return shorter in deletion_variants(longer)
+
+
+# -----------------------
+# Edit index
+# -----------------------
+
+class EditIndex:
+    """
+    Words of mixed lengths indexed for edit-distance-1 moves.
+
+    Every word is stored under each of its deletion variants (cart -> art,
+    crt, cat, car) and each of its wildcard patterns (cart -> _art, c_rt, ...).
+    Then, for a word w:
+      - words one letter longer  = deletions[w]               (cat -> cart, coat, ...)
+      - words one letter shorter = deletion variants of w that are words
+      - words with one letter changed = the wildcard buckets of w, as in WordGraph
+    so all neighbours come from a few dictionary lookups, never a scan.
+    """
+
+    def __init__(self, words):
+        self.words = sorted(set(words))
+        self.ids = {word: i for i, word in enumerate(self.words)}
+        deletions = defaultdict(list)
+        patterns = defaultdict(list)
+        for i, word in enumerate(self.words):
+            for variant in deletion_variants(word):
+                deletions[variant].append(i)
+            for pattern in wildcard_patterns(word):
+                patterns[pattern].append(i)
+        self.deletions = dict(deletions)
+        self.patterns = dict(patterns)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.ids
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def insertions(self, word: str) -> list:
+        """Dictionary words that are `word` with one letter added."""
+        return [self.words[i] for i in self.deletions.get(word, ())]
+
+    def removals(self, word: str) -> list:
+        """Dictionary words that are `word` with one letter removed."""
+        return [variant for variant in deletion_variants(word) if variant in self.ids]
+
+    def substitutions(self, word: str) -> list:
+        """Dictionary words that are `word` with one letter changed."""
+        result = set()
+        for pattern in wildcard_patterns(word):
+            for i in self.patterns.get(pattern, ()):
+                result.add(self.words[i])
+        result.discard(word)
+        return list(result)
+
+    def neighbors(self, word: str) -> list:
+        """All dictionary words one change, insertion or deletion away from `word`."""
+        return sorted(set(self.substitutions(word)) | set(self.insertions(word)) | set(self.removals(word)))
+
+    def is_move(self, current_word: str, new_word: str) -> bool:
+        return new_word in self.ids and one_edit_diff(current_word, new_word)
+
+    def hints(self, word: str, exclude=(), limit=None) -> list:
+        """Valid next words from `word`, skipping words in `exclude` (e.g. the ladder so far)."""
+        result = [w for w in self.neighbors(word) if w not in exclude]
+        return result if limit is None else result[:limit]
@@ -0,0 +1,222 @@
+import argparse
+import asyncio
+import time
+from collections import deque
+
+from word_ladder import MAX_LENGTH, MIN_LENGTH, WordLadderEngine, one_letter_diff
+
+
+# -----------------------
+# Protocol
+# -----------------------
+#
+# One command per line, one reply line per command:
+#   NEW [length] [ladder_length] [max_mistakes]  -> START <word>
+#   MOVE <word> (or just <word>)                  -> OK <ladder...> | INVALID <reason> <mistakes>/<max> | DONE ...
+#   HINT                                          -> HINT <words...>
+#   LADDER                                        -> LADDER <words...> SCORE <n>
+#   STATS                                         -> STATS key=value ...
+#   QUIT                                          -> BYE
+# Every session plays against the same engine; its dictionary and graph are
+# loaded once and only ever read.
+
+DEFAULT_LENGTH = 4
+DEFAULT_LADDER_LENGTH = 8
+DEFAULT_MAX_MISTAKES = 3
+
+
+class Session:
+    """State of one player. __slots__ keeps it to a couple of hundred bytes."""
+
+    __slots__ = ("length", "ladder", "score", "mistakes", "max_mistakes", "ladder_length", "done")
+
+    def __init__(self):
+        self.length = 0
+        self.ladder = []  # holds the engine's own word strings, nothing is copied
+        self.score = 0
+        self.mistakes = 0
+        self.max_mistakes = 0
+        self.ladder_length = 0
+        self.done = True
+
+
+class Metrics:
+    """Session counts and the latencies of the last `window` commands."""
+
+    def __init__(self, window: int = 2048):
+        self.started = time.monotonic()
+        self.sessions_total = 0
+        self.sessions_active = 0
+        self.commands = 0
+        self.latencies = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.commands += 1
+        self.latencies.append(seconds)
+
+    def summary(self) -> dict:
+        # One sort per STATS request, over a bounded window
+        values = sorted(self.latencies) or [0.0]
+
+        def percentile_ms(q):
+            return round(values[min(len(values) - 1, int(q / 100 * len(values)))] * 1000, 3)
+
+        return {
+            "sessions_active": self.sessions_active,
+            "sessions_total": self.sessions_total,
+            "commands": self.commands,
+            "uptime_s": round(time.monotonic() - self.started, 1),
+            "p50_ms": percentile_ms(50),
+            "p99_ms": percentile_ms(99),
+        }
+
+
+# -----------------------
+# Server
+# -----------------------
+
+class LadderServer:
+    """Line-based game server; all sessions share one engine and so one dictionary and graph."""
+
+    def __init__(self, engine: WordLadderEngine, length: int = DEFAULT_LENGTH,
+                 ladder_length: int = DEFAULT_LADDER_LENGTH, max_mistakes: int = DEFAULT_MAX_MISTAKES):
+        self.engine = engine
+        self.defaults = (length, ladder_length, max_mistakes)
+        self.metrics = Metrics()
+
+    def new_game(self, session: Session, args: list) -> str:
+        try:
+            values = [int(a) for a in args] + list(self.defaults[len(args):])
+            length, ladder_length, max_mistakes = values[:3]
+            words = self.engine.words(length)
+        except ValueError as error:
+            return f"ERROR {error}"
+        if len(words) < 10:
+            return f"ERROR not enough {length}-letter words"
+
+        session.length = length
+        session.ladder_length = max(ladder_length, 2)
+        session.max_mistakes = max(max_mistakes, 1)
+        session.ladder = [self.engine.random_start(length, min_component_size=session.ladder_length)]
+        session.score = 0
+        session.mistakes = 0
+        session.done = False
+        return f"START {session.ladder[0]}"
+
+    def move(self, session: Session, word: str) -> str:
+        if session.done:
+            return "ERROR no game running, send NEW"
+        word = word.strip().lower()
+        current = session.ladder[-1]
+        graph = self.engine.graph(session.length)
+
+        if word not in graph.ids:
+            reason = "not-in-dictionary"
+        elif not one_letter_diff(current, word):
+            reason = "not-one-letter"
+        else:
+            session.ladder.append(graph.words[graph.ids[word]])
+            session.score += 1
+            if len(session.ladder) == session.ladder_length:
+                session.done = True
+                return f"DONE completed {' '.join(session.ladder)} SCORE {session.score}"
+            return f"OK {' '.join(session.ladder)}"
+
+        session.mistakes += 1
+        if session.mistakes == session.max_mistakes:
+            session.done = True
+            return f"DONE out-of-attempts {' '.join(session.ladder)} SCORE {session.score}"
+        return f"INVALID {reason} {session.mistakes}/{session.max_mistakes}"
+
+    def handle_line(self, session: Session, line: str) -> str:
+        """Run one command line for a session and return the reply line."""
+        parts = line.split()
+        if not parts:
+            return "ERROR empty command"
+        command, args = parts[0].upper(), parts[1:]
+
+        if command == "NEW":
+            return self.new_game(session, args)
+        if command == "MOVE":
+            return self.move(session, args[0]) if args else "ERROR MOVE needs a word"
+        if command == "HINT":
+            if session.done:
+                return "ERROR no game running, send NEW"
+            hints = self.engine.graph(session.length).hints(session.ladder[-1], exclude=session.ladder, limit=10)
+            return f"HINT {' '.join(hints)}".rstrip()
+        if command == "LADDER":
+            return f"LADDER {' '.join(session.ladder)} SCORE {session.score}"
+        if command == "STATS":
+            return "STATS " + " ".join(f"{k}={v}" for k, v in self.metrics.summary().items())
+        if command == "QUIT":
+            return "BYE"
+        if len(parts) == 1 and parts[0].isalpha():
+            return self.move(session, parts[0])
+        return f"ERROR unknown command {parts[0]}"
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = Session()
+        self.metrics.sessions_total += 1
+        self.metrics.sessions_active += 1
+        try:
+            writer.write(b"WELCOME word ladder, send NEW to start\n")
+            await writer.drain()
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                started = time.perf_counter()
+                reply = self.handle_line(session, raw.decode("utf-8", "replace"))
+                self.metrics.record(time.perf_counter() - started)
+                writer.write(reply.encode("utf-8") + b"\n")
+                await writer.drain()
+                if reply == "BYE":
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self.metrics.sessions_active -= 1
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Start listening; port 0 picks a free port (see server.sockets[0].getsockname())."""
+        return await asyncio.start_server(self.handle_client, host, port, backlog=1024)
+
+
+def preload(engine: WordLadderEngine, lengths=range(MIN_LENGTH, MAX_LENGTH + 1)):
+    """
+    Build the graph and components of every length before serving. NEW runs
+    on the event loop, so building them there would stall every session.
+    """
+    for length in lengths:
+        engine.graph(length)
+        engine.components(length)
+
+
+async def serve(engine: WordLadderEngine, host: str, port: int, **defaults):
+    server = await LadderServer(engine, **defaults).start(host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Word ladder server listening on {address[0]}:{address[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-player word ladder server (line-based TCP).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dictionary", nargs="+", default=None, help="word list file(s)")
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH, help="default word length")
+    args = parser.parse_args()
+
+    engine = WordLadderEngine(args.dictionary) if args.dictionary else WordLadderEngine()
+    # Load every length up front so that no NEW command blocks the other players
+    preload(engine)
+    try:
+        asyncio.run(serve(engine, args.host, args.port, length=args.length))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
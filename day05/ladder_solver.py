@@ -0,0 +1,117 @@
+from word_graph import WordGraph
+
+
+# -----------------------
+# Bidirectional BFS
+# -----------------------
+
+def _bidirectional_search(graph: WordGraph, start_id: int, end_id: int):
+    """
+    Grow BFS levels from both ends, always expanding the smaller frontier.
+    Returns (dist_from_start, dist_from_end, meeting_ids, moves) or None if
+    the words are not connected. Every shortest ladder passes through exactly
+    one of the meeting ids.
+    """
+    dist = ({start_id: 0}, {end_id: 0})
+    frontier = ([start_id], [end_id])
+    if start_id == end_id:
+        return dist[0], dist[1], [start_id], 0
+
+    while frontier[0] and frontier[1]:
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        mine, other = dist[side], dist[1 - side]
+        level = mine[frontier[side][0]] + 1
+
+        next_frontier = []
+        for word_id in frontier[side]:
+            for neighbor in graph.neighbor_ids(word_id):
+                if neighbor not in mine:
+                    mine[neighbor] = level
+                    next_frontier.append(neighbor)
+
+        meets = [n for n in next_frontier if n in other]
+        if meets:
+            moves = min(level + other[n] for n in meets)
+            meets = [n for n in meets if level + other[n] == moves]
+            return dist[0], dist[1], meets, moves
+
+        frontier = (next_frontier, frontier[1]) if side == 0 else (frontier[0], next_frontier)
+
+    return None
+
+
+def _paths_to(graph: WordGraph, word_id: int, dist: dict):
+    """Yield all shortest id paths from the BFS root (distance 0) to word_id."""
+    if dist[word_id] == 0:
+        yield [word_id]
+        return
+    for previous in graph.neighbor_ids(word_id):
+        if dist.get(previous) == dist[word_id] - 1:
+            for path in _paths_to(graph, previous, dist):
+                path.append(word_id)
+                yield path
+
+
+def _ids(graph: WordGraph, start: str, end: str):
+    if start not in graph or end not in graph or len(start) != len(end):
+        return None
+    return graph.ids[start], graph.ids[end]
+
+
+# -----------------------
+# Public solver API
+# -----------------------
+
+def shortest_ladder(graph: WordGraph, start: str, end: str):
+    """
+    Return one shortest ladder [start, ..., end] as a list of words,
+    or None if no ladder exists.
+    """
+    ids = _ids(graph, start, end)
+    if ids is None:
+        return None
+    found = _bidirectional_search(graph, *ids)
+    if found is None:
+        return None
+
+    dist_start, dist_end, meets, _ = found
+    head = next(_paths_to(graph, meets[0], dist_start))
+    tail = next(_paths_to(graph, meets[0], dist_end))
+    return [graph.words[i] for i in head + tail[-2::-1]]
+
+
+def all_shortest_ladders(graph: WordGraph, start: str, end: str, limit: int = 100) -> list:
+    """Return up to `limit` different shortest ladders (empty list if none exists)."""
+    ids = _ids(graph, start, end)
+    if ids is None:
+        return []
+    found = _bidirectional_search(graph, *ids)
+    if found is None:
+        return []
+
+    dist_start, dist_end, meets, _ = found
+    ladders = []
+    for meet in meets:
+        for head in _paths_to(graph, meet, dist_start):
+            for tail in _paths_to(graph, meet, dist_end):
+                ladders.append([graph.words[i] for i in head + tail[-2::-1]])
+                if len(ladders) >= limit:
+                    return ladders
+    return ladders
+
+
+def ladder_distance(graph: WordGraph, start: str, end: str):
+    """Minimum number of moves from start to end, or None if impossible."""
+    ids = _ids(graph, start, end)
+    if ids is None:
+        return None
+    found = _bidirectional_search(graph, *ids)
+    return None if found is None else found[3]
+
+
+def next_hint(graph: WordGraph, current_word: str, target: str):
+    """The next word on a shortest ladder towards target (None if unreachable or already there)."""
+    ladder = shortest_ladder(graph, current_word, target)
+    if ladder is None or len(ladder) < 2:
+        return None
+    return ladder[1]
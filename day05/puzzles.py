@@ -0,0 +1,142 @@
+import numpy as np
+
+from word_graph import WordGraph
+
+
+# -----------------------
+# Graph precomputation
+# -----------------------
+
+def _expand(indptr, indices, frontier):
+    """All neighbours of the words in `frontier` (with repeats), in one gather."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    # Position k of the output reads indices[starts[row] + (k - first output position of row)]
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+    return indices[offsets]
+
+
+def _bfs(indptr, indices, dist, source_id):
+    """Level-by-level BFS on CSR arrays, writing levels into `dist` (-1 = unvisited)."""
+    dist[source_id] = 0
+    frontier = np.array([source_id], dtype=np.int64)
+    level = 0
+    visited = 1
+    while frontier.size:
+        level += 1
+        neighbors = _expand(indptr, indices, frontier)
+        neighbors = neighbors[dist[neighbors] == -1]
+        # Writing the level first de-duplicates without sorting
+        dist[neighbors] = level
+        frontier = np.flatnonzero(dist == level)
+        visited += frontier.size
+    return visited
+
+
+def label_components(graph: WordGraph):
+    """
+    Label the connected components of the word graph.
+    Returns (labels, sizes): labels[word_id] is the component number and
+    sizes[label] the number of words in that component.
+    """
+    indptr, indices = graph.to_csr()
+    labels = np.full(len(graph), -1, dtype=np.int32)
+    dist = np.full(len(graph), -1, dtype=np.int32)
+    sizes = []
+    for root in range(len(graph)):
+        if labels[root] != -1:
+            continue
+        if indptr[root] == indptr[root + 1]:  # isolated word, no BFS needed
+            labels[root] = len(sizes)
+            sizes.append(1)
+            continue
+        _bfs(indptr, indices, dist, root)
+        reached = dist >= 0
+        labels[reached] = len(sizes)
+        sizes.append(int(reached.sum()))
+        dist[reached] = -1
+    return labels, np.array(sizes, dtype=np.int32)
+
+
+def bfs_distances(graph: WordGraph, source_id: int):
+    """Number of moves from source_id to every word (-1 if unreachable)."""
+    indptr, indices = graph.to_csr()
+    dist = np.full(len(graph), -1, dtype=np.int32)
+    _bfs(indptr, indices, dist, source_id)
+    return dist
+
+
+# -----------------------
+# Puzzle generator
+# -----------------------
+
+class PuzzleGenerator:
+    """
+    Generates (start, target) pairs whose shortest ladder is known.
+
+    At construction a sample of source words is drawn from the components
+    that have at least two words, and a BFS from each source stores every
+    reachable target sorted by distance. A puzzle is then a uniform pick among
+    all stored (source, target) pairs whose distance is in the requested range,
+    which is a couple of array lookups - no search at generation time.
+    """
+
+    def __init__(self, graph: WordGraph, samples: int = 200, seed=None):
+        self.graph = graph
+        self.rng = np.random.default_rng(seed)
+        self.labels, self.sizes = label_components(graph)
+
+        candidates = np.flatnonzero(self.sizes[self.labels] >= 2) if len(graph) else np.array([], dtype=int)
+        count = min(samples, len(candidates))
+        self.sources = self.rng.choice(candidates, size=count, replace=False) if count else candidates
+
+        self.max_distance = 0
+        self.targets = []   # per source: target ids sorted by distance
+        distances = []
+        for source in self.sources:
+            dist = bfs_distances(graph, int(source))
+            order = np.argsort(dist, kind="stable")
+            order = order[dist[order] > 0]
+            self.targets.append(order)
+            distances.append(dist[order])
+            if len(order):
+                self.max_distance = max(self.max_distance, int(dist[order[-1]]))
+
+        # first[s, d] = position in targets[s] of the first target at distance >= d
+        self.first = np.zeros((len(self.sources), self.max_distance + 2), dtype=np.int64)
+        for s, dist in enumerate(distances):
+            self.first[s] = np.searchsorted(dist, np.arange(self.max_distance + 2))
+
+    def generate_many(self, count: int, min_moves: int, max_moves: int) -> list:
+        """
+        Return `count` puzzles as (start, target, moves) with
+        min_moves <= moves <= max_moves. Raises ValueError if no pair fits.
+        """
+        low = min(max(min_moves, 1), self.max_distance + 1)
+        high = min(max_moves, self.max_distance) + 1
+        if len(self.sources) == 0 or high <= low:
+            raise ValueError(f"No puzzles with {min_moves}-{max_moves} moves in this dictionary.")
+        per_source = self.first[:, high] - self.first[:, low]
+        total = per_source.sum()
+        if total == 0:
+            raise ValueError(f"No puzzles with {min_moves}-{max_moves} moves in this dictionary.")
+
+        # Uniform over all stored pairs: pick a global pair index, then find its source
+        picks = self.rng.integers(total, size=count)
+        ends = np.cumsum(per_source)
+        source_rows = np.searchsorted(ends, picks, side="right")
+        offsets = picks - (ends[source_rows] - per_source[source_rows]) + self.first[source_rows, low]
+
+        words = self.graph.words
+        puzzles = []
+        for row, offset in zip(source_rows.tolist(), offsets.tolist()):
+            target = int(self.targets[row][offset])
+            start = int(self.sources[row])
+            moves = int(np.searchsorted(self.first[row], offset, side="right") - 1)
+            puzzles.append((words[start], words[target], moves))
+        return puzzles
+
+    def generate(self, min_moves: int, max_moves: int):
+        """One puzzle (start, target, moves)."""
+        return self.generate_many(1, min_moves, max_moves)[0]
@@ -0,0 +1,68 @@
+import pytest
+from batch_validate import validate_ladders, status_names
+from word_ladder import WordLadderEngine, play_ladder_round
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # Same small mock word list as test-word-ladder.py, plus a few 4-letter words
+    path = tmp_path / "words.txt"
+    words = ["cat", "cot", "dot", "dog", "dig", "big", "bag", "bat",
+             "cold", "cord", "card", "ward", "warm", "word"]
+    path.write_text("\n".join(words), encoding="utf-8")
+    return WordLadderEngine(str(path))
+
+
+# -------------------------
+# Tests for validate_ladders
+# -------------------------
+
+def test_statuses_and_first_invalid(engine):
+    ladders = [
+        ["cat", "cot", "dot", "dog"],
+        ["cat", "cot", "cab", "cat"],
+        ["cat", "dog"],
+        [],
+        ["xyz", "cat"],
+        ["cold", "cord", "card", "ward", "warm"],
+        ["cat", "cat"],
+    ]
+    result = validate_ladders(engine, ladders)
+    assert status_names(result) == ["ok", "not-in-dictionary", "not-one-letter", "empty",
+                                    "not-in-dictionary", "ok", "not-one-letter"]
+    assert result["first_invalid"].tolist() == [-1, 2, 1, 0, 0, -1, 1]
+    assert result["moves"].tolist() == [3, 3, 1, 0, 1, 4, 1]
+
+
+def test_optimality(engine):
+    ladders = [["cat", "cot", "dot"], ["cat", "bat", "cat", "cot", "dot"], ["cold", "word"]]
+    result = validate_ladders(engine, ladders)
+    assert result["shortest"].tolist() == [2, 2, -1]
+    assert result["optimal"].tolist() == [True, False, False]
+
+
+def test_matches_play_ladder_round(engine):
+    words = engine.words(3)
+    ladders = [["cat", "bat", "bag", "big"], ["cat", "bag"], ["Cat", "cot"], ["dig", "dog", "dot", "cot", "cat"]]
+    expected = [all(play_ladder_round(a.lower(), b.lower(), words)[0] == "correct" for a, b in zip(ladder, ladder[1:]))
+                for ladder in ladders]
+    assert (validate_ladders(engine, ladders)["status"] == 0).tolist() == expected
+
+
+def test_unsupported_length(engine):
+    result = validate_ladders(engine, [["abcdefghij", "abcdefghik"]])
+    assert status_names(result) == ["not-in-dictionary"]
+    assert not result["optimal"][0]
+
+
+def test_bfs_and_pairwise_distances_agree(engine, monkeypatch):
+    import batch_validate
+    from ladder_solver import shortest_ladder
+    graph = engine.graph(3)
+    ladders = [shortest_ladder(graph, "cat", end) for end in ["cot", "bat", "dot", "dog", "big", "bag", "dig"]]
+    monkeypatch.setattr(batch_validate, "BFS_PER_START", 100)
+    pairwise = validate_ladders(engine, ladders)
+    monkeypatch.setattr(batch_validate, "BFS_PER_START", 1)
+    with_bfs = validate_ladders(engine, ladders)
+    assert with_bfs["shortest"].tolist() == pairwise["shortest"].tolist() == [1, 1, 2, 3, 3, 2, 4]
+    assert with_bfs["optimal"].all()
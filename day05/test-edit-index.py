@@ -0,0 +1,86 @@
+import os
+
+import pytest
+from edit_index import EditIndex, deletion_variants, one_edit_diff
+from word_ladder import WordLadderEngine
+
+word_list = {"cat", "cot", "bat", "at", "cart", "coat", "scat", "car", "card", "cold"}
+index = EditIndex(word_list)
+
+
+# -------------------------
+# Tests for one_edit_diff / deletion_variants
+# -------------------------
+
+def test_deletion_variants():
+    assert deletion_variants("cart") == ["art", "crt", "cat", "car"]
+    assert deletion_variants("book") == ["ook", "bok", "boo"]
+
+
+def test_one_edit_diff():
+    assert one_edit_diff("cat", "cot")
+    assert one_edit_diff("cat", "cart")
+    assert one_edit_diff("cart", "cat")
+    assert one_edit_diff("cat", "scat")
+    assert not one_edit_diff("cat", "cat")
+    assert not one_edit_diff("cat", "cold")
+    assert not one_edit_diff("cat", "act")
+
+
+# -------------------------
+# Tests for EditIndex
+# -------------------------
+
+def test_neighbors():
+    assert index.insertions("cat") == ["cart", "coat", "scat"]
+    assert index.removals("cart") == ["cat", "car"]
+    assert sorted(index.substitutions("cat")) == ["bat", "car", "cot"]
+    assert index.neighbors("cat") == ["at", "bat", "car", "cart", "coat", "cot", "scat"]
+    assert index.neighbors("car") == ["card", "cart", "cat"]
+
+
+def test_neighbors_match_brute_force():
+    for word in list(word_list) + ["cab", "ca"]:
+        expected = sorted(w for w in word_list if one_edit_diff(word, w))
+        assert index.neighbors(word) == expected
+
+
+def test_is_move_and_hints():
+    assert index.is_move("cat", "cart")
+    assert not index.is_move("cat", "cast")
+    assert index.hints("cat", exclude=["cart"], limit=2) == ["at", "bat"]
+
+
+# -------------------------
+# Tests for the engine rules option
+# -------------------------
+
+@pytest.fixture
+def mixed_dictionary(tmp_path):
+    path = tmp_path / "mixed.txt"
+    path.write_text("\n".join(sorted(word_list)), encoding="utf-8")
+    return str(path)
+
+
+def test_engine_edit_rules(mixed_dictionary):
+    engine = WordLadderEngine(mixed_dictionary, rules="edit")
+    assert engine.play_round("cat", "cart") == ("correct", "cart")
+    assert engine.play_round("cart", "car") == ("correct", "car")
+    assert engine.play_round("cat", "cold") == ("invalid", "cat")
+    assert "cart" in engine.hints("cat")
+
+
+def test_engine_edit_rules_build_no_graphs(mixed_dictionary):
+    engine = WordLadderEngine(mixed_dictionary, rules="edit")
+    assert "cart" in engine.edit_index()
+    # The words are read from the list directly: no graph (or graph cache) per length
+    assert engine.loaded_lengths() == []
+    assert not any(p.endswith(".cache") for p in os.listdir(os.path.dirname(mixed_dictionary)))
+
+
+def test_engine_substitute_rules_unchanged(mixed_dictionary):
+    engine = WordLadderEngine(mixed_dictionary)
+    assert engine.play_round("cat", "cart") == ("invalid", "cat")
+    assert engine.play_round("cat", "cot") == ("correct", "cot")
+    with pytest.raises(ValueError):
+        WordLadderEngine(mixed_dictionary, rules="anagram")
@@ -0,0 +1,88 @@
+import asyncio
+import sys
+
+import pytest
+from ladder_server import LadderServer, Session, preload
+from word_ladder import MAX_LENGTH, MIN_LENGTH, WordLadderEngine
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    path = tmp_path / "words.txt"
+    words = ["cat", "cot", "dot", "dog", "dig", "big", "bag", "bat", "bit", "bot", "cog"]
+    path.write_text("\n".join(words), encoding="utf-8")
+    engine = WordLadderEngine(str(path))
+    monkeypatch.setattr(engine, "random_start", lambda length, **kwargs: "cat")
+    return LadderServer(engine, length=3, ladder_length=3, max_mistakes=2)
+
+
+# -------------------------
+# Tests for the command handler
+# -------------------------
+
+def test_session_is_small():
+    session = Session()
+    assert not hasattr(session, "__dict__")
+    assert sys.getsizeof(session) + sys.getsizeof(session.ladder) < 300
+
+
+def test_full_game(server):
+    session = Session()
+    assert server.handle_line(session, "NEW") == "START cat"
+    assert server.handle_line(session, "HINT") == "HINT bat cot"
+    assert server.handle_line(session, "MOVE cot") == "OK cat cot"
+    assert server.handle_line(session, "dot") == "DONE completed cat cot dot SCORE 2"
+    assert server.handle_line(session, "MOVE dog").startswith("ERROR")
+
+
+def test_mistakes_end_the_game(server):
+    session = Session()
+    server.handle_line(session, "NEW")
+    assert server.handle_line(session, "MOVE zzz") == "INVALID not-in-dictionary 1/2"
+    assert server.handle_line(session, "MOVE dog") == "DONE out-of-attempts cat SCORE 0"
+
+
+def test_bad_commands(server):
+    session = Session()
+    assert server.handle_line(session, "NEW 9").startswith("ERROR")
+    assert server.handle_line(session, "JUMP 3").startswith("ERROR")
+    assert server.handle_line(session, "   ") == "ERROR empty command"
+
+
+# -------------------------
+# Tests over TCP
+# -------------------------
+
+
+def test_preload_builds_every_length(server, monkeypatch):
+    preload(server.engine)
+    assert server.engine.loaded_lengths() == list(range(MIN_LENGTH, MAX_LENGTH + 1))
+    # Nothing is left to build when a game of another length starts
+    monkeypatch.setattr("word_ladder.label_components", lambda graph: pytest.fail("components built on NEW"))
+    assert server.handle_line(Session(), "NEW 5").startswith("ERROR not enough")
+    assert server.handle_line(Session(), "NEW 3") == "START cat"
+
+def test_concurrent_sessions(server):
+    async def play(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        replies = []
+        for command in ("NEW", "MOVE bat", "QUIT"):
+            writer.write(command.encode() + b"\n")
+            replies.append((await reader.readline()).decode().strip())
+        writer.close()
+        return replies
+
+    async def run():
+        tcp = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        async with tcp:
+            results = await asyncio.gather(*(play(port) for _ in range(20)))
+            await asyncio.sleep(0.05)
+        return results
+
+    results = asyncio.run(run())
+    assert all(r == ["START cat", "OK cat bat", "BYE"] for r in results)
+    stats = server.handle_line(Session(), "STATS")
+    assert "sessions_total=20" in stats
+    assert "sessions_active=0" in stats
@@ -0,0 +1,69 @@
+import pytest
+from word_graph import WordGraph
+from ladder_solver import shortest_ladder, all_shortest_ladders, ladder_distance, next_hint
+from word_ladder_L1 import one_letter_diff
+
+# Same small mock word list as test-word-ladder.py, plus an isolated word
+word_list = {"cat", "cot", "dot", "dog", "dig", "big", "bag", "bat", "zzz"}
+graph = WordGraph(word_list)
+
+
+def is_ladder(ladder):
+    return all(one_letter_diff(a, b) for a, b in zip(ladder, ladder[1:]))
+
+
+# -------------------------
+# Tests for shortest_ladder
+# -------------------------
+
+def test_shortest_ladder():
+    ladder = shortest_ladder(graph, "cat", "dog")
+    assert ladder == ["cat", "cot", "dot", "dog"]
+
+
+def test_shortest_ladder_same_word():
+    assert shortest_ladder(graph, "cat", "cat") == ["cat"]
+
+
+def test_shortest_ladder_impossible():
+    assert shortest_ladder(graph, "cat", "zzz") is None
+    assert shortest_ladder(graph, "cat", "xyz") is None
+    assert shortest_ladder(graph, "cat", "cart") is None
+
+
+# -------------------------
+# Tests for all_shortest_ladders
+# -------------------------
+
+def test_all_shortest_ladders():
+    ladders = all_shortest_ladders(graph, "cat", "big")
+    assert sorted(ladders) == [["cat", "bat", "bag", "big"]]
+
+    square = WordGraph({"aa", "ab", "ba", "bb"})
+    assert sorted(all_shortest_ladders(square, "aa", "bb")) == [["aa", "ab", "bb"], ["aa", "ba", "bb"]]
+    assert len(all_shortest_ladders(square, "aa", "bb", limit=1)) == 1
+
+
+# -------------------------
+# Tests against the real 4-letter dictionary
+# -------------------------
+
+def test_real_dictionary_ladders_are_valid_and_shortest():
+    from word_ladder_L2 import load_word_list
+    big = WordGraph(load_word_list("wordlist_4Letter.txt"))
+    ladders = all_shortest_ladders(big, "cold", "warm", limit=20)
+    assert ladders
+    assert all(is_ladder(l) and l[0] == "cold" and l[-1] == "warm" for l in ladders)
+    assert len({len(l) for l in ladders}) == 1
+    assert len(ladders[0]) - 1 == ladder_distance(big, "cold", "warm")
+    assert len(shortest_ladder(big, "cold", "warm")) == len(ladders[0])
+
+
+# -------------------------
+# Tests for hints
+# -------------------------
+
+def test_next_hint():
+    assert next_hint(graph, "cat", "dog") == "cot"
+    assert next_hint(graph, "dog", "dog") is None
+    assert next_hint(graph, "cat", "zzz") is None
@@ -0,0 +1,54 @@
+import pytest
+from word_graph import WordGraph
+from ladder_solver import ladder_distance
+from puzzles import PuzzleGenerator, bfs_distances, label_components
+
+# Same small mock word list as test-word-ladder.py, plus an isolated word and a pair
+word_list = {"cat", "cot", "dot", "dog", "dig", "big", "bag", "bat", "zzz", "qua", "quo"}
+graph = WordGraph(word_list)
+
+
+# -------------------------
+# Tests for label_components / bfs_distances
+# -------------------------
+
+def test_label_components():
+    labels, sizes = label_components(graph)
+    size_of = {word: sizes[labels[graph.ids[word]]] for word in word_list}
+    assert size_of["cat"] == 8
+    assert size_of["qua"] == size_of["quo"] == 2
+    assert size_of["zzz"] == 1
+    assert labels[graph.ids["cat"]] == labels[graph.ids["big"]]
+
+
+def test_bfs_distances():
+    dist = bfs_distances(graph, graph.ids["cat"])
+    assert dist[graph.ids["dog"]] == 3
+    assert dist[graph.ids["cat"]] == 0
+    assert dist[graph.ids["zzz"]] == -1
+
+
+# -------------------------
+# Tests for PuzzleGenerator
+# -------------------------
+
+def test_puzzles_have_requested_optimal_length():
+    generator = PuzzleGenerator(graph, samples=20, seed=0)
+    for start, target, moves in generator.generate_many(200, 2, 3):
+        assert 2 <= moves <= 3
+        assert ladder_distance(graph, start, target) == moves
+
+
+def test_puzzles_real_dictionary():
+    from word_ladder import load_word_list
+    big = WordGraph(load_word_list("wordlist_4Letter.txt", 4))
+    generator = PuzzleGenerator(big, samples=30, seed=1)
+    puzzles = generator.generate_many(100, 5, 6)
+    assert len(puzzles) == 100
+    assert all(ladder_distance(big, s, t) == m for s, t, m in puzzles)
+
+
+def test_impossible_range():
+    generator = PuzzleGenerator(graph, samples=20, seed=0)
+    with pytest.raises(ValueError):
+        generator.generate(10, 20)
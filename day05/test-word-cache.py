@@ -0,0 +1,48 @@
+import os
+import pytest
+from word_cache import load_word_graph, cache_dir_for
+from word_graph import WordGraph
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("﻿CAT\ncot\ndot\ndog\nzz\ncart\n", encoding="utf-8")
+    return path
+
+
+# -------------------------
+# Tests for load_word_graph
+# -------------------------
+
+def test_first_load_writes_cache(wordlist):
+    graph = load_word_graph(wordlist, 3)
+    assert graph.words == ["cat", "cot", "dog", "dot"]
+    assert (cache_dir_for(wordlist) / "meta-3.json").exists()
+
+
+def test_cached_graph_matches_fresh_graph(wordlist):
+    load_word_graph(wordlist, 3)
+    cached = load_word_graph(wordlist, 3)
+    fresh = WordGraph(["cat", "cot", "dot", "dog"])
+    assert cached.words == fresh.words
+    for word in fresh.words:
+        assert cached.neighbors(word) == fresh.neighbors(word)
+    assert cached.neighbors("cab") == ["cat"]  # not in dictionary: uses buckets
+
+
+def test_stale_cache_is_rebuilt(wordlist):
+    load_word_graph(wordlist, 3)
+    wordlist.write_text("cat\nbat\n", encoding="utf-8")
+    os.utime(wordlist, ns=(1, 1))  # make sure the stamp differs even on coarse clocks
+    assert load_word_graph(wordlist, 3).words == ["bat", "cat"]
+
+
+def test_touched_but_unchanged_file_uses_cache(wordlist):
+    load_word_graph(wordlist, 3)
+    os.utime(wordlist, ns=(1, 1))
+    assert load_word_graph(wordlist, 3).words == ["cat", "cot", "dog", "dot"]
+
+
+def test_missing_file(tmp_path):
+    assert len(load_word_graph(tmp_path / "missing.txt", 3)) == 0
@@ -0,0 +1,56 @@
+import pytest
+from word_graph import WordGraph, wildcard_patterns
+from word_ladder_L1 import one_letter_diff
+
+# Same small mock word list as test-word-ladder.py
+word_list = {"cat", "cot", "dot", "dog", "dig", "big", "bag", "bat"}
+
+
+# -------------------------
+# Tests for wildcard_patterns
+# -------------------------
+
+def test_wildcard_patterns():
+    assert wildcard_patterns("cold") == ["_old", "c_ld", "co_d", "col_"]
+
+
+# -------------------------
+# Tests for WordGraph
+# -------------------------
+
+def test_neighbors():
+    graph = WordGraph(word_list)
+    assert graph.neighbors("cat") == ["bat", "cot"]
+    assert graph.neighbors("dig") == ["big", "dog"]
+
+
+def test_neighbors_of_unknown_word():
+    graph = WordGraph(word_list)
+    assert graph.neighbors("cab") == ["cat"]
+
+
+def test_neighbor_ids_match_one_letter_diff():
+    graph = WordGraph(word_list)
+    for i, word in enumerate(graph.words):
+        expected = {w for w in word_list if one_letter_diff(word, w)}
+        assert {graph.words[j] for j in graph.neighbor_ids(i)} == expected
+
+
+def test_is_move():
+    graph = WordGraph(word_list)
+    assert graph.is_move("cat", "bat") is True
+    assert graph.is_move("cat", "dog") is False   # 3 letters changed
+    assert graph.is_move("cat", "cab") is False   # not in dictionary
+    assert graph.is_move("cat", "cat") is False   # no change
+
+
+def test_hints_exclude_ladder():
+    graph = WordGraph(word_list)
+    assert graph.hints("cat", exclude=["cat", "bat"]) == ["cot"]
+    assert graph.hints("cat", limit=1) == ["bat"]
+
+
+def test_mixed_lengths_are_not_neighbors():
+    graph = WordGraph({"cat", "cart", "care"})
+    assert graph.neighbors("cart") == ["care"]
+    assert graph.neighbors("cat") == []
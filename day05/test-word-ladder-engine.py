@@ -0,0 +1,95 @@
+import pytest
+from word_ladder import WordLadderEngine, ask_number, play_game
+
+
+@pytest.fixture
+def mixed_dictionary(tmp_path):
+    path = tmp_path / "mixed.txt"
+    words = ["cat", "cot", "dot", "dog", "dig", "big", "bag", "bat", "bit", "bot", "cog",
+             "cold", "cord", "card", "ward", "warm", "word", "wold", "bold", "bald", "ball", "call"]
+    path.write_text("\n".join(words), encoding="utf-8")
+    return str(path)
+
+
+# -------------------------
+# Tests for WordLadderEngine
+# -------------------------
+
+def test_lengths_are_loaded_lazily(mixed_dictionary):
+    engine = WordLadderEngine(mixed_dictionary)
+    assert engine.loaded_lengths() == []
+    assert "cold" in engine.words(4)
+    assert engine.loaded_lengths() == [4]
+    assert "cat" in engine.words(3)
+    assert engine.loaded_lengths() == [3, 4]
+
+
+def test_play_round_any_length(mixed_dictionary):
+    engine = WordLadderEngine(mixed_dictionary)
+    assert engine.play_round("cat", "bat") == ("correct", "bat")
+    assert engine.play_round("cold", "cord") == ("correct", "cord")
+    assert engine.play_round("cold", "warm") == ("invalid", "cold")
+
+
+def test_several_files_are_merged(tmp_path):
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_text("cat\ncot\n", encoding="utf-8")
+    second.write_text("cut\ncart\n", encoding="utf-8")
+    engine = WordLadderEngine([str(first), str(second)])
+    assert engine.words(3) == {"cat", "cot", "cut"}
+    assert engine.words(4) == {"cart"}
+
+
+def test_random_start_avoids_isolated_words(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("cat\ncot\ndot\nzzz\nqua\n", encoding="utf-8")
+    engine = WordLadderEngine(str(path))
+    starts = {engine.random_start(3, min_component_size=3) for _ in range(50)}
+    assert starts <= {"cat", "cot", "dot"}
+
+
+def test_length_out_of_range(mixed_dictionary):
+    with pytest.raises(ValueError):
+        WordLadderEngine(mixed_dictionary).graph(9)
+
+
+# -------------------------
+# Tests for play_game
+# -------------------------
+
+def test_play_game_scripted(mixed_dictionary, monkeypatch):
+    engine = WordLadderEngine(mixed_dictionary)
+    monkeypatch.setattr(engine, "random_start", lambda length, **kwargs: "cold")
+    moves = iter(["?", "cord", "xxxx", "card", "ward"])
+    ladder, score = play_game(engine, 4, max_mistakes=2, ladder_length=4, input_fn=lambda prompt: next(moves))
+    assert ladder == ["cold", "cord", "card", "ward"]
+    assert score == 3
+
+
+def test_play_game_too_many_mistakes(mixed_dictionary, monkeypatch):
+    engine = WordLadderEngine(mixed_dictionary)
+    monkeypatch.setattr(engine, "random_start", lambda length, **kwargs: "cat")
+    moves = iter(["dog", "zzz"])
+    ladder, score = play_game(engine, 3, max_mistakes=2, ladder_length=5, input_fn=lambda prompt: next(moves))
+    assert ladder == ["cat"]
+    assert score == 0
+
+
+def test_play_game_limits(mixed_dictionary, monkeypatch):
+    engine = WordLadderEngine(mixed_dictionary)
+    monkeypatch.setattr(engine, "random_start", lambda length, **kwargs: "cat")
+    # max_mistakes=0 counts as 1: the first mistake ends the game
+    moves = iter(["zzz", "cot"])
+    assert play_game(engine, 3, max_mistakes=0, ladder_length=5, input_fn=lambda prompt: next(moves)) == (["cat"], 0)
+    # ladder_length=1 counts as 2: one good move completes the ladder
+    moves = iter(["cot", "dot"])
+    assert play_game(engine, 3, max_mistakes=2, ladder_length=1, input_fn=lambda prompt: next(moves)) == (["cat", "cot"], 1)
+    assert play_game(engine, 9, max_mistakes=2, ladder_length=4, input_fn=lambda prompt: "cat") == ([], 0)
+    assert engine.loaded_lengths() == [3]
+
+
+def test_ask_number_reprompts():
+    answers = iter(["abc", "9", "-1", "", "5"])
+    assert ask_number("Word length: ", 3, 8, input_fn=lambda prompt: next(answers)) == 5
+    answers = iter(["0", "12"])
+    assert ask_number("Ladder length: ", 2, input_fn=lambda prompt: next(answers)) == 12
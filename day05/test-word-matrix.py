@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from word_ladder import play_ladder_round
+from word_matrix import WordMatrix, encode_words, pack_codes
+
+# Same small mock word list as test-word-ladder.py
+word_list = {"cat", "cot", "dot", "dog", "dig", "big", "bag", "bat"}
+matrix = WordMatrix(word_list)
+
+
+# -------------------------
+# Tests for encode_words / pack_codes
+# -------------------------
+
+def test_encode_words_marks_invalid_rows():
+    codes, valid = encode_words(["cat", "ca", "Cat", "c4t", "cät", "zzz"], 3)
+    assert valid.tolist() == [True, False, False, False, False, True]
+    assert codes[0].tolist() == [2, 0, 19]
+    assert codes[5].tolist() == [25, 25, 25]
+    assert codes[1].tolist() == [0, 0, 0]
+
+
+def test_packed_order_is_alphabetical():
+    words = ["abc", "abd", "baa", "zzz"]
+    packed = pack_codes(encode_words(words, 3)[0])
+    assert packed.dtype == np.uint64
+    assert (np.diff(packed.astype(np.int64)) > 0).all()
+
+
+def test_pack_rejects_long_words():
+    with pytest.raises(ValueError):
+        pack_codes(np.zeros((1, 13), dtype=np.uint8))
+
+
+# -------------------------
+# Tests for WordMatrix
+# -------------------------
+
+def test_words_round_trip():
+    assert matrix.words() == sorted(word_list)
+    assert matrix.word(0) == "bag"
+    assert len(matrix) == len(word_list)
+
+
+def test_membership():
+    assert "cat" in matrix
+    assert "cab" not in matrix
+    assert "cats" not in matrix
+    assert matrix.lookup(["bag", "xyz", "dog"]).tolist() == [0, -1, 6]
+
+
+def test_at_distance():
+    assert matrix.at_distance("cat") == ["bat", "cot"]
+    assert matrix.at_distance("cat", 2) == ["bag", "dot"]
+    assert matrix.within("cat", 1) == ["bat", "cat", "cot"]
+    with pytest.raises(ValueError):
+        matrix.hamming("ca")
+
+
+def test_validate_moves_matches_play_ladder_round():
+    current = ["cat", "cat", "cat", "cot", "dog", "dig", "cat"]
+    new = ["cot", "dog", "cab", "dot", "dig", "dig", "ca"]
+    expected = [play_ladder_round(c, n, word_list)[0] == "correct" for c, n in zip(current, new)]
+    assert matrix.validate_moves(current, new).tolist() == expected
+
+
+def test_empty_matrix():
+    empty = WordMatrix([], length=3)
+    assert len(empty) == 0
+    assert "cat" not in empty
+
+
+def test_engine_matrix(tmp_path):
+    from word_ladder import WordLadderEngine
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(sorted(word_list)))
+    engine = WordLadderEngine(str(path))
+    assert engine.matrix(3).words() == sorted(word_list)
+    assert engine.matrix(3) is engine.matrix(3)
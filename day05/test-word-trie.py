@@ -0,0 +1,58 @@
+import pytest
+from word_ladder import WordLadderEngine
+from word_trie import WordTrie
+
+# Same small mock word list as test-word-ladder.py, plus some longer words
+word_list = {"cat", "cot", "dot", "dog", "dig", "big", "bag", "bat", "cats", "coat", "dots"}
+trie = WordTrie(word_list)
+
+
+# -------------------------
+# Tests for WordTrie
+# -------------------------
+
+def test_membership():
+    assert all(word in trie for word in word_list)
+    assert "ca" not in trie
+    assert "cab" not in trie
+    assert "catss" not in trie
+    assert "" not in trie
+    assert "cät" not in trie
+    assert len(trie) == len(word_list)
+
+
+def test_is_prefix():
+    assert trie.is_prefix("")
+    assert trie.is_prefix("co")
+    assert trie.is_prefix("coat")
+    assert not trie.is_prefix("cu")
+
+
+def test_complete():
+    assert trie.complete("c") == ["cat", "cats", "coat", "cot"]
+    assert trie.complete("c", limit=2) == ["cat", "cats"]
+    assert trie.complete("c", length=4) == ["cats", "coat"]
+    assert trie.complete("x") == []
+
+
+def test_match():
+    assert trie.match("?at") == ["bat", "cat"]
+    assert trie.match("d??") == ["dig", "dog", "dot"]
+    assert trie.match("????") == ["cats", "coat", "dots"]
+    assert trie.match("c?") == []
+
+
+def test_minimized():
+    # "-at", "-ot", "-og" ... endings are shared, so there are fewer nodes than in a plain trie
+    plain_trie_nodes = 1 + len({word[:i] for word in word_list for i in range(1, len(word) + 1)})
+    assert trie.node_count() < plain_trie_nodes
+
+
+def test_engine_trie(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(sorted(word_list)), encoding="utf-8")
+    engine = WordLadderEngine(str(path))
+    assert engine.trie().match("c?t") == ["cat", "cot"]
+    assert engine.trie() is engine.trie()
+    # Built from the word lists, without a neighbour graph per length
+    assert engine.loaded_lengths() == []
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from word_graph import WordGraph
+
+
+# -----------------------
+# Compiled dictionary cache
+# -----------------------
+#
+# For a word list like wordlist_4Letter.txt the cache lives in
+# wordlist_4Letter.txt.cache/ and holds, per word length:
+#   words-4.npy    sorted words as one packed fixed-width byte array
+#   indptr-4.npy   CSR row pointers of the neighbour graph
+#   indices-4.npy  CSR neighbour ids
+#   meta-4.json    sha256, size and mtime of the source file
+# The .npy files are memory-mapped on load, so startup does not parse text
+# or rebuild the graph. The cache is rebuilt whenever the source hash changes.
+
+CACHE_VERSION = 1
+
+
+def cache_dir_for(path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".cache")
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_words(path, length: int) -> list:
+    """Read lowercase alphabetic words of the given length (utf-8-sig also drops a BOM)."""
+    words = set()
+    with open(path, "r", encoding="utf-8-sig") as file:
+        for line in file:
+            word = line.strip().lower()
+            if len(word) == length and word.isalpha():
+                words.add(word)
+    return sorted(words)
+
+
+def read_words_between(path, min_length: int, max_length: int) -> list:
+    """Like read_words, for every length from min_length to max_length in one pass."""
+    words = set()
+    with open(path, "r", encoding="utf-8-sig") as file:
+        for line in file:
+            word = line.strip().lower()
+            if min_length <= len(word) <= max_length and word.isalpha():
+                words.add(word)
+    return sorted(words)
+
+
+def _source_stamp(path) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _cache_files(cache_dir: Path, length: int) -> dict:
+    return {
+        "words": cache_dir / f"words-{length}.npy",
+        "indptr": cache_dir / f"indptr-{length}.npy",
+        "indices": cache_dir / f"indices-{length}.npy",
+        "meta": cache_dir / f"meta-{length}.json",
+    }
+
+
+def _is_fresh(path, files: dict) -> bool:
+    """Check the cache against the source: size+mtime first, the sha256 only if they changed."""
+    if not all(f.exists() for f in files.values()):
+        return False
+    try:
+        with open(files["meta"], "r") as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return False
+    if meta.get("version") != CACHE_VERSION:
+        return False
+
+    stamp = _source_stamp(path)
+    if meta.get("size") == stamp["size"] and meta.get("mtime_ns") == stamp["mtime_ns"]:
+        return True
+    if meta.get("sha256") != file_sha256(path):
+        return False
+    # Same content, only touched: remember the new stamp so the hash is skipped next time
+    meta.update(stamp)
+    _write_json(files["meta"], meta)
+    return True
+
+
+def _write_json(target: Path, data: dict):
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "w") as file:
+        json.dump(data, file)
+    os.replace(tmp, target)
+
+
+def _save_npy(target: Path, array):
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as file:
+        np.save(file, array)
+    os.replace(tmp, target)
+
+
+def compile_word_graph(path, length: int) -> WordGraph:
+    """Build the graph from the text file and write the cache files next to it."""
+    graph = WordGraph(read_words(path, length))
+    indptr, indices = graph.to_csr()
+
+    cache_dir = cache_dir_for(path)
+    files = _cache_files(cache_dir, length)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        _save_npy(files["words"], np.array(graph.words, dtype=f"S{length}"))
+        _save_npy(files["indptr"], indptr)
+        _save_npy(files["indices"], indices)
+        # The meta file is written last, so a half-written cache is never seen as fresh
+        meta = {"version": CACHE_VERSION, "length": length, "sha256": file_sha256(path)}
+        meta.update(_source_stamp(path))
+        _write_json(files["meta"], meta)
+    except OSError as error:
+        print(f"Warning: could not write dictionary cache ({error}).")
+    return graph
+
+
+def load_word_graph(path, length: int) -> WordGraph:
+    """
+    Load the word graph for one word length, from the compiled cache if it is
+    up to date, otherwise from the text file (and refresh the cache).
+    Returns an empty graph if the word list file does not exist.
+    """
+    if not os.path.exists(path):
+        print(f"Error: Cannot find {path}. Make sure it exists.")
+        return WordGraph(())
+
+    files = _cache_files(cache_dir_for(path), length)
+    if not _is_fresh(path, files):
+        return compile_word_graph(path, length)
+
+    words = np.load(files["words"], mmap_mode="r")
+    indptr = np.load(files["indptr"], mmap_mode="r")
+    indices = np.load(files["indices"], mmap_mode="r")
+    # Fixed-width rows: slicing the raw bytes is much faster than np.char.decode
+    packed = words.tobytes().decode("ascii")
+    word_list = [packed[i:i + length] for i in range(0, len(packed), length)]
+    return WordGraph.from_csr(word_list, indptr, indices)
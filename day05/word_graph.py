@@ -0,0 +1,127 @@
+from collections import defaultdict
+
+import numpy as np
+
+
+# -----------------------
+# Wildcard buckets
+# -----------------------
+
+WILDCARD = "_"
+
+
+def wildcard_patterns(word: str) -> list:
+    """All patterns of a word with one letter replaced, e.g. cold -> _old, c_ld, co_d, col_"""
+    return [word[:i] + WILDCARD + word[i + 1:] for i in range(len(word))]
+
+
+# -----------------------
+# Word graph
+# -----------------------
+
+class WordGraph:
+    """
+    Graph of words where an edge means "differs by exactly one letter".
+
+    Instead of comparing a word against the whole dictionary, every word is
+    put in one bucket per wildcard pattern (cold -> _old, c_ld, co_d, col_).
+    Two words are neighbours exactly when they share a bucket, so the
+    neighbours of a word of length L are found with L dictionary lookups.
+    Words are numbered (0..n-1, alphabetical) so solvers can work on ids.
+    """
+
+    def __init__(self, words):
+        self.words = sorted(set(words))
+        self.ids = {word: i for i, word in enumerate(self.words)}
+        self._buckets = None
+        # Neighbour lists are computed on first use and then reused (solvers visit words many times)
+        self._adjacency = [None] * len(self.words)
+        self._csr = None
+
+    @classmethod
+    def from_csr(cls, words, indptr, indices):
+        """
+        Build a graph from precomputed adjacency in CSR form: the neighbours of
+        word i are indices[indptr[i]:indptr[i + 1]]. `words` must be sorted and unique.
+        """
+        graph = cls.__new__(cls)
+        graph.words = list(words)
+        graph.ids = {word: i for i, word in enumerate(graph.words)}
+        graph._buckets = None
+        graph._adjacency = [None] * len(graph.words)
+        graph._csr = (indptr, indices)
+        return graph
+
+    @property
+    def buckets(self) -> dict:
+        """pattern -> list of word ids, built the first time it is needed."""
+        if self._buckets is None:
+            buckets = defaultdict(list)
+            for i, word in enumerate(self.words):
+                for pattern in wildcard_patterns(word):
+                    buckets[pattern].append(i)
+            self._buckets = dict(buckets)
+        return self._buckets
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self.ids
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def neighbor_ids(self, word_id: int) -> list:
+        """Ids of all words one letter away from the word with id `word_id`."""
+        result = self._adjacency[word_id]
+        if result is None and self._csr is not None:
+            indptr, indices = self._csr
+            result = indices[indptr[word_id]:indptr[word_id + 1]].tolist()
+            self._adjacency[word_id] = result
+        elif result is None:
+            result = []
+            for pattern in wildcard_patterns(self.words[word_id]):
+                for other in self.buckets[pattern]:
+                    if other != word_id:
+                        result.append(other)
+            self._adjacency[word_id] = result
+        return result
+
+    def to_csr(self):
+        """
+        Adjacency as (indptr, indices) int32 arrays: the neighbours of word i are
+        indices[indptr[i]:indptr[i + 1]]. Built once and kept.
+        """
+        if self._csr is None:
+            indptr = np.zeros(len(self.words) + 1, dtype=np.int32)
+            rows = []
+            for word_id in range(len(self.words)):
+                neighbors = sorted(self.neighbor_ids(word_id))
+                rows.append(neighbors)
+                indptr[word_id + 1] = indptr[word_id] + len(neighbors)
+            indices = np.fromiter((n for row in rows for n in row), dtype=np.int32, count=int(indptr[-1]))
+            self._csr = (indptr, indices)
+        return self._csr
+
+    def neighbors(self, word: str) -> list:
+        """All dictionary words one letter away from `word` (which need not be in the dictionary)."""
+        if word in self.ids:
+            return sorted(self.words[i] for i in self.neighbor_ids(self.ids[word]))
+        result = set()
+        for pattern in wildcard_patterns(word):
+            for other in self.buckets.get(pattern, ()):
+                result.add(self.words[other])
+        result.discard(word)
+        return sorted(result)
+
+    def is_move(self, current_word: str, new_word: str) -> bool:
+        """True if new_word is in the dictionary and one letter away from current_word."""
+        if new_word not in self.ids or len(current_word) != len(new_word):
+            return False
+        return sum(1 for a, b in zip(current_word, new_word) if a != b) == 1
+
+    def hints(self, word: str, exclude=(), limit=None) -> list:
+        """Valid next words from `word`, skipping words in `exclude` (e.g. the ladder so far)."""
+        result = [w for w in self.neighbors(word) if w not in exclude]
+        return result if limit is None else result[:limit]
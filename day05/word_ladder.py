@@ -0,0 +1,330 @@
+import os
+import random
+
+import numpy as np
+
+from edit_index import EditIndex, one_edit_diff
+from puzzles import PuzzleGenerator, label_components
+from word_cache import load_word_graph, read_words_between
+from word_graph import WordGraph
+from word_matrix import WordMatrix
+from word_trie import WordTrie
+
+
+# -----------------------
+# Word Ladder Logic
+# -----------------------
+
+def one_letter_diff(word1: str, word2: str) -> bool:
+    """Return True if the words differ by exactly one letter."""
+    if len(word1) != len(word2):
+        return False
+
+    diff = sum(1 for a, b in zip(word1, word2) if a != b)
+    return diff == 1
+
+
+def is_valid_word(word: str, word_list: set) -> bool:
+    """Check if a word exists in the dictionary of allowed words."""
+    return word in word_list
+
+
+def play_ladder_round(current_word: str, new_word: str, word_list: set):
+    """
+    Attempt to move from current_word to new_word.
+    Returns (status, updated_word)
+    status: "correct" or "invalid"
+    """
+    if not is_valid_word(new_word, word_list):
+        return "invalid", current_word
+
+    if not one_letter_diff(current_word, new_word):
+        return "invalid", current_word
+
+    return "correct", new_word
+
+
+# -----------------------
+# Load word list from file
+# -----------------------
+
+def load_word_list(filename: str, length: int) -> set:
+    """
+    Load a text file containing one word per line.
+    Returns a set of words of the given length (lowercase, stripped).
+    """
+    words = set()
+    try:
+        with open(filename, "r", encoding="utf-8-sig") as file:
+            for line in file:
+                word = line.strip().lower()
+                # Only include valid alphabetic words of the requested length
+                if len(word) == length and word.isalpha():
+                    words.add(word)
+    except FileNotFoundError:
+        print(f"Error: Cannot find {filename}. Make sure it exists.")
+        return set()
+
+    return words
+
+
+# -----------------------
+# Multi-length engine
+# -----------------------
+
+DEFAULT_DICTIONARY = ("wordlist_3Letter.txt", "wordlist_4Letter.txt")
+MIN_LENGTH = 3
+MAX_LENGTH = 8
+
+# "substitute": change one letter per move (the classic game)
+# "edit": change, add or remove one letter per move (cat -> cart)
+RULES = ("substitute", "edit")
+
+
+class WordLadderEngine:
+    """
+    One engine for every word length.
+
+    The dictionary may be one mixed-length word list or several files. The
+    words and neighbour graph of a length are only loaded the first time that
+    length is played, so memory is spent only on the lengths actually used.
+    With rules="edit" a move may also add or remove a letter; the words of
+    all lengths are then indexed together in one EditIndex.
+    """
+
+    def __init__(self, dictionary=DEFAULT_DICTIONARY, rules: str = "substitute"):
+        if rules not in RULES:
+            raise ValueError(f"Unknown rules {rules!r}, expected one of {RULES}.")
+        self.paths = [dictionary] if isinstance(dictionary, str) else list(dictionary)
+        self.rules = rules
+        self._all_words = None
+        self._edit_index = None
+        self._trie = None
+        self._graphs = {}
+        self._words = {}
+        self._components = {}
+        self._starts = {}
+        self._puzzles = {}
+        self._matrices = {}
+
+    def graph(self, length: int) -> WordGraph:
+        if not MIN_LENGTH <= length <= MAX_LENGTH:
+            raise ValueError(f"Word length must be between {MIN_LENGTH} and {MAX_LENGTH}.")
+        if length not in self._graphs:
+            graphs = [load_word_graph(path, length) for path in self.paths]
+            graphs = [g for g in graphs if len(g)]
+            if len(graphs) == 1:
+                self._graphs[length] = graphs[0]
+            else:
+                # Several files contribute words of this length: merge them
+                self._graphs[length] = WordGraph(w for g in graphs for w in g.words)
+        return self._graphs[length]
+
+    def words(self, length: int) -> set:
+        if length not in self._words:
+            self._words[length] = set(self.graph(length).words)
+        return self._words[length]
+
+    def matrix(self, length: int) -> WordMatrix:
+        """The words of one length as a WordMatrix, for bulk membership and move checks."""
+        if length not in self._matrices:
+            self._matrices[length] = WordMatrix(self.graph(length).words, length)
+        return self._matrices[length]
+
+    def loaded_lengths(self) -> list:
+        return sorted(self._graphs)
+
+    def all_words(self) -> list:
+        """
+        Words of every supported length, read straight from the word lists, so
+        no neighbour graph is built (or cached) for lengths that are not played.
+        """
+        if self._all_words is None:
+            words = set()
+            for path in self.paths:
+                if not os.path.exists(path):
+                    print(f"Error: Cannot find {path}. Make sure it exists.")
+                    continue
+                words.update(read_words_between(path, MIN_LENGTH, MAX_LENGTH))
+            self._all_words = sorted(words)
+        return self._all_words
+
+    def edit_index(self) -> EditIndex:
+        """Words of every supported length, indexed for add/remove/change moves."""
+        if self._edit_index is None:
+            self._edit_index = EditIndex(self.all_words())
+        return self._edit_index
+
+    def trie(self) -> WordTrie:
+        """Words of every supported length as a DAWG, for prefix and pattern queries."""
+        if self._trie is None:
+            self._trie = WordTrie(self.all_words())
+        return self._trie
+
+    def is_word(self, word: str, length: int = None) -> bool:
+        """Dictionary check; with substitute rules only words of `length` (if given) count."""
+        if self.rules == "edit":
+            return word in self.edit_index()
+        length = len(word) if length is None else length
+        return len(word) == length and MIN_LENGTH <= length <= MAX_LENGTH and word in self.words(length)
+
+    def is_step(self, current_word: str, new_word: str) -> bool:
+        """True if new_word is one move away from current_word under the engine's rules."""
+        if self.rules == "edit":
+            return one_edit_diff(current_word, new_word)
+        return one_letter_diff(current_word, new_word)
+
+    def hints(self, word: str, exclude=(), limit=None) -> list:
+        if self.rules == "edit":
+            return self.edit_index().hints(word, exclude=exclude, limit=limit)
+        return self.graph(len(word)).hints(word, exclude=exclude, limit=limit)
+
+    def play_round(self, current_word: str, new_word: str):
+        """Same contract as play_ladder_round, for a word of any loaded length."""
+        if self.rules == "edit":
+            if self.is_word(new_word) and self.is_step(current_word, new_word):
+                return "correct", new_word
+            return "invalid", current_word
+        return play_ladder_round(current_word, new_word, self.words(len(current_word)))
+
+    def components(self, length: int):
+        """(labels, sizes) of the connected components, see puzzles.label_components."""
+        if length not in self._components:
+            self._components[length] = label_components(self.graph(length))
+        return self._components[length]
+
+    def random_start(self, length: int, min_component_size: int = 2) -> str:
+        """
+        A random starting word from which at least `min_component_size - 1`
+        other words can be reached, so the player is never stuck on an isolated word.
+        Falls back to smaller components if the dictionary has none that big.
+        """
+        key = (length, min_component_size)
+        if key not in self._starts:
+            labels, sizes = self.components(length)
+            threshold = min(min_component_size, int(sizes.max()) if len(sizes) else 1)
+            self._starts[key] = np.flatnonzero(sizes[labels] >= threshold).tolist()
+        return self.graph(length).words[random.choice(self._starts[key])]
+
+    def puzzles(self, length: int, samples: int = 200) -> PuzzleGenerator:
+        """Generator of (start, target, moves) puzzles with a known shortest ladder."""
+        if length not in self._puzzles:
+            self._puzzles[length] = PuzzleGenerator(self.graph(length), samples=samples)
+        return self._puzzles[length]
+
+
+# -----------------------
+# Main Game
+# -----------------------
+
+def play_game(engine: WordLadderEngine, length: int, max_mistakes: int, ladder_length: int,
+              input_fn=input):
+    """Play one game. Returns (ladder, score)."""
+    if not MIN_LENGTH <= length <= MAX_LENGTH:
+        print(f"Word length must be between {MIN_LENGTH} and {MAX_LENGTH}.")
+        return [], 0
+    # Same limits as LadderServer.new_game: at least one mistake and one move
+    max_mistakes = max(max_mistakes, 1)
+    ladder_length = max(ladder_length, 2)
+
+    print("Loading dictionary…")
+
+    word_list = engine.words(length)
+
+    if not word_list:
+        print("Word list is empty. Exiting.")
+        return [], 0
+
+    if len(word_list) < 10:
+        print(f"ERROR: Your word list file does not contain enough {length}-letter words.")
+        return [], 0
+
+    print(f"Loaded {len(word_list)} valid {length}-letter words.\n")
+
+    print("\nWelcome to the Word Ladder Game!")
+    print("Rules:")
+    if engine.rules == "edit":
+        print(" - Enter a new word that changes, adds or removes ONE letter of the last word")
+    else:
+        print(" - Enter a new word that differs by ONE letter from the last word")
+    print(" - Your word must be valid and approved by the Collins Dictionary list.")
+    print(f" - You get only {max_mistakes} incorrect attempts.")
+    print(" - Type ? to see some valid next words.")
+    print(f" - The ladder ends after {ladder_length} total words.\n")
+
+    # Choose random starting word
+    current_word = engine.random_start(length, min_component_size=ladder_length)
+    print(f"Starting word: {current_word}")
+
+    ladder = [current_word]
+    score = 0
+    mistakes = 0
+
+    # Game loop
+    while True:
+        player_word = input_fn("Enter the next word: ").strip().lower()
+
+        if player_word == "?":
+            hints = engine.hints(current_word, exclude=ladder, limit=10)
+            print(f"Hint: {', '.join(hints) if hints else 'no valid moves from here'}\n")
+            continue
+
+        if not engine.is_word(player_word, length):
+            mistakes += 1
+            print("Invalid move: word not in dictionary. \n")
+            print(f"Mistakes: {mistakes}/{max_mistakes} \n")
+
+        elif not engine.is_step(current_word, player_word):
+            mistakes += 1
+            if engine.rules == "edit":
+                print("Invalid move: word must change, add or remove ONE letter. \n")
+            else:
+                print("Invalid move: word must differ by ONE letter. \n")
+            print(f"Mistakes: {mistakes}/{max_mistakes} \n")
+
+        else:
+            # Valid move
+            score += 1
+            ladder.append(player_word)
+            current_word = player_word
+            print(f"Good! Ladder so far: {ladder}\n")
+
+        # End conditions
+        if mistakes >= max_mistakes:
+            print(f"You used all {max_mistakes} incorrect attempts!")
+            break
+
+        if len(ladder) >= ladder_length:
+            print(f"Great job! You completed a {ladder_length}-word ladder!")
+            break
+
+    print("\nGame Over!")
+    print(f"\nFinal ladder: {ladder}")
+    print(f"Your final score: {score}")
+    return ladder, score
+
+
+def ask_number(prompt: str, minimum: int, maximum: int = None, input_fn=input) -> int:
+    """Ask until the answer is a whole number between minimum and maximum (if given)."""
+    while True:
+        answer = input_fn(prompt).strip()
+        if answer.isdigit() and int(answer) >= minimum and (maximum is None or int(answer) <= maximum):
+            return int(answer)
+        if maximum is None:
+            print(f"Invalid number, enter a whole number ({minimum} or more).")
+        else:
+            print(f"Invalid number, enter a whole number from {minimum} to {maximum}.")
+
+
+def main():
+    edit = input("Allow adding and removing letters? (y/n): ").strip().lower().startswith("y")
+    engine = WordLadderEngine(rules="edit" if edit else "substitute")
+    length = ask_number(f"Word length ({MIN_LENGTH}-{MAX_LENGTH}): ", MIN_LENGTH, MAX_LENGTH)
+    max_mistakes = ask_number("Number of incorrect attempts allowed: ", 1)
+    ladder_length = ask_number("Ladder length (total words, 2 or more): ", 2)
+    play_game(engine, length, max_mistakes, ladder_length)
+
+
+# Run the game only when executed directly
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import numpy as np
+
+
+# -----------------------
+# Encoding
+# -----------------------
+#
+# Every letter becomes a number 0-25 ("a" = 0). A word of length L is then
+# either one row of an (n, L) uint8 matrix, or one integer with 5 bits per
+# letter (first letter in the highest bits, so integer order = alphabetical
+# order). Up to 12 letters fit in a uint64.
+
+BITS_PER_LETTER = 5
+MAX_PACKED_LENGTH = 64 // BITS_PER_LETTER
+
+
+def encode_words(words, length: int, ignore_case: bool = False):
+    """
+    Encode words as an (n, length) uint8 matrix of letter codes.
+    Also returns a bool array telling which inputs were valid lowercase
+    a-z words of the right length (any case with ignore_case); rows of
+    invalid words are all zero.
+    """
+    words = list(words)
+    codes = np.zeros((len(words), length), dtype=np.uint8)
+    right_length = np.fromiter(map(len, words), dtype=np.int64, count=len(words)) == length
+    if not right_length.any() or length == 0:
+        return codes, right_length
+    if not right_length.all():
+        words = [w for w, ok in zip(words, right_length) if ok]
+    # "replace" keeps one byte per character, so rows stay aligned; the "?" then fails the range check
+    raw = np.frombuffer("".join(words).encode("ascii", "replace"), dtype=np.uint8).reshape(-1, length)
+    if ignore_case:
+        raw = np.where((raw >= ord("A")) & (raw <= ord("Z")), raw | np.uint8(0x20), raw)
+    raw = raw - np.uint8(ord("a"))
+    letters = (raw < 26).all(axis=1)
+    valid = right_length.copy()
+    valid[right_length] = letters
+    codes[valid] = raw[letters]
+    return codes, valid
+
+
+def pack_codes(codes):
+    """Pack an (n, L) code matrix into n uint64 integers, 5 bits per letter."""
+    length = codes.shape[1]
+    if length > MAX_PACKED_LENGTH:
+        raise ValueError(f"Words longer than {MAX_PACKED_LENGTH} letters do not fit in 64 bits.")
+    shifts = np.arange(length - 1, -1, -1, dtype=np.uint64) * np.uint64(BITS_PER_LETTER)
+    return (codes.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+
+
+# -----------------------
+# Word matrix
+# -----------------------
+
+class WordMatrix:
+    """
+    Compact store of same-length words with vectorised queries.
+
+    `codes` holds one uint8 row per word (L bytes per word) and `packed` one
+    sorted uint64 per word (8 bytes per word), instead of a Python str object
+    plus its set entry for every word. Bulk operations compare whole columns
+    at once instead of calling one_letter_diff for every pair.
+    """
+
+    def __init__(self, words, length: int = None):
+        words = sorted(set(words))
+        if length is None:
+            length = len(words[0]) if words else 0
+        self.length = length
+        self.codes, valid = encode_words(words, length)
+        if not valid.all():
+            bad = [w for w, ok in zip(words, valid) if not ok][:5]
+            raise ValueError(f"Not lowercase {length}-letter words: {bad}")
+        self.packed = pack_codes(self.codes)
+
+    def __len__(self):
+        return len(self.packed)
+
+    def word(self, index: int) -> str:
+        return (self.codes[index] + ord("a")).tobytes().decode("ascii")
+
+    def words(self, indices=None) -> list:
+        rows = self.codes if indices is None else self.codes[indices]
+        packed = (rows + ord("a")).tobytes().decode("ascii")
+        return [packed[i:i + self.length] for i in range(0, len(packed), self.length)]
+
+    # -----------------------
+    # Membership
+    # -----------------------
+
+    def lookup(self, words):
+        """Index of every word in the store, -1 for words that are not in it."""
+        return self.lookup_codes(*encode_words(words, self.length))
+
+    def lookup_codes(self, codes, valid):
+        """Same as lookup, for rows that are already encoded with encode_words."""
+        if len(self.packed) == 0:
+            return np.full(len(valid), -1, dtype=np.int64)
+        keys = pack_codes(codes)
+        positions = np.minimum(np.searchsorted(self.packed, keys), len(self.packed) - 1)
+        found = valid & (self.packed[positions] == keys)
+        return np.where(found, positions, -1)
+
+    def contains_many(self, words):
+        return self.lookup(words) >= 0
+
+    def __contains__(self, word):
+        return bool(self.contains_many([word])[0])
+
+    # -----------------------
+    # Hamming distance queries
+    # -----------------------
+
+    def hamming(self, word: str):
+        """Number of differing letters between `word` and every stored word."""
+        codes, valid = encode_words([word], self.length)
+        if not valid[0]:
+            raise ValueError(f"Not a lowercase {self.length}-letter word: {word!r}")
+        return (self.codes != codes[0]).sum(axis=1)
+
+    def at_distance(self, word: str, k: int = 1) -> list:
+        """All stored words that differ from `word` in exactly k letters."""
+        return self.words(np.flatnonzero(self.hamming(word) == k))
+
+    def within(self, word: str, k: int) -> list:
+        """All stored words that differ from `word` in at most k letters (word itself included)."""
+        return self.words(np.flatnonzero(self.hamming(word) <= k))
+
+    def validate_moves(self, current_words, new_words):
+        """
+        Vectorised play_ladder_round check for many moves at once: True where
+        new_word is in the store and differs from current_word by one letter.
+        """
+        current_codes, current_ok = encode_words(current_words, self.length)
+        new_codes, new_ok = encode_words(new_words, self.length)
+        one_letter = (current_codes != new_codes).sum(axis=1) == 1
+        return current_ok & one_letter & (self.lookup_codes(new_codes, new_ok) >= 0)
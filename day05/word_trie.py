@@ -0,0 +1,163 @@
+from array import array
+
+
+# -----------------------
+# Minimized word graph (DAWG)
+# -----------------------
+#
+# The trie is built from the sorted words and then minimized: nodes with the
+# same "is a word end" flag and the same outgoing edges are merged, so common
+# endings (-at, -ing, ...) are stored once. The result lives in flat arrays:
+#   first_edge[node] .. first_edge[node + 1]   the edges of a node
+#   labels[edge]       letter of the edge (one byte, sorted per node)
+#   targets[edge]      node the edge leads to
+#   final[node]        1 if a word ends at this node
+# Node 0 is the root.
+
+WILDCARD = "?"
+
+
+class WordTrie:
+    """Compact dictionary with membership, prefix and pattern queries."""
+
+    def __init__(self, words):
+        words = sorted({w for w in words if w.isascii() and w.isalpha() and w.islower()})
+        self.word_count = len(words)
+
+        # 1. Plain trie: one dict of children per node
+        children = [{}]
+        final = [False]
+        for word in words:
+            node = 0
+            for letter in word:
+                child = children[node].get(letter)
+                if child is None:
+                    child = len(children)
+                    children.append({})
+                    final.append(False)
+                    children[node][letter] = child
+                node = child
+            final[node] = True
+
+        # 2. Minimize bottom-up: children always have larger ids than their parent
+        canonical = list(range(len(children)))
+        register = {}
+        for node in range(len(children) - 1, -1, -1):
+            signature = (final[node], tuple(sorted((letter, canonical[child])
+                                                   for letter, child in children[node].items())))
+            canonical[node] = register.setdefault(signature, node)
+
+        # 3. Number the remaining nodes breadth-first from the root and write the flat arrays
+        numbering = {0: 0}
+        order = [0]
+        for node in order:
+            for letter in sorted(children[node]):
+                child = canonical[children[node][letter]]
+                if child not in numbering:
+                    numbering[child] = len(order)
+                    order.append(child)
+
+        self.first_edge = array("I", [0])
+        self.labels = bytearray()
+        self.targets = array("I")
+        self.final = bytearray(len(order))
+        for new_id, node in enumerate(order):
+            self.final[new_id] = final[node]
+            for letter in sorted(children[node]):
+                self.labels.append(ord(letter))
+                self.targets.append(numbering[canonical[children[node][letter]]])
+            self.first_edge.append(len(self.labels))
+
+    @classmethod
+    def from_files(cls, paths):
+        """Build from word list files (one word per line, any length)."""
+        words = set()
+        for path in paths:
+            with open(path, "r", encoding="utf-8-sig") as file:
+                for line in file:
+                    words.add(line.strip().lower())
+        return cls(words)
+
+    def __len__(self):
+        return self.word_count
+
+    def node_count(self) -> int:
+        return len(self.final)
+
+    def nbytes(self) -> int:
+        """Memory used by the flat arrays."""
+        return (len(self.first_edge) * self.first_edge.itemsize + len(self.labels)
+                + len(self.targets) * self.targets.itemsize + len(self.final))
+
+    # -----------------------
+    # Walking
+    # -----------------------
+
+    def _child(self, node: int, letter: str) -> int:
+        """Node reached from `node` by `letter`, -1 if there is no such edge."""
+        code = ord(letter)
+        if code > 255:
+            return -1
+        edge = self.labels.find(code, self.first_edge[node], self.first_edge[node + 1])
+        return -1 if edge == -1 else self.targets[edge]
+
+    def _walk(self, prefix: str) -> int:
+        node = 0
+        for letter in prefix:
+            node = self._child(node, letter)
+            if node == -1:
+                return -1
+        return node
+
+    def _edges(self, node: int):
+        for edge in range(self.first_edge[node], self.first_edge[node + 1]):
+            yield chr(self.labels[edge]), self.targets[edge]
+
+    # -----------------------
+    # Queries
+    # -----------------------
+
+    def __contains__(self, word) -> bool:
+        node = self._walk(word)
+        return node != -1 and self.final[node] == 1
+
+    def is_prefix(self, prefix: str) -> bool:
+        """True if at least one word starts with `prefix` (the empty prefix included)."""
+        return self._walk(prefix) != -1
+
+    def complete(self, prefix: str, limit: int = None, length: int = None) -> list:
+        """Words starting with `prefix` in alphabetical order, optionally only of one length."""
+        node = self._walk(prefix)
+        if node == -1:
+            return []
+        result = []
+        stack = [(node, prefix)]
+        while stack and (limit is None or len(result) < limit):
+            node, word = stack.pop()
+            if self.final[node] and (length is None or len(word) == length):
+                result.append(word)
+            if length is not None and len(word) >= length:
+                continue
+            # Push in reverse so the smallest letter is explored first
+            stack.extend((child, word + letter) for letter, child in reversed(list(self._edges(node))))
+        return result
+
+    def match(self, pattern: str, limit: int = None) -> list:
+        """Words matching a pattern where ? stands for any one letter, e.g. c?t -> cat, cot, cut."""
+        result = []
+        stack = [(0, "")]
+        while stack and (limit is None or len(result) < limit):
+            node, word = stack.pop()
+            depth = len(word)
+            if depth == len(pattern):
+                if self.final[node]:
+                    result.append(word)
+                continue
+            letter = pattern[depth]
+            if letter == WILDCARD:
+                stack.extend((child, word + label) for label, child in reversed(list(self._edges(node))))
+            else:
+                child = self._child(node, letter)
+                if child != -1:
+                    stack.append((child, word + letter))
+        return result
@@ -0,0 +1,142 @@
+"""
+Backlog of open and overdue submissions over time, by one sorted sweep.
+
+Every submission adds +1 to the open backlog when it is submitted and -1 when
+it is closed; it adds +1 to the overdue backlog from the later of submission
+and deadline until it is closed. All these events are sorted once and
+summed cumulatively, which gives the backlog after every event (a step
+function) without filtering the table per timestamp. backlog_at and
+resample_backlog read that step function at any points / any frequency.
+
+subjects.txt has no closing time, only the current status. Pass the column
+with the closing time as `closed` when it is known. Without it (or where it
+is empty), Open submissions stay open until the end and Closed submissions,
+whose closing time is unknown, are not counted.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["open", "overdue"]
+# Event kinds: opened, closed, became overdue, closed while overdue
+OPEN_DELTA = np.array([1, -1, 0, 0], dtype=np.int64)
+OVERDUE_DELTA = np.array([0, 0, 1, -1], dtype=np.int64)
+
+
+def _nanoseconds(values) -> np.ndarray:
+    """datetime column -> int64 nanoseconds (NaT stays NaT's integer value)."""
+    return np.asarray(pd.to_datetime(values), dtype="datetime64[ns]").astype(np.int64)
+
+
+def backlog_timeline(df: pd.DataFrame, opened: str = "submission_datetime", closed: str = None,
+                     status: str = "submission_status", deadline: str = "deadline") -> pd.DataFrame:
+    """
+    Open and overdue backlog right after every event time, as a DataFrame
+    indexed by time (one row per distinct event time, sorted).
+    A submission counts as overdue while it is open after its deadline;
+    submissions without a deadline are never overdue.
+    """
+    nat = np.iinfo(np.int64).min
+    start = _nanoseconds(df[opened])
+    end = _nanoseconds(df[closed]) if closed is not None else np.full(len(df), nat)
+    is_open = (df[status] == "Open").to_numpy(dtype=bool) if status in df else np.zeros(len(df), dtype=bool)
+    has_end = end != nat
+    counted = (start != nat) & (has_end | is_open) & ~(has_end & (end < start))
+
+    start, end, has_end = start[counted], end[counted], has_end[counted]
+    due = _nanoseconds(df[deadline])[counted] if deadline in df else np.full(len(start), nat)
+    overdue_start = np.maximum(start, due)
+    overdue = (due != nat) & (~has_end | (overdue_start < end))
+
+    # Every event is (time, kind); kind indexes OPEN_DELTA / OVERDUE_DELTA. Open-ended
+    # intervals have no closing event.
+    times = np.concatenate([start, end[has_end], overdue_start[overdue], end[overdue & has_end]])
+    kinds = np.repeat(np.arange(4, dtype=np.int64),
+                      [len(start), has_end.sum(), overdue.sum(), (overdue & has_end).sum()])
+    if len(times) and int(times.max()) - int(times.min()) < 1 << 61:
+        # Pack the kind into the 2 low bits of the offset from the first event: one plain
+        # sort of integers instead of an argsort (about 6x faster)
+        origin = times.min()
+        keys = np.sort(((times - origin) << 2) | kinds)
+        times, kinds = (keys >> 2) + origin, keys & 3
+    else:  # spans of more than ~70 years
+        order = np.argsort(times)
+        times, kinds = times[order], kinds[order]
+    open_counts = np.cumsum(OPEN_DELTA[kinds])
+    overdue_counts = np.cumsum(OVERDUE_DELTA[kinds])
+    # Several events at the same time: keep the state after the last one
+    last = np.append(times[1:] != times[:-1], True) if len(times) else np.zeros(0, dtype=bool)
+    index = pd.DatetimeIndex(times[last].astype("datetime64[ns]"), name="time")
+    return pd.DataFrame({"open": open_counts[last], "overdue": overdue_counts[last]}, index=index)
+
+
+def backlog_at(timeline: pd.DataFrame, times) -> pd.DataFrame:
+    """Backlog at the given times (the state after all events up to and including each time)."""
+    times = pd.DatetimeIndex(pd.to_datetime(times), name="time")
+    positions = np.searchsorted(timeline.index.asi8, _nanoseconds(times), side="right") - 1
+    # Row -1 (before the first event) reads the empty backlog appended at the end
+    values = np.vstack([timeline[COLUMNS].to_numpy(dtype=np.int64), np.zeros((1, len(COLUMNS)), dtype=np.int64)])
+    result = values[positions]
+    return pd.DataFrame(result, index=times, columns=COLUMNS)
+
+
+def resample_backlog(timeline: pd.DataFrame, freq: str = "D", how: str = "at", start=None,
+                     end=None) -> pd.DataFrame:
+    """
+    Backlog on a regular grid of `freq` (any pandas frequency: "h", "D", "W", ...).
+    how="at":  the backlog at each grid time.
+    how="max": the peak backlog during each interval [grid time, next grid time).
+    """
+    if how not in ("at", "max"):
+        raise ValueError(f"how must be 'at' or 'max', not {how!r}")
+    if len(timeline) == 0 and (start is None or end is None):
+        return pd.DataFrame(columns=COLUMNS, index=pd.DatetimeIndex([], name="time"), dtype=np.int64)
+    if start is None:
+        try:
+            start = timeline.index[0].floor(freq)
+        except ValueError:  # non-fixed frequencies ("W", "MS", ...) cannot floor: take the anchor before
+            start = pd.tseries.frequencies.to_offset(freq).rollback(timeline.index[0].normalize())
+    start = pd.Timestamp(start)
+    end = pd.Timestamp(end) if end is not None else timeline.index[-1]
+    grid = pd.date_range(start, end, freq=freq, name="time")
+    result = backlog_at(timeline, grid)
+    if how == "max" and len(grid):
+        # Peak of the events inside each interval (after its grid time, before the next
+        # one), then compared with the state at its start
+        event_times = timeline.index.asi8
+        bounds = np.append(grid.asi8[1:], (grid[-1] + grid.freq).value)
+        first = np.searchsorted(event_times, grid.asi8, side="right")
+        after = np.searchsorted(event_times, bounds, side="left")
+        has_events = first < after
+        if has_events.any():
+            values = np.vstack([timeline[COLUMNS].to_numpy(dtype=np.int64),
+                                np.zeros((1, len(COLUMNS)), dtype=np.int64)])
+            # reduceat over (first, after) pairs: even results are the maxima of values[first:after]
+            peaks = np.maximum.reduceat(values, np.column_stack([first, after]).ravel(), axis=0)[::2]
+            peaks = np.where(has_events[:, None], peaks, 0)
+            result[:] = np.maximum(result.to_numpy(), peaks)
+    return result
+
+
+def main():
+    from submissions import load_submissions
+
+    parser = argparse.ArgumentParser(description="Open / overdue submission backlog over time.")
+    parser.add_argument("subjects", nargs="?", default="subjects.txt")
+    parser.add_argument("--freq", default="D", help="pandas frequency of the output (default: daily)")
+    parser.add_argument("--how", choices=["at", "max"], default="max")
+    parser.add_argument("--output", help="write the backlog to this CSV file")
+    args = parser.parse_args()
+
+    timeline = backlog_timeline(load_submissions(args.subjects))
+    backlog = resample_backlog(timeline, args.freq, args.how)
+    if args.output:
+        backlog.to_csv(args.output)
+        print(f"Backlog written to: {args.output}")
+    else:
+        print(backlog.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Benchmark the Day 09 analysis on synthetic logs of growing size.
+
+For every size (10^3 ... 10^7 rows) a log is generated with synthetic_logs,
+then each stage of the notebook is timed on it:
+    parse      subjects.txt -> DataFrame (submissions.load_submissions)
+    status     Open vs Closed counts
+    missing    SubmissionMatrix + students missing 1 / 2 assignments
+    times      average and mode submission time per student
+    weekend    weekend vs weekday counts
+    export     the Excel report (report_writer.write_report), only up to --export-limit rows
+Each stage is run --repeat times and the best time is kept. The results can
+be saved as a JSON baseline and later runs compared against it: a stage that
+got more than --tolerance slower is reported as a regression (exit code 1).
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from report_writer import write_report
+from submission_matrix import SubmissionMatrix
+from submission_times import submission_time_stats
+from submissions import load_submissions
+from synthetic_logs import MAX_STUDENTS, generate_log
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+STAGES = ("parse", "status", "missing", "times", "weekend", "export")
+# Stages faster than this are never reported as regressions (timer noise)
+MIN_SECONDS = 0.05
+
+
+def _best_time(function, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _stage_functions(path: Path, workdir: Path):
+    """The stages in order; each gets the parsed table (None for parse)."""
+
+    def weekend(df):
+        return df["submission_datetime"].dt.weekday.isin([4, 5]).value_counts()
+
+    def missing(df):
+        matrix = SubmissionMatrix.from_frame(df)
+        return matrix.students_missing_at_least(1), matrix.students_missing_at_least(2)
+
+    def export(df):
+        return write_report(workdir / "report.xlsx", {
+            "Cleaned_Data": (df, False),
+            "Open_vs_Closed": (df["submission_status"].value_counts().to_frame("Count"), True),
+            "Submission_Times": (submission_time_stats(df), True),
+        })
+
+    return {
+        "parse": lambda df: load_submissions(path),
+        "status": lambda df: df["submission_status"].value_counts(),
+        "missing": missing,
+        "times": submission_time_stats,
+        "weekend": weekend,
+        "export": export,
+    }
+
+
+def default_students(rows: int) -> int:
+    """About 20 PRs per student, within what synthetic_logs.student_names can name."""
+    return min(max(40, rows // 20), MAX_STUDENTS)
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, stages=STAGES, repeat: int = 3, students: int = None,
+                  export_limit: int = 100_000, seed: int = 0, workdir=None) -> list:
+    """
+    Time every stage at every size. Returns one dict per (rows, stage) with
+    seconds (best of `repeat`) and rows_per_second; skipped stages are left out.
+    `students` defaults to rows / 20 (at least 40, at most MAX_STUDENTS), i.e.
+    about 20 PRs per student (80 at 10^7 rows).
+    """
+    results = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        tmp = Path(tmp)
+        for rows in sizes:
+            path = tmp / f"subjects_{rows}.txt"
+            generate_log(path, rows, students=students or default_students(rows), seed=seed)
+            functions = _stage_functions(path, tmp)
+            df = load_submissions(path)
+            for stage in STAGES:
+                if stage not in stages or (stage == "export" and rows > export_limit):
+                    continue
+                seconds, _ = _best_time(lambda: functions[stage](df), 1 if rows >= 1_000_000 else repeat)
+                results.append({"rows": rows, "stage": stage, "seconds": seconds,
+                                "rows_per_second": rows / seconds if seconds else float("inf")})
+            del df
+            path.unlink()
+    return results
+
+
+# -----------------------
+# Baselines
+# -----------------------
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+            "machine": platform.machine(), "cpus": os.cpu_count()}
+
+
+def save_baseline(results: list, path):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=1)
+
+
+def load_baseline(path) -> list:
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)["results"]
+
+
+def compare(results: list, baseline: list, tolerance: float = 0.2) -> list:
+    """
+    Stages that are more than `tolerance` (0.2 = 20%) slower than in the
+    baseline, as dicts with rows, stage, baseline, seconds and ratio.
+    """
+    previous = {(r["rows"], r["stage"]): r["seconds"] for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["rows"], result["stage"]))
+        if before is None or result["seconds"] < MIN_SECONDS:
+            continue
+        ratio = result["seconds"] / max(before, MIN_SECONDS)
+        if ratio > 1 + tolerance:
+            regressions.append({"rows": result["rows"], "stage": result["stage"], "baseline": before,
+                                "seconds": result["seconds"], "ratio": ratio})
+    return regressions
+
+
+def format_table(results: list) -> str:
+    """Seconds per stage (columns) and size (rows)."""
+    table = pd.DataFrame(results).pivot(index="rows", columns="stage", values="seconds")
+    table = table[[stage for stage in STAGES if stage in table]]
+    return table.to_string(float_format=lambda seconds: f"{seconds:.4f}", na_rep="-")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each stage of the Day 09 analysis on synthetic logs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="rows per log (e.g. 1000 10000 ... 10000000)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage, the best is kept")
+    parser.add_argument("--students", type=int, default=None, help="default: rows / 20 (at most %d)" % MAX_STUDENTS)
+    parser.add_argument("--export-limit", type=int, default=100_000, help="largest size for the export stage")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--save", help="save the results as a baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.stages, args.repeat, args.students, args.export_limit)
+    print(format_table(results))
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Baseline written to: {args.save}")
+    if args.baseline:
+        regressions = compare(results, load_baseline(args.baseline), args.tolerance)
+        for r in regressions:
+            print(f"REGRESSION {r['stage']} at {r['rows']} rows: {r['baseline']:.4f} s -> {r['seconds']:.4f} s "
+                  f"({r['ratio']:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+How late (or early) the submissions are, as quantiles per student / assignment.
+
+join_deadlines attaches the assignment deadlines to the submissions through
+the category codes of assignment_number (one array lookup, no hash join), and
+lateness_minutes gives submission minus deadline in minutes: negative is
+early, positive is late.
+
+The quantiles come from LatenessSketch, a log-bucket sketch (as in DDSketch):
+a value x is counted in bucket ceil(log_gamma |x|) with
+gamma = (1 + a) / (1 - a), so every quantile is returned with a relative
+error of at most a (1% by default). A sketch holds bucket counts only, a few
+hundred buckets however many submissions it saw, and two sketches merge by
+adding their counts. LatenessSummary keeps one sketch per student (or
+assignment), so the summary of many courses stays small and can be built
+course by course.
+"""
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+QUANTILES = (0.5, 0.9, 0.99)
+# Bucket keys are sign * (index + KEY_BIAS), so that they sort like the values
+# they stand for and 0 is left for the zero bucket
+KEY_BIAS = 1 << 20
+
+
+def join_deadlines(df: pd.DataFrame, deadlines, key: str = "assignment_number",
+                   column: str = "deadline") -> pd.DataFrame:
+    """
+    Copy of df with `column` set to the deadline of each row's assignment.
+    `deadlines` is a dict / Series (assignment -> deadline), e.g. from
+    submissions.read_deadlines. Assignments without a deadline get NaT.
+    """
+    deadlines = pd.Series(deadlines, dtype="datetime64[ns]") if isinstance(deadlines, dict) \
+        else pd.to_datetime(deadlines).astype("datetime64[ns]")
+    keys = df[key] if isinstance(df[key].dtype, pd.CategoricalDtype) else df[key].astype("category")
+    categories = keys.cat.categories
+
+    # One deadline per category, plus NaT at the end for code -1 (missing key)
+    lookup = np.full(len(categories) + 1, np.datetime64("NaT"), dtype="datetime64[ns]")
+    positions = deadlines.index.get_indexer(categories)
+    found = positions >= 0
+    lookup[:-1][found] = deadlines.to_numpy()[positions[found]]
+    return df.assign(**{column: lookup[keys.cat.codes.to_numpy()]})
+
+
+def lateness_minutes(df: pd.DataFrame, submitted: str = "submission_datetime",
+                     deadline: str = "deadline") -> np.ndarray:
+    """Submission time minus deadline in minutes (NaN without a deadline)."""
+    delta = (np.asarray(pd.to_datetime(df[submitted]), dtype="datetime64[ns]")
+             - np.asarray(pd.to_datetime(df[deadline]), dtype="datetime64[ns]"))
+    return delta / np.timedelta64(1, "m")
+
+
+# -----------------------
+# Sketch
+# -----------------------
+
+def sketch_keys(values: np.ndarray, gamma: float, min_value: float) -> np.ndarray:
+    """Signed bucket key of every value; |x| <= min_value goes to the zero bucket (key 0)."""
+    values = np.asarray(values, dtype=float)
+    magnitude = np.abs(values)
+    nonzero = magnitude > min_value
+    index = np.zeros(len(values), dtype=np.int64)
+    index[nonzero] = np.ceil(np.log(magnitude[nonzero]) / math.log(gamma)).astype(np.int64) + KEY_BIAS
+    return np.sign(values).astype(np.int64) * index
+
+
+class LatenessSketch:
+    """Mergeable quantile sketch with relative accuracy `relative_accuracy`."""
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1 / 60, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.min_value = min_value  # one second: smaller lateness counts as on the deadline
+        self.max_buckets = max_buckets
+        self.buckets = Counter()
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, values):
+        """Count an array of lateness values (NaN is skipped)."""
+        values = np.asarray(values, dtype=float)
+        keys, counts = np.unique(sketch_keys(values[~np.isnan(values)], self.gamma, self.min_value),
+                                 return_counts=True)
+        self.add_buckets(keys.tolist(), counts.tolist())
+
+    def add_buckets(self, keys, counts):
+        # Counter.update copies a mapping in one step while the sketch is still empty
+        self.buckets.update(dict(zip(keys, counts)))
+        self._collapse()
+
+    def _collapse(self):
+        """Keep at most max_buckets: the buckets nearest zero are folded into their neighbour."""
+        excess = len(self.buckets) - self.max_buckets
+        if excess <= 0:
+            return
+        keys = sorted((key for key in self.buckets if key), key=abs)
+        folded, kept = keys[:excess], keys[excess:]
+        for positive in (True, False):
+            side = [key for key in folded if (key > 0) == positive]
+            if not side:
+                continue
+            target = min((key for key in kept if (key > 0) == positive), key=abs, default=None)
+            if target is None:
+                target = side.pop()
+            for key in side:
+                self.buckets[target] += self.buckets.pop(key)
+
+    def merge(self, other: "LatenessSketch") -> "LatenessSketch":
+        if other.gamma != self.gamma or other.min_value != self.min_value:
+            raise ValueError("Only sketches with the same accuracy and min_value can be merged")
+        self.add_buckets(list(other.buckets), list(other.buckets.values()))
+        return self
+
+    def value(self, key: int) -> float:
+        """Representative value of a bucket (within relative_accuracy of everything in it)."""
+        if key == 0:
+            return 0.0
+        index = abs(key) - KEY_BIAS
+        return math.copysign(2 * self.gamma ** index / (self.gamma + 1), key)
+
+    def quantiles(self, quantiles=QUANTILES) -> list:
+        """Value at rank floor(q * (count - 1)) for each q; NaN for an empty sketch."""
+        if not self.buckets:
+            return [float("nan")] * len(quantiles)
+        keys = sorted(self.buckets)
+        cumulative = np.cumsum([self.buckets[key] for key in keys])
+        ranks = np.floor(np.asarray(quantiles, dtype=float) * (cumulative[-1] - 1))
+        positions = np.searchsorted(cumulative, ranks, side="right")
+        return [self.value(keys[position]) for position in positions.tolist()]
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles([q])[0]
+
+    def to_dict(self) -> dict:
+        return {"relative_accuracy": self.relative_accuracy, "min_value": self.min_value,
+                "max_buckets": self.max_buckets, "buckets": {str(k): c for k, c in self.buckets.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatenessSketch":
+        sketch = cls(data["relative_accuracy"], data["min_value"], data["max_buckets"])
+        sketch.buckets = Counter({int(k): c for k, c in data["buckets"].items()})
+        return sketch
+
+
+# -----------------------
+# Per-group summary
+# -----------------------
+
+class LatenessSummary:
+    """One LatenessSketch per value of `by` (student_name, assignment_number, ...)."""
+
+    def __init__(self, by: str = "student_name", relative_accuracy: float = 0.01, min_value: float = 1 / 60):
+        self.by = by
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.sketches = {}
+
+    def _sketch(self, name) -> LatenessSketch:
+        if name not in self.sketches:
+            self.sketches[name] = LatenessSketch(self.relative_accuracy, self.min_value)
+        return self.sketches[name]
+
+    def update(self, df: pd.DataFrame) -> "LatenessSummary":
+        """Add a submissions table with a deadline column (e.g. one course or one chunk)."""
+        minutes = lateness_minutes(df)
+        valid = ~np.isnan(minutes) & df[self.by].notna().to_numpy()
+        if not valid.any():  # empty chunk, or no row with both a deadline and a group
+            return self
+        codes, names = pd.factorize(df[self.by][valid])
+        names = names.tolist()
+        gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        keys = sketch_keys(minutes[valid], gamma, self.min_value)
+
+        # Count every (group, bucket) pair at once, then hand each group its buckets
+        pairs = codes.astype(np.int64) * (4 * KEY_BIAS) + keys + 2 * KEY_BIAS
+        pairs, counts = np.unique(pairs, return_counts=True)
+        groups, keys = np.divmod(pairs, 4 * KEY_BIAS)
+        keys -= 2 * KEY_BIAS
+        starts = np.flatnonzero(np.append(True, groups[1:] != groups[:-1]))
+        ends = np.append(starts[1:], len(groups))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            self._sketch(names[groups[start]]).add_buckets(keys[start:end].tolist(), counts[start:end].tolist())
+        return self
+
+    def merge(self, other: "LatenessSummary") -> "LatenessSummary":
+        for name, sketch in other.sketches.items():
+            self._sketch(name).merge(sketch)
+        return self
+
+    def to_frame(self, quantiles=QUANTILES) -> pd.DataFrame:
+        """count and p50/p90/p99 (minutes late; negative = early) per group."""
+        columns = [f"p{round(q * 100):d}" for q in quantiles]
+        rows = {name: [sketch.count] + sketch.quantiles(quantiles) for name, sketch in self.sketches.items()}
+        frame = pd.DataFrame.from_dict(rows, orient="index", columns=["count"] + columns)
+        frame.index.name = self.by
+        return frame.sort_index()
+
+    def to_dict(self) -> dict:
+        return {"by": self.by, "relative_accuracy": self.relative_accuracy, "min_value": self.min_value,
+                "sketches": {name: sketch.to_dict() for name, sketch in self.sketches.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatenessSummary":
+        summary = cls(data["by"], data["relative_accuracy"], data["min_value"])
+        summary.sketches = {name: LatenessSketch.from_dict(s) for name, s in data["sketches"].items()}
+        return summary
+
+
+def lateness_report(df: pd.DataFrame, quantiles=QUANTILES) -> dict:
+    """{"student_name": ..., "assignment_number": ...} quantile tables of one submissions table."""
+    return {by: LatenessSummary(by).update(df).to_frame(quantiles) for by in ("student_name", "assignment_number")}
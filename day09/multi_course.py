@@ -0,0 +1,146 @@
+"""
+Aggregate many courses' submission logs in parallel.
+
+Every log file (same format as subjects.txt) is parsed and aggregated into a
+SubmissionState in a worker process. Only the small aggregate comes back to
+the parent, where the per-course states are turned into a per-course report
+and merged into one cross-course state with merge_states. Parsing is pure
+Python, so the work scales with the number of processes; time_workers
+measures that speedup on generated courses (synthetic_logs).
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from submission_state import SubmissionState, merge_states
+from synthetic_logs import generate_log
+
+
+def course_name(path: Path, root: Path) -> str:
+    """Name of a course: the log's path below the root without suffix (algo/2025.txt -> algo/2025)."""
+    return path.relative_to(root).with_suffix("").as_posix()
+
+
+def find_logs(root, pattern: str = "**/*.txt") -> list:
+    return sorted(p for p in Path(root).glob(pattern) if p.is_file())
+
+
+def aggregate_log(path) -> SubmissionState:
+    """Worker: parse one log into its aggregate state."""
+    state = SubmissionState()
+    state.update_from_file(path, newest_first=False)
+    return state
+
+
+def aggregate_courses(root, pattern: str = "**/*.txt", workers: int = None) -> dict:
+    """
+    course name -> SubmissionState for every log below `root`.
+    workers=1 runs in this process (no pool), None uses all cores.
+    """
+    root = Path(root)
+    paths = find_logs(root, pattern)
+    if workers == 1 or len(paths) <= 1:
+        states = [aggregate_log(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            states = list(executor.map(aggregate_log, paths, chunksize=1))
+    return {course_name(path, root): state for path, state in zip(paths, states)}
+
+
+# -----------------------
+# Reports
+# -----------------------
+
+def _summary(state: SubmissionState) -> dict:
+    weekend = state.weekend_counts()["Weekend (Fri+Sat)"]
+    missing = state.missing_counts()
+    return {
+        "rows": state.rows,
+        "students": len(state.students),
+        "assignments": len(state.assignments),
+        "closed": state.status_counts.get("Closed", 0),
+        "open": state.status_counts.get("Open", 0),
+        "weekend_share": weekend / state.rows if state.rows else 0.0,
+        "mean_missing": sum(missing.values()) / len(missing) if missing else 0.0,
+        "students_missing_2": sum(1 for count in missing.values() if count >= 2),
+        "mean_time": state.mean_time(),
+    }
+
+
+def course_report(states: dict) -> pd.DataFrame:
+    """
+    One row per course with its counts, weekend share, missing-assignment
+    summary and circular mean submission time.
+    """
+    rows = [dict(course=course, **_summary(state)) for course, state in states.items()]
+    return pd.DataFrame(rows, columns=["course", "rows", "students", "assignments", "closed", "open",
+                                       "weekend_share", "mean_missing", "students_missing_2",
+                                       "mean_time"]).set_index("course")
+
+
+def cross_course_state(states: dict) -> SubmissionState:
+    """All courses merged; a student with the same name in several courses counts once."""
+    return merge_states(*states.values())
+
+
+# -----------------------
+# Timing
+# -----------------------
+
+def time_workers(courses: int = 200, rows: int = 2_000, workers=(1, None), seed: int = 0, workdir=None) -> list:
+    """
+    Generate `courses` synthetic logs of `rows` PRs and time aggregate_courses
+    with each number of workers (None = all cores). Returns one dict per run
+    with workers, seconds and speedup (relative to the first run).
+    """
+    results = []
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for course in range(courses):
+            generate_log(Path(tmp) / f"course_{course:04d}.txt", rows, seed=seed + course)
+        for count in workers:
+            started = time.perf_counter()
+            aggregate_courses(tmp, workers=count)
+            seconds = time.perf_counter() - started
+            results.append({"workers": count or os.cpu_count(), "seconds": seconds,
+                            "speedup": results[0]["seconds"] / seconds if results else 1.0})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate a directory of course submission logs in parallel.")
+    parser.add_argument("logs", nargs="?", help="directory with one subjects.txt-style log per course")
+    parser.add_argument("--pattern", default="**/*.txt")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--output", default="course_report.csv")
+    parser.add_argument("--synthetic", type=int, metavar="COURSES",
+                        help="instead of reading logs, time 1 worker against --workers on this many generated courses")
+    parser.add_argument("--rows", type=int, default=2_000, help="PRs per generated course (with --synthetic)")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        for result in time_workers(args.synthetic, args.rows, workers=(1, args.workers)):
+            print(f"{result['workers']:3d} workers: {result['seconds']:.2f} s ({result['speedup']:.2f}x)")
+        return
+    if not args.logs:
+        parser.error("the logs directory is required (or use --synthetic)")
+
+    started = time.perf_counter()
+    states = aggregate_courses(args.logs, args.pattern, args.workers)
+    report = course_report(states)
+    report.to_csv(args.output)
+    total = _summary(cross_course_state(states))
+    elapsed = time.perf_counter() - started
+
+    print(f"{len(states)} courses, {total['rows']} submissions, {total['students']} students "
+          f"in {elapsed:.2f} s with {args.workers or os.cpu_count()} workers")
+    print(f"Closed: {total['closed']}  Open: {total['open']}  Weekend share: {total['weekend_share']:.1%}  "
+          f"Mean submission time: {total['mean_time'] or '-'}")
+    print(f"Per-course report written to: {args.output}")
+
+if __name__ == "__main__":
+    main()
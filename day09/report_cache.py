@@ -0,0 +1,121 @@
+"""
+Typed Parquet cache for assignment_submission_report.xlsx.
+
+Parsing the xlsx with openpyxl is by far the slowest step of the analysis.
+The first load writes the parsed table (datetimes already converted, text
+columns as categoricals) to <report>.cache.parquet next to the workbook;
+later loads read the Parquet file instead, which takes milliseconds. The
+cache stores the size, mtime and SHA-256 of the workbook in the Parquet
+metadata: size+mtime are checked first, the hash only if they changed, and
+the cache is rebuilt as soon as the content differs.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+CACHE_VERSION = 1
+META_KEY = b"report_cache"
+DATE_COLUMNS = ("deadline", "submission_datetime")
+CATEGORY_COLUMNS = ("assignment_number", "student_name", "submission_status")
+
+
+def cache_path_for(path) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + ".cache.parquet")
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_stamp(path) -> dict:
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_report_excel(path) -> pd.DataFrame:
+    """Read the workbook and convert the columns to their real types."""
+    df = pd.read_excel(path)
+    for column in DATE_COLUMNS:
+        if column in df:
+            df[column] = pd.to_datetime(df[column])
+    for column in CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _read_meta(cache: Path):
+    import pyarrow.parquet as pq
+
+    try:
+        metadata = pq.read_schema(cache).metadata or {}
+        return json.loads(metadata[META_KEY])
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache: Path, meta: dict):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[META_KEY] = json.dumps(meta).encode("utf-8")
+    tmp = cache.with_name(cache.name + ".tmp")
+    pq.write_table(table.replace_schema_metadata(metadata), tmp)
+    os.replace(tmp, cache)
+
+
+def _is_fresh(path, cache: Path):
+    """Return (fresh, meta). Re-stamps the cache if only the mtime changed."""
+    if not cache.exists():
+        return False, None
+    meta = _read_meta(cache)
+    if not meta or meta.get("version") != CACHE_VERSION:
+        return False, None
+    stamp = _source_stamp(path)
+    if meta.get("size") == stamp["size"] and meta.get("mtime_ns") == stamp["mtime_ns"]:
+        return True, meta
+    if meta.get("sha256") != file_sha256(path):
+        return False, None
+    meta.update(stamp)
+    return True, meta
+
+
+def load_report(path="assignment_submission_report.xlsx", use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load the submissions report with parsed datetimes, from the Parquet cache
+    when it matches the workbook. Without pyarrow it just reads the workbook.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        use_cache = False
+    if not use_cache:
+        return read_report_excel(path)
+
+    cache = cache_path_for(path)
+    fresh, meta = _is_fresh(path, cache)
+    if fresh:
+        df = pd.read_parquet(cache)
+        if meta != _read_meta(cache):
+            # Same content, only touched: store the new stamp so the hash is skipped next time
+            _write_cache(df, cache, meta)
+        return df
+
+    df = read_report_excel(path)
+    meta = {"version": CACHE_VERSION, "sha256": file_sha256(path)}
+    meta.update(_source_stamp(path))
+    try:
+        _write_cache(df, cache, meta)
+    except OSError as error:
+        print(f"Warning: could not write report cache ({error}).")
+    return df
@@ -0,0 +1,170 @@
+"""
+Streaming Excel export of the analysis results.
+
+pd.ExcelWriter builds the whole workbook as openpyxl cell objects before it
+saves anything, which for a million-row sheet is several GB of memory. Here
+the workbook is opened in openpyxl's write-only mode: every sheet is written
+row by row from chunks of the DataFrame, and each finished sheet goes
+straight to a temporary file, so memory stays at about one chunk no matter
+how many rows are exported. Each sheet can also be saved as a CSV or Parquet
+file next to the workbook. The charts are drawn with matplotlib's Agg
+backend in a worker process while the sheets are being written, and are
+added to a last "Charts" sheet.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+CHUNK_ROWS = 50_000
+MAX_SHEET_ROWS = 1_048_576  # Excel's limit, including the header row
+SIDECAR_FORMATS = ("csv", "parquet")
+
+
+# -----------------------
+# Sheets
+# -----------------------
+
+def _as_frame(data, index: bool) -> pd.DataFrame:
+    """Series/DataFrame -> DataFrame with the index as ordinary leading columns when `index`."""
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    if index:
+        frame = frame.reset_index()
+    return frame
+
+
+def _python_rows(chunk: pd.DataFrame):
+    """Rows of plain Python values; NaN/NaT become empty cells."""
+    columns = []
+    for _, column in chunk.items():
+        values = column.astype(object)
+        columns.append(values.where(column.notna(), None).tolist())
+    return zip(*columns)
+
+
+def write_sheets(workbook: Workbook, name: str, frame: pd.DataFrame, chunk_rows: int = CHUNK_ROWS) -> list:
+    """
+    Append `frame` to write-only sheet(s) called `name`. A frame longer than
+    Excel allows continues on name_2, name_3, ... Returns the sheet names.
+    """
+    header = [str(column) for column in frame.columns]
+    rows_per_sheet = MAX_SHEET_ROWS - 1
+    names = []
+    for sheet_start in range(0, max(len(frame), 1), rows_per_sheet):
+        sheet_name = name if not names else f"{name}_{len(names) + 1}"
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(header)
+        sheet_end = min(sheet_start + rows_per_sheet, len(frame))
+        for start in range(sheet_start, sheet_end, chunk_rows):
+            for row in _python_rows(frame.iloc[start:min(start + chunk_rows, sheet_end)]):
+                sheet.append(row)
+        names.append(sheet_name)
+    return names
+
+
+def write_sidecar(frame: pd.DataFrame, path: Path, fmt: str, chunk_rows: int = CHUNK_ROWS):
+    """Save one sheet as CSV or Parquet, chunk by chunk."""
+    if fmt == "csv":
+        frame.to_csv(path, index=False, chunksize=chunk_rows)
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Types from the whole frame: an object column that is empty in the first chunk
+        # would otherwise get the null type
+        schema = pa.Schema.from_pandas(frame, preserve_index=False)
+        with pq.ParquetWriter(path, schema) as writer:
+            for start in range(0, len(frame), chunk_rows):
+                chunk = frame.iloc[start:start + chunk_rows]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    else:
+        raise ValueError(f"Unknown sidecar format {fmt!r}, expected one of {SIDECAR_FORMATS}")
+
+
+# -----------------------
+# Charts
+# -----------------------
+
+def render_chart(series: pd.Series, kind: str, title: str, path, ylabel: str = "") -> str:
+    """Draw a bar or pie chart of `series` to a PNG file (runs in the worker process)."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    if kind == "pie":
+        series.plot(kind="pie", autopct="%1.1f%%", ax=ax)
+    else:
+        series.plot(kind=kind, ax=ax)
+    ax.set_title(title)
+    ax.set_ylabel(ylabel)
+    fig.savefig(path, dpi=100, bbox_inches="tight")
+    plt.close(fig)
+    return str(path)
+
+
+def _add_charts(workbook: Workbook, paths: list):
+    try:
+        from openpyxl.drawing.image import Image
+    except ImportError:
+        return
+    sheet = workbook.create_sheet("Charts")
+    for number, path in enumerate(paths):
+        try:
+            image = Image(path)
+        except ImportError:  # openpyxl needs Pillow for images; the PNG files are still there
+            return
+        sheet.add_image(image, f"A{1 + 25 * number}")
+
+
+# -----------------------
+# Report
+# -----------------------
+
+def write_report(path, sheets: dict, charts: dict = None, sidecars=(), chunk_rows: int = CHUNK_ROWS) -> dict:
+    """
+    Write an .xlsx report with constant memory.
+
+    sheets:   sheet name -> DataFrame/Series, or (DataFrame/Series, index) to
+              choose whether the index is written (default: only for Series).
+    charts:   file stem -> dict(series=..., kind="bar"|"pie", title=..., ylabel=...);
+              saved as <report>_<stem>.png and shown on a "Charts" sheet.
+    sidecars: "csv" and/or "parquet": also save every sheet as <report>_<sheet>.<fmt>.
+
+    Returns {"sheets": [...], "charts": [...], "sidecars": [...]} with what was written.
+    """
+    path = Path(path)
+    for fmt in sidecars:
+        if fmt not in SIDECAR_FORMATS:
+            raise ValueError(f"Unknown sidecar format {fmt!r}, expected one of {SIDECAR_FORMATS}")
+    written = {"sheets": [], "charts": [], "sidecars": []}
+
+    executor = ProcessPoolExecutor(max_workers=1) if charts else None
+    try:
+        futures = [
+            executor.submit(render_chart, spec["series"], spec.get("kind", "bar"), spec.get("title", ""),
+                            path.with_name(f"{path.stem}_{stem}.png"), spec.get("ylabel", ""))
+            for stem, spec in (charts or {}).items()
+        ]
+
+        workbook = Workbook(write_only=True)
+        for name, data in sheets.items():
+            data, index = data if isinstance(data, tuple) else (data, isinstance(data, pd.Series))
+            frame = _as_frame(data, index)
+            written["sheets"] += write_sheets(workbook, name, frame, chunk_rows)
+            for fmt in sidecars:
+                sidecar = path.with_name(f"{path.stem}_{name}.{fmt}")
+                write_sidecar(frame, sidecar, fmt, chunk_rows)
+                written["sidecars"].append(str(sidecar))
+
+        written["charts"] = [future.result() for future in futures]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if written["charts"]:
+        _add_charts(workbook, written["charts"])
+    workbook.save(path)
+    return written
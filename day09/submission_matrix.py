@@ -0,0 +1,132 @@
+"""
+Student x assignment submission matrix, one bit per cell.
+
+Built in one pass over the submissions table: `done` has a bit set where the
+student has a Closed submission for the assignment, `late` where even the
+first Closed submission came after the assignment's deadline. Each row is packed
+into bytes (np.packbits layout), so 50,000 students x 500 assignments take
+about 3 MB per matrix. Missing counts, "missing at least k" lists and
+completion rates are then popcounts and column sums over these bytes.
+"""
+import numpy as np
+import pandas as pd
+
+# Number of set bits of every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _set_bits(packed: np.ndarray, rows: np.ndarray, columns: np.ndarray):
+    """Set bit (row, column) of a packed matrix for every pair (packbits order: MSB first)."""
+    bits = (np.uint8(0x80) >> (columns & 7).astype(np.uint8)).astype(np.uint8)
+    np.bitwise_or.at(packed, (rows, columns >> 3), bits)
+
+
+class SubmissionMatrix:
+    """Packed `done` and `late` bit matrices with student and assignment labels."""
+
+    def __init__(self, students, assignments, done: np.ndarray, late: np.ndarray):
+        # Plain indexes, also when the table had categorical columns
+        self.students = pd.Index(np.asarray(students), name="student_name")
+        self.assignments = pd.Index(np.asarray(assignments), name="assignment_number")
+        self.done = done
+        self.late = late
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, assignments=None) -> "SubmissionMatrix":
+        """
+        Build from a submissions table (student_name, assignment_number,
+        submission_status, submission_datetime and optionally deadline).
+        By default the assignments are the ones that occur in the table (as
+        in the notebook, also those that only occur in rows without a student).
+        """
+        if assignments is None:
+            assignment_codes, assignments = pd.factorize(df["assignment_number"], sort=True)
+        else:
+            assignments = pd.Index(assignments)
+            assignment_codes = assignments.get_indexer(df["assignment_number"])
+        student_codes, students = pd.factorize(df["student_name"], sort=True)
+        width = (len(assignments) + 7) // 8
+        done = np.zeros((len(students), width), dtype=np.uint8)
+        late = np.zeros((len(students), width), dtype=np.uint8)
+
+        known = (assignment_codes >= 0) & (student_codes >= 0)
+        closed = known & (df["submission_status"] == "Closed").to_numpy()
+        rows = student_codes[closed].astype(np.int64)
+        columns = assignment_codes[closed].astype(np.int64)
+        _set_bits(done, rows, columns)
+
+        if "deadline" in df:
+            times = df["submission_datetime"].to_numpy()[closed]
+            deadlines = df["deadline"].to_numpy()[closed]
+            # A cell is late when none of its Closed submissions was on time, i.e. the
+            # first one came after the deadline; no sorting needed. Cells without a
+            # deadline (NaT) are never late.
+            has_deadline = ~np.isnat(deadlines)
+            on_time = np.zeros_like(done)
+            _set_bits(late, rows[has_deadline], columns[has_deadline])
+            in_time = has_deadline & (times <= deadlines)
+            _set_bits(on_time, rows[in_time], columns[in_time])
+            late &= ~on_time
+
+        return cls(students, assignments, done, late)
+
+    # -----------------------
+    # Cells
+    # -----------------------
+
+    def _bit(self, packed: np.ndarray, student: str, assignment: str) -> bool:
+        row = self.students.get_loc(student)
+        column = self.assignments.get_loc(assignment)
+        return bool(packed[row, column >> 3] & (0x80 >> (column & 7)))
+
+    def is_done(self, student: str, assignment: str) -> bool:
+        return self._bit(self.done, student, assignment)
+
+    def is_late(self, student: str, assignment: str) -> bool:
+        return self._bit(self.late, student, assignment)
+
+    def to_frame(self, which: str = "done") -> pd.DataFrame:
+        """Dense True/False table of `done` or `late` (for display / export)."""
+        packed = self.done if which == "done" else self.late
+        dense = np.unpackbits(packed, axis=1, count=len(self.assignments)).astype(bool)
+        return pd.DataFrame(dense, index=self.students, columns=self.assignments)
+
+    # -----------------------
+    # Reductions
+    # -----------------------
+
+    def completed_counts(self) -> pd.Series:
+        return pd.Series(_POPCOUNT[self.done].sum(axis=1, dtype=np.int64), index=self.students)
+
+    def missing_counts(self) -> pd.Series:
+        """student -> number of assignments without a Closed submission."""
+        return len(self.assignments) - self.completed_counts()
+
+    def students_missing_at_least(self, k: int) -> list:
+        missing = self.missing_counts()
+        return missing[missing >= k].index.tolist()
+
+    def students_complete(self) -> list:
+        missing = self.missing_counts()
+        return missing[missing == 0].index.tolist()
+
+    def late_counts(self) -> pd.Series:
+        return pd.Series(_POPCOUNT[self.late].sum(axis=1, dtype=np.int64), index=self.students)
+
+    def _column_sums(self, packed: np.ndarray) -> np.ndarray:
+        # One pass per bit position: bit b of byte column j is assignment 8 * j + b
+        sums = np.zeros(packed.shape[1] * 8, dtype=np.int64)
+        for bit in range(8):
+            sums[bit::8] = ((packed >> np.uint8(7 - bit)) & np.uint8(1)).sum(axis=0, dtype=np.int64)
+        return sums[:len(self.assignments)]
+
+    def completion_rates(self) -> pd.Series:
+        """assignment -> share of students with a Closed submission."""
+        counts = self._column_sums(self.done)
+        return pd.Series(counts / max(len(self.students), 1), index=self.assignments)
+
+    def late_rates(self) -> pd.Series:
+        """assignment -> share of completed submissions that were late."""
+        done = self._column_sums(self.done)
+        late = self._column_sums(self.late)
+        return pd.Series(np.divide(late, done, out=np.zeros(len(done)), where=done > 0), index=self.assignments)
@@ -0,0 +1,228 @@
+"""
+Incremental aggregates of the submissions, saved as a small JSON checkpoint.
+
+Instead of recomputing the analysis from the full history, the state keeps
+only what the analysis needs (counts, per-student sums, weekday tallies)
+plus the highest PR number already merged. Updating it with new PRs costs
+O(new rows), and two states (e.g. of two log files) merge by adding them up.
+PRs that are still Open are kept with their (student, assignment) pairs, so
+a later refresh also reads them again and moves them to Closed once graded.
+"""
+import argparse
+import json
+import math
+import os
+from collections import Counter
+from datetime import time
+
+from submissions import LINE_RE, iter_submissions
+
+WEEKEND_DAYS = (4, 5)  # Friday and Saturday, as in assignment_analysis.ipynb
+SECONDS_PER_DAY = 24 * 3600
+
+
+def _empty_student() -> dict:
+    return {"count": 0, "closed": set(), "sin": 0.0, "cos": 0.0, "hours": [0] * 24}
+
+
+def circular_time(sin: float, cos: float) -> time:
+    """Time of day (to the minute) of the mean angle with these sin / cos sums."""
+    angle = math.atan2(sin, cos) % (2 * math.pi)
+    seconds = int(round(angle / (2 * math.pi) * SECONDS_PER_DAY)) % SECONDS_PER_DAY
+    return time(seconds // 3600, (seconds % 3600) // 60)
+
+
+class SubmissionState:
+    """Aggregates of all submissions merged so far (see the module docstring)."""
+
+    def __init__(self):
+        self.last_pr = 0
+        self.rows = 0
+        self.status_counts = Counter()
+        self.weekday_counts = [0] * 7
+        self.assignments = set()
+        self.students = {}
+        self.open_prs = {}  # PR number -> [(student, assignment), ...] still Open
+
+    # -----------------------
+    # Updating
+    # -----------------------
+
+    def add(self, record: dict):
+        """Merge one submission row (as yielded by submissions.iter_submissions)."""
+        submitted = record["submission_datetime"]
+        self.last_pr = max(self.last_pr, record["pr_number"])
+        self.rows += 1
+        self.status_counts[record["submission_status"]] += 1
+        self.weekday_counts[submitted.weekday()] += 1
+        self.assignments.add(record["assignment_number"])
+
+        student = self.students.setdefault(record["student_name"], _empty_student())
+        student["count"] += 1
+        if record["submission_status"] == "Closed":
+            student["closed"].add(record["assignment_number"])
+        else:
+            self.open_prs.setdefault(record["pr_number"], []).append(
+                (record["student_name"], record["assignment_number"]))
+        # Time of day as an angle, so 23:50 and 00:10 average to midnight and not to noon
+        seconds = submitted.hour * 3600 + submitted.minute * 60 + submitted.second
+        angle = 2 * math.pi * seconds / SECONDS_PER_DAY
+        student["sin"] += math.sin(angle)
+        student["cos"] += math.cos(angle)
+        student["hours"][submitted.hour] += 1
+
+    def close(self, pr: int):
+        """Move an Open PR that has been closed since it was merged from Open to Closed."""
+        for name, assignment in self.open_prs.pop(pr, []):
+            self.status_counts["Open"] -= 1
+            self.status_counts["Closed"] += 1
+            self.students[name]["closed"].add(assignment)
+
+    def update(self, records) -> int:
+        """
+        Merge the records with a PR number above last_pr, and close the merged
+        Open PRs whose records are now Closed. Returns how many rows were merged.
+        """
+        last_pr = self.last_pr
+        merged = 0
+        for record in records:
+            if record["pr_number"] > last_pr:
+                self.add(record)
+                merged += 1
+            elif record["submission_status"] == "Closed" and record["pr_number"] in self.open_prs:
+                self.close(record["pr_number"])
+        return merged
+
+    def update_from_file(self, path, newest_first: bool = True) -> int:
+        """
+        Merge the new PRs of a subjects.txt file and the status changes of the
+        merged PRs that were still Open. The export lists the newest PR first,
+        so reading stops below both last_pr and the oldest Open PR.
+        """
+        last_pr = self.last_pr
+        open_prs = set(self.open_prs)
+        oldest_open = min(open_prs, default=last_pr + 1)
+
+        def new_lines(file):
+            for line in file:
+                if not LINE_RE.match(line):
+                    continue
+                pr = int(line.split("\t", 1)[0])
+                if pr > last_pr or pr in open_prs:
+                    yield line
+                elif newest_first and pr < oldest_open:
+                    return
+
+        with open(path, "r", encoding="utf-8-sig") as file:
+            return self.update(iter_submissions(new_lines(file)))
+
+    # -----------------------
+    # Results (same questions as assignment_analysis.ipynb)
+    # -----------------------
+
+    def missing_counts(self) -> dict:
+        """student -> number of assignments without a closed submission."""
+        total = len(self.assignments)
+        return {name: total - len(s["closed"]) for name, s in self.students.items()}
+
+    def average_times(self) -> dict:
+        """student -> circular mean time of day of their submissions."""
+        return {name: circular_time(s["sin"], s["cos"]) for name, s in self.students.items()}
+
+    def mean_time(self):
+        """Circular mean time of day of all submissions (None without any)."""
+        if not self.rows:
+            return None
+        return circular_time(sum(s["sin"] for s in self.students.values()),
+                             sum(s["cos"] for s in self.students.values()))
+
+    def mode_hours(self) -> dict:
+        """student -> hour of the day with the most submissions."""
+        return {name: max(range(24), key=s["hours"].__getitem__) for name, s in self.students.items()}
+
+    def weekend_counts(self) -> dict:
+        weekend = sum(self.weekday_counts[day] for day in WEEKEND_DAYS)
+        return {"Weekend (Fri+Sat)": weekend, "Weekday": sum(self.weekday_counts) - weekend}
+
+    # -----------------------
+    # Persistence
+    # -----------------------
+
+    def to_dict(self) -> dict:
+        students = {name: dict(s, closed=sorted(s["closed"])) for name, s in self.students.items()}
+        return {
+            "last_pr": self.last_pr,
+            "rows": self.rows,
+            "status_counts": dict(self.status_counts),
+            "weekday_counts": self.weekday_counts,
+            "assignments": sorted(self.assignments),
+            "students": students,
+            "open_prs": {str(pr): [list(pair) for pair in pairs] for pr, pairs in self.open_prs.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SubmissionState":
+        state = cls()
+        state.last_pr = data["last_pr"]
+        state.rows = data["rows"]
+        state.status_counts = Counter(data["status_counts"])
+        state.weekday_counts = list(data["weekday_counts"])
+        state.assignments = set(data["assignments"])
+        state.students = {name: dict(s, closed=set(s["closed"]), hours=list(s["hours"]))
+                          for name, s in data["students"].items()}
+        # Checkpoints written before Open PRs were tracked have none
+        state.open_prs = {int(pr): [tuple(pair) for pair in pairs]
+                          for pr, pairs in data.get("open_prs", {}).items()}
+        return state
+
+    def save(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path) -> "SubmissionState":
+        """Load a checkpoint, or start empty if there is none yet."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as file:
+            return cls.from_dict(json.load(file))
+
+
+def merge_states(*states) -> SubmissionState:
+    """Combine states built from disjoint sets of PRs (e.g. different log files)."""
+    merged = SubmissionState()
+    for state in states:
+        merged.last_pr = max(merged.last_pr, state.last_pr)
+        merged.rows += state.rows
+        merged.status_counts.update(state.status_counts)
+        merged.weekday_counts = [a + b for a, b in zip(merged.weekday_counts, state.weekday_counts)]
+        merged.assignments |= state.assignments
+        for pr, pairs in state.open_prs.items():
+            merged.open_prs.setdefault(pr, []).extend(pairs)
+        for name, s in state.students.items():
+            target = merged.students.setdefault(name, _empty_student())
+            target["count"] += s["count"]
+            target["closed"] |= s["closed"]
+            target["sin"] += s["sin"]
+            target["cos"] += s["cos"]
+            target["hours"] = [a + b for a, b in zip(target["hours"], s["hours"])]
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge new PRs of subjects.txt into a saved analysis state.")
+    parser.add_argument("subjects", nargs="?", default="subjects.txt")
+    parser.add_argument("state", nargs="?", default="submission_state.json")
+    args = parser.parse_args()
+
+    state = SubmissionState.load(args.state)
+    merged = state.update_from_file(args.subjects)
+    state.save(args.state)
+    print(f"Merged {merged} new rows (last PR #{state.last_pr}, {state.rows} rows in total).")
+    print(f"Status: {dict(state.status_counts)}  {state.weekend_counts()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Average and most common submission time of day per student, vectorised.
+
+Times of day are handled as integer seconds since midnight. The average is
+a circular mean (each time is a point on a 24-hour clock, the mean is the
+direction of the sum of the sin/cos components), so 23:50 and 00:10 average
+to 00:00 instead of 12:00. The mode is the fullest bin of a histogram of the
+times (one-hour bins by default). Every step is a bincount or a sort over
+whole arrays, so a million submissions take a fraction of a second.
+"""
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+def seconds_of_day(datetimes) -> np.ndarray:
+    """Seconds since midnight of every value of a datetime Series/array (int64)."""
+    values = np.asarray(pd.to_datetime(datetimes), dtype="datetime64[s]").astype(np.int64)
+    return values % SECONDS_PER_DAY
+
+
+def to_time(seconds: int) -> time:
+    seconds = int(seconds) % SECONDS_PER_DAY
+    return time(seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+
+
+def circular_mean_seconds(codes: np.ndarray, seconds: np.ndarray, groups: int) -> np.ndarray:
+    """Circular mean time of day (seconds) of each group; codes[i] is the group of row i."""
+    angle = seconds * (2 * np.pi / SECONDS_PER_DAY)
+    sin_sum = np.bincount(codes, weights=np.sin(angle), minlength=groups)
+    cos_sum = np.bincount(codes, weights=np.cos(angle), minlength=groups)
+    mean_angle = np.mod(np.arctan2(sin_sum, cos_sum), 2 * np.pi)
+    return np.rint(mean_angle * (SECONDS_PER_DAY / (2 * np.pi))).astype(np.int64) % SECONDS_PER_DAY
+
+
+def mode_bin_seconds(codes: np.ndarray, seconds: np.ndarray, groups: int, bin_seconds: int = 3600) -> np.ndarray:
+    """
+    Start (seconds) of the fullest histogram bin of each group; ties go to the
+    earlier bin. Uses one sort of (group, bin) keys, so memory does not depend
+    on the number of bins.
+    """
+    bins_per_day = -(-SECONDS_PER_DAY // bin_seconds)
+    keys = codes.astype(np.int64) * bins_per_day + seconds // bin_seconds
+    unique_keys, counts = np.unique(keys, return_counts=True)
+    key_groups, key_bins = np.divmod(unique_keys, bins_per_day)
+    # Sort by group, then most submissions first, then earliest bin
+    order = np.lexsort((key_bins, -counts, key_groups))
+    first = np.unique(key_groups[order], return_index=True)[1]
+    result = np.full(groups, -1, dtype=np.int64)
+    result[key_groups[order][first]] = key_bins[order][first] * bin_seconds
+    return result
+
+
+def submission_time_stats(df: pd.DataFrame, by: str = "student_name", column: str = "submission_datetime",
+                          bin_seconds: int = 3600) -> pd.DataFrame:
+    """
+    One row per student with average_time (circular mean), mode_time (start of
+    the fullest `bin_seconds` bin) and the number of submissions.
+    """
+    present = df[column].notna() & df[by].notna()
+    codes, names = pd.factorize(df.loc[present, by], sort=True)
+    seconds = seconds_of_day(df.loc[present, column])
+    groups = len(names)
+
+    average = circular_mean_seconds(codes, seconds, groups)
+    mode = mode_bin_seconds(codes, seconds, groups, bin_seconds)
+    return pd.DataFrame(
+        {
+            "average_time": [to_time(s) for s in average.tolist()],
+            "mode_time": [to_time(s) for s in mode.tolist()],
+            "submissions": np.bincount(codes, minlength=groups),
+        },
+        index=pd.Index(names, name=by),
+    )
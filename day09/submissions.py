@@ -0,0 +1,251 @@
+"""
+Parse subjects.txt (the exported pull-request list) into a submissions table.
+
+Every PR line is
+    <PR number> TAB <OPEN|CLOSED> TAB <title> TAB <empty> TAB <ISO timestamp>
+and the file ends with one free-text line listing the deadlines, e.g.
+    Day01 Dead-line: 2025.11.02 22:00 ... Final Project proposal dead-line: 2026.01.11 22:00
+Titles are typed by hand ("Day01 by Noya Levy", "day 1 Lior Batat",
+"day03-Rachel Steinitz Eliyahu", "Day 05 and 06 by Einav Litvak"), so the
+assignments and the student name are pulled out with compiled patterns.
+A PR that mentions several assignments gives one row per assignment.
+"""
+import argparse
+import re
+from datetime import datetime
+
+import pandas as pd
+
+
+# -----------------------
+# Patterns
+# -----------------------
+
+LINE_RE = re.compile(r"^(?P<pr>\d+)\t(?P<status>OPEN|CLOSED)\t(?P<title>[^\t]*)\t[^\t]*\t(?P<timestamp>\S+)\s*$")
+
+# One assignment at the start of a title (or of a deadline label)
+ASSIGNMENT_RE = re.compile(
+    r"\s*(?:day\s*0*(?P<day>\d{1,2})"
+    r"|(?P<fp>final\s+project\s+(?P<kind>proposal|submission)|proposal\s+for\s+(?:the\s+)?final\s+project))",
+    re.IGNORECASE,
+)
+# A further assignment: "and Day04", "and 06", ", proposal for final project"
+MORE_RE = re.compile(r"\s*(?:and|&|,|\+)\s*(?:(?P<bare>0*\d{1,2})\b|(?=\S))", re.IGNORECASE)
+# Between the assignments and the name: "by", "-", ":" or just a space
+NAME_SEPARATOR_RE = re.compile(r"\s*(?:\bby\b|[-:–])?\s*", re.IGNORECASE)
+
+DEADLINE_RE = re.compile(
+    r"(?P<label>day\s*\d{1,2}|final\s+project\s+(?:proposal|submission))\s+dead-?line:\s*"
+    r"(?P<when>\d{4}\.\d{2}\.\d{2}\s+\d{1,2}:\d{2})",
+    re.IGNORECASE,
+)
+
+STATUS_NAMES = {"OPEN": "Open", "CLOSED": "Closed"}
+COLUMNS = ["pr_number", "assignment_number", "deadline", "student_name", "submission_status",
+           "submission_datetime"]
+
+
+def _assignment_key(match) -> str:
+    if match.group("day"):
+        return f"Day{int(match.group('day')):02d}"
+    kind = (match.group("kind") or "proposal").upper()
+    return f"FP_{kind}"
+
+
+def assignment_order(key: str):
+    """Sort key: Day01, Day02, ... before FP_PROPOSAL, FP_SUBMISSION."""
+    if key.startswith("Day"):
+        return (0, int(key[3:]), key)
+    return (1, 0 if key == "FP_PROPOSAL" else 1, key)
+
+
+def normalize_name(name: str) -> str:
+    """
+    Collapse whitespace, turn hyphens into spaces and capitalise all-lowercase
+    words, since the same student writes "Noya Levy" and "noya levy".
+    """
+    words = name.replace("-", " ").split()
+    return " ".join(w[:1].upper() + w[1:] if w.islower() else w for w in words)
+
+
+def parse_title(title: str):
+    """
+    Split a PR title into (assignments, student_name).
+    Returns ([], None) when the title names no assignment.
+    """
+    match = ASSIGNMENT_RE.match(title)
+    if not match:
+        return [], None
+    assignments = [_assignment_key(match)]
+    position = match.end()
+    while True:
+        more = MORE_RE.match(title, position)
+        if not more:
+            break
+        if more.group("bare"):
+            assignments.append(f"Day{int(more.group('bare')):02d}")
+            position = more.end()
+            continue
+        following = ASSIGNMENT_RE.match(title, more.end())
+        if not following:
+            break
+        assignments.append(_assignment_key(following))
+        position = following.end()
+
+    position = NAME_SEPARATOR_RE.match(title, position).end()
+    name = normalize_name(title[position:])
+    return list(dict.fromkeys(assignments)), (name or None)
+
+
+def parse_deadlines(text: str) -> dict:
+    """assignment key -> deadline (naive datetime) for every 'X dead-line: YYYY.MM.DD HH:MM' in text."""
+    deadlines = {}
+    for match in DEADLINE_RE.finditer(text):
+        label = ASSIGNMENT_RE.match(match.group("label"))
+        when = datetime.strptime(" ".join(match.group("when").split()), "%Y.%m.%d %H:%M")
+        deadlines[_assignment_key(label)] = when
+    return deadlines
+
+
+# -----------------------
+# Streaming parser
+# -----------------------
+
+def iter_submissions(lines, deadlines=None, skipped=None):
+    """
+    Yield one dict per (PR, assignment) from an iterable of lines, without
+    reading the whole file. Lines that are not PR lines are checked for
+    deadlines (added to the `deadlines` dict if given); PR lines whose title
+    names no assignment are appended to `skipped` if given.
+    """
+    for line in lines:
+        match = LINE_RE.match(line)
+        if not match:
+            if deadlines is not None and "dead" in line.lower():
+                deadlines.update(parse_deadlines(line))
+            continue
+        assignments, student = parse_title(match.group("title"))
+        if not assignments:
+            if skipped is not None:
+                skipped.append(line.rstrip("\n"))
+            continue
+        # ISO timestamps in UTC ("Z"); stored as naive UTC like the original report
+        submitted = datetime.fromisoformat(match.group("timestamp").replace("Z", ""))
+        for assignment in assignments:
+            yield {
+                "pr_number": int(match.group("pr")),
+                "assignment_number": assignment,
+                "student_name": student,
+                "submission_status": STATUS_NAMES[match.group("status")],
+                "submission_datetime": submitted,
+            }
+
+
+def read_deadlines(path) -> dict:
+    """Deadlines listed anywhere in the file (one pass, line by line)."""
+    deadlines = {}
+    with open(path, "r", encoding="utf-8-sig") as file:
+        for line in file:
+            if not LINE_RE.match(line) and "dead" in line.lower():
+                deadlines.update(parse_deadlines(line))
+    return deadlines
+
+
+def to_frame(records, deadlines: dict) -> pd.DataFrame:
+    """Submissions as a DataFrame with categorical assignment, student and status columns."""
+    df = pd.DataFrame.from_records(list(records), columns=[c for c in COLUMNS if c != "deadline"])
+    df["pr_number"] = df["pr_number"].astype("int64")
+    df["submission_datetime"] = pd.to_datetime(df["submission_datetime"])
+    df["deadline"] = pd.to_datetime(df["assignment_number"].map(deadlines))
+
+    assignments = sorted(set(df["assignment_number"]) | set(deadlines), key=assignment_order)
+    df["assignment_number"] = pd.Categorical(df["assignment_number"], categories=assignments, ordered=True)
+    df["student_name"] = df["student_name"].astype("category")
+    df["submission_status"] = pd.Categorical(df["submission_status"], categories=["Open", "Closed"])
+    return df[COLUMNS]
+
+
+def iter_frames(path, deadlines: dict, chunk_size: int = 100_000):
+    """
+    Parse subjects.txt `chunk_size` rows at a time and yield every chunk as a
+    to_frame DataFrame, so only one chunk of record dicts is in memory.
+    """
+    chunk = []
+    with open(path, "r", encoding="utf-8-sig") as file:
+        for record in iter_submissions(file):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield to_frame(chunk, deadlines)
+                chunk.clear()
+    if chunk:
+        yield to_frame(chunk, deadlines)
+
+
+def concat_frames(frames, deadlines: dict) -> pd.DataFrame:
+    """Join to_frame chunks into one table, with the categories to_frame gives a whole file."""
+    frames = list(frames)
+    if not frames:
+        return to_frame([], deadlines)
+    assignments = sorted(set(deadlines).union(*(f["assignment_number"].cat.categories for f in frames)),
+                         key=assignment_order)
+    students = pd.api.types.union_categoricals([f["student_name"] for f in frames], sort_categories=True)
+    df = pd.concat([f.assign(assignment_number=f["assignment_number"].cat.set_categories(assignments),
+                             student_name=pd.Categorical(f["student_name"], categories=students.categories))
+                    for f in frames], ignore_index=True)
+    return df[COLUMNS]
+
+
+def load_submissions(path="subjects.txt", chunk_size: int = 100_000) -> pd.DataFrame:
+    """Parse subjects.txt into a submissions DataFrame, `chunk_size` rows at a time."""
+    deadlines = read_deadlines(path)
+    return concat_frames(iter_frames(path, deadlines, chunk_size), deadlines)
+
+
+# -----------------------
+# Parquet output
+# -----------------------
+
+def parquet_schema():
+    """
+    Fixed Arrow schema of the Parquet file. Each chunk has its own categories,
+    and so its own dictionary index width, so every chunk is cast to this one.
+    """
+    import pyarrow as pa
+
+    labels = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([("pr_number", pa.int64()), ("assignment_number", labels), ("deadline", pa.timestamp("us")),
+                      ("student_name", labels), ("submission_status", labels),
+                      ("submission_datetime", pa.timestamp("us"))])
+
+
+def write_parquet(path, parquet_path, chunk_size: int = 100_000) -> int:
+    """
+    Stream subjects.txt into a Parquet file, `chunk_size` rows per row group,
+    so files of any size are converted with bounded memory. Returns the row count.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    deadlines = read_deadlines(path)
+    schema = parquet_schema()
+    rows = 0
+    with pq.ParquetWriter(parquet_path, schema) as writer:
+        for frame in iter_frames(path, deadlines, chunk_size):
+            # Plain strings, so that the cast encodes them with int32 indices
+            frame = frame.astype({c: object for c in ("assignment_number", "student_name", "submission_status")})
+            writer.write_table(pa.Table.from_pandas(frame, preserve_index=False).cast(schema))
+            rows += len(frame)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert subjects.txt into a Parquet submissions table.")
+    parser.add_argument("subjects", nargs="?", default="subjects.txt")
+    parser.add_argument("output", nargs="?", default="submissions.parquet")
+    args = parser.parse_args()
+    rows = write_parquet(args.subjects, args.output)
+    print(f"{rows} submissions written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
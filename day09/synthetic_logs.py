@@ -0,0 +1,158 @@
+"""
+Generate synthetic submission logs in the subjects.txt format.
+
+The real export has about 215 rows, too few to see how the analysis scales.
+generate_log writes any number of PR lines
+    <PR number> TAB <OPEN|CLOSED> TAB <title> TAB TAB <ISO timestamp>
+newest first, followed by the deadline line, so the file goes through
+submissions.py like the real one. Students, assignments, the share of Closed
+PRs, the share of late submissions and the time-of-day distribution are
+configurable; the titles are written in the same hand-typed variants as in
+subjects.txt ("Day01 by Noya Levy", "day 1 noya levy", "Day 05-Noya Levy").
+Rows are drawn with numpy and written in chunks, so 10 million rows need
+little memory.
+"""
+import argparse
+from datetime import datetime, timedelta
+
+import numpy as np
+
+FIRST_NAMES = [
+    "Achinoam", "Adi", "Adib", "Aileen", "Amit", "Anat", "Ariel", "Avital", "Dana", "Daniel",
+    "Dor", "Einav", "Eitan", "Elad", "Gal", "Guy", "Hadas", "Hallel", "Ido", "Inbar",
+    "Itai", "Keren", "Lior", "Maya", "Michal", "Moran", "Nadav", "Neta", "Noa", "Noya",
+    "Omer", "Ori", "Rachel", "Roni", "Sagi", "Shelly", "Shira", "Shoshana", "Tal", "Tamar",
+    "Uri", "Yael", "Yana", "Yarden", "Yoav", "Yonatan", "Yuval", "Zohar", "Liat", "Ronit",
+]
+LAST_NAMES = [
+    "Azulai", "Batat", "Ben David", "Biton", "Cohen", "Dahan", "Elkayam", "Friedman", "Gabay", "Gilad",
+    "Golan", "Haddad", "Katz", "Klein", "Lerner", "Levi", "Levy", "Litvak", "Malka", "Masharqa",
+    "Mizrahi", "Moses", "Nachum", "Ohana", "Peretz", "Rosen", "Saller", "Sernik", "Shalom", "Shapira",
+    "Shoham", "Steinitz", "Tal", "Vaknin", "Weiss", "Yosef", "Zur", "Avraham", "Barak", "Carmi",
+    "Dayan", "Eliyahu", "Fisher", "Goldberg", "Harel", "Kaplan", "Mor", "Navon", "Ofer", "Segal",
+]
+
+# Title variants seen in subjects.txt; {day} is the day number, {name} the student
+DAY_TITLES = ["Day{day:02d} by {name}", "Day {day} by {name}", "day {day} {name}", "Day {day:02d}-{name}",
+              "day{day:02d} by {lower}", "Day{day:02d} By {name}"]
+PROJECT_TITLES = {"FP_PROPOSAL": "Final Project proposal by {name}",
+                  "FP_SUBMISSION": "Final Project submission by {name}"}
+
+
+# first + last names, then first + two different last names
+MAX_STUDENTS = len(FIRST_NAMES) * len(LAST_NAMES) * len(LAST_NAMES)
+
+
+def student_names(count: int) -> list:
+    """`count` distinct names: first + last name, then first + two last names."""
+    if count > MAX_STUDENTS:
+        raise ValueError(f"At most {MAX_STUDENTS} students are supported")
+    names = [f"{first} {last}" for last in LAST_NAMES for first in FIRST_NAMES]
+    names += [f"{first} {last} {second}" for second in LAST_NAMES for last in LAST_NAMES
+              for first in FIRST_NAMES if last != second]
+    return names[:count]
+
+
+def assignment_schedule(assignments: int, start: datetime, final_project: bool = True) -> dict:
+    """assignment key -> deadline: DayNN one week apart (22:00), then the final project."""
+    first = start.replace(hour=22, minute=0, second=0, microsecond=0)
+    deadlines = {f"Day{day:02d}": first + timedelta(weeks=day - 1) for day in range(1, assignments + 1)}
+    if final_project:
+        last = first + timedelta(weeks=assignments - 1)
+        deadlines["FP_PROPOSAL"] = last + timedelta(days=2)
+        deadlines["FP_SUBMISSION"] = last + timedelta(days=16)
+    return deadlines
+
+
+def deadline_line(deadlines: dict) -> str:
+    """The free-text deadline line at the end of subjects.txt."""
+    parts = []
+    for key, when in deadlines.items():
+        label = {"FP_PROPOSAL": "Final Project proposal dead-line",
+                 "FP_SUBMISSION": "Final Project submission dead-line"}.get(key, f"{key} Dead-line")
+        parts.append(f"{label}: {when:%Y.%m.%d %H:%M}")
+    return " ".join(parts)
+
+
+def _titles(keys: list, names: list, assignment_codes, student_codes, variant_codes) -> list:
+    titles = []
+    for a, s, v in zip(assignment_codes.tolist(), student_codes.tolist(), variant_codes.tolist()):
+        key, name = keys[a], names[s]
+        if key in PROJECT_TITLES:
+            titles.append(PROJECT_TITLES[key].format(name=name))
+        else:
+            titles.append(DAY_TITLES[v].format(day=int(key[3:]), name=name, lower=name.lower()))
+    return titles
+
+
+def generate_log(path, rows: int, students: int = 40, assignments: int = 9, closed_share: float = 0.87,
+                 late_share: float = 0.1, peak_hour: float = 20.0, hour_spread: float = 3.0,
+                 final_project: bool = True, start: datetime = datetime(2025, 11, 2), seed: int = 0,
+                 chunk_rows: int = 100_000) -> dict:
+    """
+    Write a subjects.txt-style log with `rows` PR lines to `path`.
+
+    Each PR is for a random (student, assignment). It is submitted on one of the
+    days before the deadline (more often close to it), or up to a week after
+    it for `late_share` of the PRs; the time of day is normal around
+    `peak_hour` with `hour_spread` hours of spread. `closed_share` of the
+    PRs are CLOSED. Returns the deadlines that were written.
+    """
+    rng = np.random.default_rng(seed)
+    names = student_names(students)
+    deadlines = assignment_schedule(assignments, start, final_project)
+    keys = list(deadlines)
+    deadline_seconds = np.array(list(deadlines.values()), dtype="datetime64[s]").astype(np.int64)
+
+    with open(path, "w", encoding="utf-8", newline="\n") as file:
+        # Newest PR first, as in the export; timestamps are not sorted (as in the export)
+        for chunk_end in range(rows, 0, -chunk_rows):
+            n = min(chunk_rows, chunk_end)
+            pr_numbers = np.arange(chunk_end, chunk_end - n, -1)
+            assignment_codes = rng.integers(0, len(keys), n)
+            student_codes = rng.integers(0, students, n)
+            variant_codes = rng.integers(0, len(DAY_TITLES), n)
+            closed = rng.random(n) < closed_share
+
+            late = rng.random(n) < late_share
+            days = np.where(late, rng.integers(0, 7, n), -np.minimum(rng.geometric(0.35, n) - 1, 6))
+            hours = np.mod(rng.normal(peak_hour, hour_spread, n), 24)
+            day_start = deadline_seconds[assignment_codes] - 22 * 3600 + days * 86400
+            seconds = day_start + (hours * 3600).astype(np.int64)
+            # Move a day so that late PRs come after the deadline and the others before it,
+            # keeping the drawn time of day
+            deadline = deadline_seconds[assignment_codes]
+            seconds += np.where(late & (seconds <= deadline), 86400, 0)
+            seconds -= np.where(~late & (seconds > deadline), 86400, 0)
+            stamps = np.datetime_as_string(seconds.astype("datetime64[s]"), unit="s")
+
+            titles = _titles(keys, names, assignment_codes, student_codes, variant_codes)
+            status = np.where(closed, "CLOSED", "OPEN")
+            file.writelines(f"{pr}\t{state}\t{title}\t\t{stamp}Z\n"
+                            for pr, state, title, stamp in zip(pr_numbers.tolist(), status.tolist(), titles,
+                                                               stamps.tolist()))
+        file.write("\n" + deadline_line(deadlines) + "\n")
+    return deadlines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic subjects.txt-style submission log.")
+    parser.add_argument("path")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--students", type=int, default=40)
+    parser.add_argument("--assignments", type=int, default=9)
+    parser.add_argument("--closed-share", type=float, default=0.87)
+    parser.add_argument("--late-share", type=float, default=0.1)
+    parser.add_argument("--peak-hour", type=float, default=20.0)
+    parser.add_argument("--hour-spread", type=float, default=3.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_log(args.path, args.rows, students=args.students, assignments=args.assignments,
+                 closed_share=args.closed_share, late_share=args.late_share, peak_hour=args.peak_hour,
+                 hour_spread=args.hour_spread, seed=args.seed)
+    print(f"Wrote {args.rows} rows to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
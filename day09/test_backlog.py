@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backlog import backlog_at, backlog_timeline, resample_backlog
+from submissions import load_submissions
+
+T = pd.Timestamp
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["submission_datetime", "closed_at", "deadline", "submission_status"])
+
+
+# Two reviewed PRs (one closed late) and one still open, past its deadline
+ROWS = frame([
+    (T("2025-11-01 10:00"), T("2025-11-03 10:00"), T("2025-11-02 22:00"), "Closed"),
+    (T("2025-11-02 12:00"), T("2025-11-02 20:00"), T("2025-11-02 22:00"), "Closed"),
+    (T("2025-11-04 09:00"), pd.NaT, T("2025-11-02 22:00"), "Open"),
+])
+
+
+def brute_force(df, when):
+    opened = df["submission_datetime"] <= when
+    closed = df["closed_at"] <= when
+    counted = df["closed_at"].notna() | (df["submission_status"] == "Open")
+    is_open = opened & ~closed & counted
+    return int(is_open.sum()), int((is_open & (df["deadline"] <= when)).sum())
+
+
+# -------------------------
+# Tests for backlog_timeline
+# -------------------------
+
+def test_timeline():
+    timeline = backlog_timeline(ROWS, closed="closed_at")
+    assert timeline.index.tolist() == [T("2025-11-01 10:00"), T("2025-11-02 12:00"), T("2025-11-02 20:00"),
+                                       T("2025-11-02 22:00"), T("2025-11-03 10:00"), T("2025-11-04 09:00")]
+    assert timeline["open"].tolist() == [1, 2, 1, 1, 0, 1]
+    assert timeline["overdue"].tolist() == [0, 0, 0, 1, 0, 1]
+
+
+def test_without_close_times():
+    # Only the Open PR can be placed on the timeline; it never closes
+    timeline = backlog_timeline(ROWS)
+    assert timeline.to_dict("list") == {"open": [1], "overdue": [1]}
+
+
+def test_simultaneous_events():
+    rows = frame([(T("2025-11-01"), T("2025-11-02"), pd.NaT, "Closed"),
+                  (T("2025-11-02"), T("2025-11-03"), pd.NaT, "Closed")])
+    timeline = backlog_timeline(rows, closed="closed_at")
+    assert timeline["open"].tolist() == [1, 1, 0]
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    opened = T("2020-01-01") + pd.to_timedelta(rng.integers(0, 3 * 365 * 86400, n), unit="s")
+    df = pd.DataFrame({
+        "submission_datetime": opened,
+        "closed_at": (opened + pd.to_timedelta(rng.exponential(5 * 86400, n), unit="s")).where(rng.random(n) < 0.9),
+        "deadline": (opened + pd.to_timedelta(rng.normal(0, 3 * 86400, n), unit="s")).where(rng.random(n) < 0.95),
+        "submission_status": np.where(rng.random(n) < 0.5, "Open", "Closed"),
+    })
+    timeline = backlog_timeline(df, closed="closed_at")
+    for when in pd.to_datetime(rng.integers(opened.min().value, opened.max().value, 50)):
+        assert tuple(backlog_at(timeline, [when]).iloc[0]) == brute_force(df, when)
+
+
+def test_long_span_falls_back():
+    rows = frame([(T("1700-01-01"), T("2200-01-01"), pd.NaT, "Closed"),
+                  (T("2000-01-01"), T("2000-01-02"), pd.NaT, "Closed")])
+    timeline = backlog_timeline(rows, closed="closed_at")
+    assert timeline["open"].tolist() == [1, 2, 1, 0]
+
+
+def test_real_log():
+    df = load_submissions("subjects.txt")
+    timeline = backlog_timeline(df)
+    # Without closing times the final backlog is the notebook's Open count
+    assert timeline["open"].iloc[-1] == (df["submission_status"] == "Open").sum()
+    assert (timeline["overdue"] <= timeline["open"]).all()
+
+
+# -------------------------
+# Tests for backlog_at / resample_backlog
+# -------------------------
+
+def test_backlog_at_before_first_event():
+    timeline = backlog_timeline(ROWS, closed="closed_at")
+    result = backlog_at(timeline, [T("2025-10-01"), T("2025-11-02 21:00")])
+    assert result.to_dict("list") == {"open": [0, 1], "overdue": [0, 0]}
+
+
+def test_resample_at_and_max():
+    timeline = backlog_timeline(ROWS, closed="closed_at")
+    at = resample_backlog(timeline, "D")
+    assert at.index.tolist() == [T("2025-11-01"), T("2025-11-02"), T("2025-11-03"), T("2025-11-04")]
+    assert at["open"].tolist() == [0, 1, 1, 0]
+    peak = resample_backlog(timeline, "D", how="max")
+    assert peak["open"].tolist() == [1, 2, 1, 1]
+    assert peak["overdue"].tolist() == [0, 1, 1, 1]
+
+
+def test_resample_weekly_includes_first_partial_week():
+    timeline = backlog_timeline(ROWS, closed="closed_at")
+    # 2025-11-01 is a Saturday: its week starts at the Sunday anchor before it
+    peak = resample_backlog(timeline, "W", how="max")
+    assert peak.index.tolist() == [T("2025-10-26"), T("2025-11-02")]
+    assert peak["open"].tolist() == [1, 2]
+    assert peak["overdue"].tolist() == [0, 1]
+
+
+def test_resample_monthly_includes_first_partial_month():
+    timeline = backlog_timeline(ROWS, closed="closed_at")
+    # A span shorter than one period still gets its period
+    peak = resample_backlog(timeline, "MS", how="max")
+    assert peak.index.tolist() == [T("2025-11-01")]
+    assert peak.to_dict("list") == {"open": [2], "overdue": [1]}
+    assert resample_backlog(timeline, "ME").index.tolist() == [T("2025-10-31")]
+
+    real = backlog_timeline(load_submissions("subjects.txt"))
+    months = resample_backlog(real, "MS", how="max")
+    assert months.index[0] == real.index[0].normalize().replace(day=1)
+    assert months["open"].iloc[0] > 0
+
+
+def test_resample_empty():
+    timeline = backlog_timeline(ROWS.iloc[:0], closed="closed_at")
+    assert resample_backlog(timeline, "D").empty
+    with pytest.raises(ValueError):
+        resample_backlog(timeline, "D", how="mean")
@@ -0,0 +1,50 @@
+from benchmark import STAGES, compare, default_students, format_table, load_baseline, run_benchmark, save_baseline
+from synthetic_logs import MAX_STUDENTS
+
+
+# -------------------------
+# Tests for run_benchmark
+# -------------------------
+
+def test_run_benchmark(tmp_path):
+    results = run_benchmark(sizes=(200, 400), repeat=1, export_limit=200, workdir=tmp_path)
+    assert [(r["rows"], r["stage"]) for r in results] == \
+        [(200, stage) for stage in STAGES] + [(400, stage) for stage in STAGES if stage != "export"]
+    assert all(r["seconds"] > 0 for r in results)
+    assert list(tmp_path.iterdir()) == []  # generated logs are removed
+    assert "parse" in format_table(results)
+
+
+def test_selected_stages(tmp_path):
+    results = run_benchmark(sizes=(100,), stages=("status", "weekend"), repeat=1, workdir=tmp_path)
+    assert [r["stage"] for r in results] == ["status", "weekend"]
+
+
+def test_default_students():
+    assert default_students(100) == 40
+    assert default_students(1_000_000) == 50_000
+    assert default_students(10_000_000) == MAX_STUDENTS
+
+
+# -------------------------
+# Tests for baselines
+# -------------------------
+
+def result(rows, stage, seconds):
+    return {"rows": rows, "stage": stage, "seconds": seconds, "rows_per_second": rows / seconds}
+
+
+def test_compare():
+    baseline = [result(1000, "parse", 1.0), result(1000, "times", 0.001), result(1000, "missing", 0.5)]
+    results = [result(1000, "parse", 1.5), result(1000, "times", 0.004), result(1000, "missing", 0.55),
+               result(5000, "parse", 9.0)]
+    regressions = compare(results, baseline, tolerance=0.2)
+    # times is below the noise floor, missing within the tolerance, 5000 rows has no baseline
+    assert [(r["rows"], r["stage"]) for r in regressions] == [(1000, "parse")]
+    assert regressions[0]["ratio"] == 1.5
+
+
+def test_baseline_round_trip(tmp_path):
+    results = [result(1000, "parse", 1.0)]
+    save_baseline(results, tmp_path / "baseline.json")
+    assert load_baseline(tmp_path / "baseline.json") == results
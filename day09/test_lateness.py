@@ -0,0 +1,153 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lateness import LatenessSketch, LatenessSummary, join_deadlines, lateness_minutes, lateness_report
+from submissions import load_submissions, read_deadlines
+
+T = pd.Timestamp
+
+
+def submissions(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    deadline = T("2025-11-02 22:00")
+    return pd.DataFrame({
+        "student_name": pd.Categorical(rng.choice(["Noya Levy", "Lior Batat", "Guy Saller"], n)),
+        "assignment_number": pd.Categorical(rng.choice(["Day01", "Day02"], n)),
+        "submission_datetime": deadline + pd.to_timedelta(rng.normal(-600, 1500, n).round(), unit="m"),
+        "deadline": deadline,
+    })
+
+
+# -------------------------
+# Tests for join_deadlines / lateness_minutes
+# -------------------------
+
+def test_join_matches_parser():
+    df = load_submissions("subjects.txt")
+    joined = join_deadlines(df.drop(columns="deadline"), read_deadlines("subjects.txt"))
+    assert (joined["deadline"].isna() == df["deadline"].isna()).all()
+    assert (joined["deadline"].dropna() == df["deadline"].dropna()).all()
+
+
+def test_join_plain_keys():
+    df = pd.DataFrame({"assignment_number": ["Day01", "Day07", None]})
+    joined = join_deadlines(df, {"Day01": T("2025-11-02 22:00")})
+    assert joined["deadline"].tolist()[0] == T("2025-11-02 22:00")
+    assert joined["deadline"].isna().tolist() == [False, True, True]
+    assert "deadline" not in df  # the input is not changed
+
+
+def test_lateness_minutes():
+    df = pd.DataFrame({"submission_datetime": [T("2025-11-02 21:30"), T("2025-11-03 00:00"), T("2025-11-01")],
+                       "deadline": [T("2025-11-02 22:00"), T("2025-11-02 22:00"), pd.NaT]})
+    minutes = lateness_minutes(df)
+    assert minutes[:2].tolist() == [-30.0, 120.0]
+    assert np.isnan(minutes[2])
+
+
+# -------------------------
+# Tests for LatenessSketch
+# -------------------------
+
+@pytest.mark.parametrize("accuracy", [0.01, 0.05])
+def test_relative_accuracy(accuracy):
+    rng = np.random.default_rng(1)
+    values = np.concatenate([-rng.lognormal(6, 2, 30_000), rng.lognormal(4, 2, 10_000), np.zeros(50)])
+    sketch = LatenessSketch(accuracy)
+    sketch.add(np.append(values, np.nan))
+    assert sketch.count == len(values)
+    ordered = np.sort(values)
+    for q in (0.0, 0.01, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0):
+        exact = ordered[int(np.floor(q * (len(values) - 1)))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=accuracy, abs=1e-12)
+
+
+def test_merge_equals_single_sketch():
+    values = np.random.default_rng(2).normal(-600, 1500, 20_000)
+    whole, first, second = LatenessSketch(), LatenessSketch(), LatenessSketch()
+    whole.add(values)
+    first.add(values[:7_000])
+    second.add(values[7_000:])
+    assert first.merge(second).buckets == whole.buckets
+    with pytest.raises(ValueError):
+        whole.merge(LatenessSketch(0.05))
+
+
+def test_bounded_buckets():
+    sketch = LatenessSketch(0.001, max_buckets=100)
+    sketch.add(np.concatenate([np.geomspace(0.1, 1e6, 10_000), -np.geomspace(0.1, 1e6, 10_000)]))
+    assert len(sketch.buckets) <= 100
+    assert sketch.count == 20_000
+    # The tails keep their accuracy
+    assert sketch.quantile(1.0) == pytest.approx(1e6, rel=0.001)
+    assert sketch.quantile(0.0) == pytest.approx(-1e6, rel=0.001)
+
+
+def test_sketch_round_trip():
+    sketch = LatenessSketch()
+    sketch.add([-30.0, 0.0, 120.0, 120.5])
+    restored = LatenessSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+    assert restored.buckets == sketch.buckets
+    assert restored.quantiles() == sketch.quantiles()
+
+
+def test_empty_sketch():
+    assert np.isnan(LatenessSketch().quantile(0.5))
+
+
+# -------------------------
+# Tests for LatenessSummary
+# -------------------------
+
+def test_summary_matches_per_group_sketches():
+    df = submissions()
+    summary = LatenessSummary("student_name").update(df)
+    for name, group in df.groupby("student_name", observed=True):
+        sketch = LatenessSketch()
+        sketch.add(lateness_minutes(group))
+        assert summary.sketches[name].buckets == sketch.buckets
+
+
+def test_summary_in_chunks_and_merge():
+    df = submissions()
+    whole = LatenessSummary("assignment_number").update(df).to_frame()
+    chunked = LatenessSummary("assignment_number").update(df.iloc[:5_000]).update(df.iloc[5_000:]).to_frame()
+    merged = LatenessSummary("assignment_number").update(df.iloc[:5_000])
+    merged.merge(LatenessSummary("assignment_number").update(df.iloc[5_000:]))
+    pd.testing.assert_frame_equal(whole, chunked)
+    pd.testing.assert_frame_equal(whole, merged.to_frame())
+    restored = LatenessSummary.from_dict(json.loads(json.dumps(merged.to_dict())))
+    pd.testing.assert_frame_equal(whole, restored.to_frame())
+
+
+
+def test_summary_chunks_without_lateness():
+    df = submissions()
+    summary = LatenessSummary("student_name").update(df.iloc[:100])
+    before = summary.to_frame()
+    summary.update(df.iloc[100:200].assign(deadline=pd.NaT)).update(df.iloc[:0])
+    pd.testing.assert_frame_equal(summary.to_frame(), before)
+    assert LatenessSummary().update(df.assign(deadline=pd.NaT)).sketches == {}
+    report = lateness_report(df.iloc[:0])
+    assert all(frame.empty for frame in report.values())
+
+def test_summary_frame():
+    df = submissions()
+    frame = LatenessSummary("student_name").update(df).to_frame()
+    assert list(frame.columns) == ["count", "p50", "p90", "p99"]
+    assert frame["count"].sum() == len(df)
+    exact = pd.Series(lateness_minutes(df)).groupby(df["student_name"].to_numpy()).quantile(0.9, interpolation="lower")
+    np.testing.assert_allclose(frame["p90"], exact.sort_index(), rtol=0.01)
+
+
+def test_report_on_subjects():
+    df = load_submissions("subjects.txt")
+    report = lateness_report(df)
+    by_assignment = report["assignment_number"]
+    # Day07 has no deadline, so it has no lateness
+    assert "Day07" not in by_assignment.index
+    assert by_assignment["count"].sum() == df["deadline"].notna().sum()
+    assert report["student_name"]["count"].sum() == (df["deadline"].notna() & df["student_name"].notna()).sum()
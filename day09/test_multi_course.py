@@ -0,0 +1,93 @@
+import math
+from datetime import time
+
+import pytest
+
+from multi_course import aggregate_courses, course_name, course_report, cross_course_state, time_workers
+from submission_state import SubmissionState
+from submissions import load_submissions
+
+LINES = open("subjects.txt", encoding="utf-8-sig").read().splitlines(keepends=True)
+
+
+@pytest.fixture
+def logs(tmp_path):
+    """Three course logs: the full export and two halves of it, one in a subdirectory."""
+    submissions = [line for line in LINES if line[:1].isdigit()]
+    rest = [line for line in LINES if not line[:1].isdigit()]
+    half = len(submissions) // 2
+    (tmp_path / "algo").mkdir()
+    (tmp_path / "full.txt").write_text("".join(LINES), encoding="utf-8")
+    (tmp_path / "algo" / "first.txt").write_text("".join(submissions[:half] + rest), encoding="utf-8")
+    (tmp_path / "second.txt").write_text("".join(submissions[half:] + rest), encoding="utf-8")
+    return tmp_path
+
+
+# -------------------------
+# Tests for aggregate_courses
+# -------------------------
+
+def test_course_name(tmp_path):
+    assert course_name(tmp_path / "algo" / "2025.txt", tmp_path) == "algo/2025"
+
+
+def test_parallel_matches_serial(logs):
+    serial = aggregate_courses(logs, workers=1)
+    parallel = aggregate_courses(logs, workers=2)
+    assert sorted(serial) == ["algo/first", "full", "second"]
+    assert {c: s.to_dict() for c, s in serial.items()} == {c: s.to_dict() for c, s in parallel.items()}
+
+
+def test_matches_single_file(logs):
+    states = aggregate_courses(logs, workers=1)
+    full = SubmissionState()
+    full.update_from_file(logs / "full.txt")
+    assert states["full"].to_dict() == full.to_dict()
+
+
+def test_pattern(logs):
+    assert list(aggregate_courses(logs, pattern="*.txt", workers=1)) == ["full", "second"]
+
+
+# -------------------------
+# Tests for the reports
+# -------------------------
+
+def test_course_report(logs):
+    states = aggregate_courses(logs, workers=1)
+    report = course_report(states)
+    assert list(report.index) == ["algo/first", "full", "second"]
+    assert report.loc["algo/first", "rows"] + report.loc["second", "rows"] == report.loc["full", "rows"]
+    assert (report["closed"] + report["open"] == report["rows"]).all()
+    assert all(isinstance(value, time) for value in report["mean_time"])
+
+
+def test_mean_time(logs):
+    states = aggregate_courses(logs, workers=1)
+    # Circular mean over every row, straight from the parsed table
+    seconds = load_submissions(logs / "full.txt")["submission_datetime"]
+    angles = [2 * math.pi * (t.hour * 3600 + t.minute * 60 + t.second) / 86400 for t in seconds]
+    angle = math.atan2(sum(map(math.sin, angles)), sum(map(math.cos, angles))) % (2 * math.pi)
+    minutes = round(angle / (2 * math.pi) * 86400) // 60
+    assert states["full"].mean_time() == time(minutes // 60, minutes % 60)
+    halves = cross_course_state({c: states[c] for c in ("algo/first", "second")})
+    assert halves.mean_time() == states["full"].mean_time()
+    assert SubmissionState().mean_time() is None
+
+
+def test_cross_course_state(logs):
+    states = aggregate_courses(logs, workers=1)
+    halves = cross_course_state({c: states[c] for c in ("algo/first", "second")})
+    full = states["full"]
+    assert halves.rows == full.rows
+    assert halves.status_counts == full.status_counts
+    assert halves.weekday_counts == full.weekday_counts
+    assert halves.missing_counts() == full.missing_counts()
+
+
+def test_time_workers(tmp_path):
+    results = time_workers(courses=3, rows=50, workers=(1, 2), workdir=tmp_path)
+    assert [r["workers"] for r in results] == [1, 2]
+    assert results[0]["speedup"] == 1.0
+    assert all(r["seconds"] > 0 for r in results)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,67 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import report_cache
+from report_cache import cache_path_for, load_report
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def report(tmp_path):
+    target = tmp_path / "assignment_submission_report.xlsx"
+    shutil.copy("assignment_submission_report.xlsx", target)
+    return target
+
+
+def count_excel_reads(monkeypatch):
+    calls = []
+    original = report_cache.read_report_excel
+    monkeypatch.setattr(report_cache, "read_report_excel", lambda path: calls.append(path) or original(path))
+    return calls
+
+
+# -------------------------
+# Tests for load_report
+# -------------------------
+
+def test_types(report):
+    df = load_report(report)
+    assert df["submission_datetime"].dtype.kind == "M"
+    assert df["deadline"].dtype.kind == "M"
+    assert isinstance(df["submission_status"].dtype, pd.CategoricalDtype)
+
+
+def test_second_load_uses_cache(report, monkeypatch):
+    calls = count_excel_reads(monkeypatch)
+    first = load_report(report)
+    second = load_report(report)
+    assert len(calls) == 1
+    assert cache_path_for(report).exists()
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_touch_keeps_cache(report, monkeypatch):
+    load_report(report)
+    calls = count_excel_reads(monkeypatch)
+    stat = os.stat(report)
+    os.utime(report, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    load_report(report)
+    assert calls == []
+
+
+def test_changed_workbook_rebuilds_cache(report, monkeypatch):
+    load_report(report)
+    df = pd.read_excel(report).head(5)
+    df.to_excel(report, index=False)
+    calls = count_excel_reads(monkeypatch)
+    assert len(load_report(report)) == 5
+    assert len(calls) == 1
+
+
+def test_without_cache(report):
+    assert len(load_report(report, use_cache=False)) == 213
+    assert not cache_path_for(report).exists()
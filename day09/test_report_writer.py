@@ -0,0 +1,94 @@
+from datetime import time
+
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+import report_writer
+from report_writer import write_report
+
+FRAME = pd.DataFrame({
+    "student_name": pd.Categorical(["Noya Levy", "Lior Batat", None]),
+    "submission_datetime": pd.to_datetime(["2025-11-07 23:50", None, "2025-11-05 20:00"]),
+    "submission_time": [time(23, 50), None, time(20, 0)],
+    "pr_number": [3, 2, 1],
+})
+
+
+# -------------------------
+# Tests for write_report
+# -------------------------
+
+def test_sheets_round_trip(tmp_path):
+    path = tmp_path / "report.xlsx"
+    status_counts = pd.Series([2, 1], index=pd.Index(["Closed", "Open"], name="submission_status"), name="count")
+    written = write_report(path, {"Cleaned_Data": (FRAME, False), "Open_vs_Closed": status_counts.to_frame("Count")})
+    assert written["sheets"] == ["Cleaned_Data", "Open_vs_Closed"]
+
+    sheets = pd.read_excel(path, sheet_name=None)
+    cleaned = sheets["Cleaned_Data"]
+    assert list(cleaned.columns) == list(FRAME.columns)
+    assert cleaned["pr_number"].tolist() == [3, 2, 1]
+    assert cleaned["submission_datetime"].isna().tolist() == [False, True, False]
+    assert pd.isna(cleaned.loc[2, "student_name"])
+    # DataFrame without an explicit flag: no index column
+    assert sheets["Open_vs_Closed"].columns.tolist() == ["Count"]
+
+
+def test_index_written(tmp_path):
+    path = tmp_path / "report.xlsx"
+    counts = pd.Series([2, 1], index=pd.Index(["Closed", "Open"], name="submission_status"), name="Count")
+    write_report(path, {"Open_vs_Closed": counts})
+    sheet = pd.read_excel(path)
+    assert sheet.to_dict("list") == {"submission_status": ["Closed", "Open"], "Count": [2, 1]}
+
+
+def test_times_are_excel_times(tmp_path):
+    path = tmp_path / "report.xlsx"
+    write_report(path, {"Cleaned_Data": (FRAME, False)})
+    sheet = load_workbook(path)["Cleaned_Data"]
+    assert sheet["C2"].value == time(23, 50)
+    assert sheet["C3"].value is None
+
+
+def test_long_sheet_continues(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_writer, "MAX_SHEET_ROWS", 3)  # header + 2 rows per sheet
+    path = tmp_path / "report.xlsx"
+    frame = pd.DataFrame({"pr_number": range(5)})
+    written = write_report(path, {"Data": (frame, False)}, chunk_rows=1)
+    assert written["sheets"] == ["Data", "Data_2", "Data_3"]
+    sheets = pd.read_excel(path, sheet_name=None)
+    assert pd.concat(sheets.values())["pr_number"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_empty_sheet(tmp_path):
+    path = tmp_path / "report.xlsx"
+    write_report(path, {"Empty": (FRAME.iloc[:0], False)})
+    assert list(pd.read_excel(path).columns) == list(FRAME.columns)
+
+
+def test_sidecars(tmp_path):
+    path = tmp_path / "report.xlsx"
+    written = write_report(path, {"Cleaned_Data": (FRAME, False)}, sidecars=("csv", "parquet"), chunk_rows=2)
+    assert written["sidecars"] == [str(tmp_path / "report_Cleaned_Data.csv"),
+                                   str(tmp_path / "report_Cleaned_Data.parquet")]
+    assert pd.read_csv(tmp_path / "report_Cleaned_Data.csv")["pr_number"].tolist() == [3, 2, 1]
+    parquet = pd.read_parquet(tmp_path / "report_Cleaned_Data.parquet")
+    assert parquet["student_name"].tolist()[:2] == ["Noya Levy", "Lior Batat"]
+
+
+def test_unknown_sidecar(tmp_path):
+    with pytest.raises(ValueError):
+        write_report(tmp_path / "report.xlsx", {"Data": FRAME}, sidecars=("json",))
+
+
+def test_charts(tmp_path):
+    path = tmp_path / "report.xlsx"
+    weekend = pd.Series([10, 30], index=["Weekend (Fri+Sat)", "Weekday"])
+    written = write_report(path, {"Weekend_Stats": weekend.to_frame("Count")},
+                           charts={"weekend": dict(series=weekend, kind="pie", title="Weekend vs Weekday")})
+    assert written["charts"] == [str(tmp_path / "report_weekend.png")]
+    assert (tmp_path / "report_weekend.png").stat().st_size > 0
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == ["Weekend_Stats", "Charts"]
+    assert len(workbook["Charts"]._images) == 1
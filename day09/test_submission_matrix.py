@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+from submission_matrix import SubmissionMatrix
+
+D1 = pd.Timestamp("2025-11-02 22:00")
+D2 = pd.Timestamp("2025-11-09 22:00")
+
+df = pd.DataFrame(
+    [
+        ("Day01", D1, "Noya Levy", "Closed", "2025-11-01 10:00"),
+        ("Day01", D1, "Noya Levy", "Closed", "2025-11-05 10:00"),   # resubmission, still on time
+        ("Day02", D2, "Noya Levy", "Closed", "2025-11-12 10:00"),   # late
+        ("Day01", D1, "Lior Batat", "Closed", "2025-11-03 10:00"),  # late
+        ("Day02", D2, "Lior Batat", "Open", "2025-11-08 10:00"),    # not merged: missing
+        ("Day08", pd.NaT, "Adi Moses", "Closed", "2026-01-01 10:00"),  # no deadline: never late
+        ("FP_SUBMISSION", D2, None, "Open", "2026-01-04 08:20"),    # no student
+    ],
+    columns=["assignment_number", "deadline", "student_name", "submission_status", "submission_datetime"],
+)
+df["submission_datetime"] = pd.to_datetime(df["submission_datetime"])
+matrix = SubmissionMatrix.from_frame(df)
+
+
+# -------------------------
+# Tests for SubmissionMatrix
+# -------------------------
+
+def test_labels():
+    assert list(matrix.students) == ["Adi Moses", "Lior Batat", "Noya Levy"]
+    assert list(matrix.assignments) == ["Day01", "Day02", "Day08", "FP_SUBMISSION"]
+
+
+def test_done_and_late_bits():
+    assert matrix.is_done("Noya Levy", "Day02")
+    assert not matrix.is_done("Lior Batat", "Day02")
+    assert not matrix.is_late("Noya Levy", "Day01")
+    assert matrix.is_late("Noya Levy", "Day02")
+    assert matrix.is_late("Lior Batat", "Day01")
+    assert not matrix.is_late("Adi Moses", "Day08")
+
+
+def test_missing_counts():
+    assert matrix.missing_counts().to_dict() == {"Adi Moses": 3, "Lior Batat": 3, "Noya Levy": 2}
+    assert matrix.students_missing_at_least(3) == ["Adi Moses", "Lior Batat"]
+    assert matrix.students_complete() == []
+    assert matrix.late_counts().to_dict() == {"Adi Moses": 0, "Lior Batat": 1, "Noya Levy": 1}
+
+
+def test_rates():
+    assert matrix.completion_rates().round(3).to_dict() == {"Day01": 0.667, "Day02": 0.333, "Day08": 0.333,
+                                                            "FP_SUBMISSION": 0.0}
+    assert matrix.late_rates().to_dict() == {"Day01": 0.5, "Day02": 1.0, "Day08": 0.0, "FP_SUBMISSION": 0.0}
+
+
+def test_matches_groupby_on_random_data():
+    rng = np.random.default_rng(3)
+    n = 5000
+    assignments = [f"Day{i:02d}" for i in range(1, 20)]
+    big = pd.DataFrame({
+        "student_name": rng.integers(0, 300, n).astype(str),
+        "assignment_number": np.array(assignments)[rng.integers(0, len(assignments), n)],
+        "submission_status": np.where(rng.random(n) < 0.7, "Closed", "Open"),
+    })
+    m = SubmissionMatrix.from_frame(big)
+    closed = big[big["submission_status"] == "Closed"]
+    expected = len(assignments) - closed.groupby("student_name")["assignment_number"].nunique()
+    expected = expected.reindex(m.students, fill_value=len(assignments))
+    assert (m.missing_counts() == expected).all()
+    dense = m.to_frame()
+    assert (dense.sum(axis=0) / len(m.students)).round(9).equals(m.completion_rates().round(9))
@@ -0,0 +1,116 @@
+from datetime import datetime, time
+
+import pytest
+
+from submission_state import SubmissionState, merge_states
+from submissions import load_submissions
+
+
+def record(pr, assignment, student, status, when):
+    return {"pr_number": pr, "assignment_number": assignment, "student_name": student,
+            "submission_status": status, "submission_datetime": when}
+
+
+ROWS = [
+    record(1, "Day01", "Noya Levy", "Closed", datetime(2025, 11, 7, 23, 50)),   # Friday
+    record(2, "Day01", "Lior Batat", "Closed", datetime(2025, 11, 5, 20, 0)),
+    record(3, "Day02", "Noya Levy", "Open", datetime(2025, 11, 10, 0, 10)),
+]
+
+
+# -------------------------
+# Tests for SubmissionState
+# -------------------------
+
+def test_update_skips_merged_prs():
+    state = SubmissionState()
+    assert state.update(ROWS[:2]) == 2
+    assert state.update(ROWS) == 1
+    assert state.last_pr == 3
+    assert state.rows == 3
+    assert state.status_counts == {"Closed": 2, "Open": 1}
+
+
+def test_update_closes_open_prs():
+    state = SubmissionState()
+    state.update(ROWS)
+    assert state.open_prs == {3: [("Noya Levy", "Day02")]}
+    assert state.update([dict(ROWS[2], submission_status="Closed")]) == 0
+    assert state.status_counts == {"Closed": 3, "Open": 0}
+    assert state.missing_counts() == {"Noya Levy": 0, "Lior Batat": 1}
+    assert state.open_prs == {}
+
+
+def test_results():
+    state = SubmissionState()
+    state.update(ROWS)
+    assert state.missing_counts() == {"Noya Levy": 1, "Lior Batat": 1}
+    # 23:50 and 00:10 average to midnight, not to noon
+    assert state.average_times()["Noya Levy"] == time(0, 0)
+    assert state.mode_hours()["Lior Batat"] == 20
+    assert state.weekend_counts() == {"Weekend (Fri+Sat)": 1, "Weekday": 2}
+
+
+def test_save_and_load(tmp_path):
+    state = SubmissionState()
+    state.update(ROWS)
+    path = tmp_path / "state.json"
+    state.save(path)
+    loaded = SubmissionState.load(path)
+    assert loaded.to_dict() == state.to_dict()
+    assert SubmissionState.load(tmp_path / "missing.json").last_pr == 0
+
+
+def test_merge_states_equals_single_state():
+    first, second, whole = SubmissionState(), SubmissionState(), SubmissionState()
+    first.update(ROWS[:1])
+    second.update(ROWS[1:])
+    whole.update(ROWS)
+    merged = merge_states(first, second).to_dict()
+    expected = whole.to_dict()
+    for s in (merged, expected):
+        for student in s["students"].values():
+            student["sin"] = pytest.approx(student["sin"])
+            student["cos"] = pytest.approx(student["cos"])
+    assert merged == expected
+
+
+# -------------------------
+# Tests with subjects.txt
+# -------------------------
+
+def test_incremental_file_update(tmp_path):
+    lines = open("subjects.txt", encoding="utf-8").readlines()
+    older = tmp_path / "older.txt"
+    older.write_text("".join(lines[10:]), encoding="utf-8")
+
+    state = SubmissionState()
+    state.update_from_file(older)
+    merged = state.update_from_file("subjects.txt")
+    df = load_submissions("subjects.txt")
+    assert merged == (df["pr_number"] > int(lines[10].split("\t")[0])).sum()
+    assert state.rows == len(df)
+    assert state.status_counts == df["submission_status"].value_counts().to_dict()
+    assert state.update_from_file("subjects.txt") == 0
+
+
+def test_file_update_picks_up_closed_prs(tmp_path):
+    lines = open("subjects.txt", encoding="utf-8").readlines()
+    oldest_open = min(int(line.split("\t")[0]) for line in lines if "\tOPEN\t" in line)
+    # Before grading: every PR is still open; then the real export, with most of them closed
+    ungraded = tmp_path / "ungraded.txt"
+    ungraded.write_text("".join(line.replace("\tCLOSED\t", "\tOPEN\t") for line in lines), encoding="utf-8")
+    state = SubmissionState()
+    state.update_from_file(ungraded)
+    checkpoint = tmp_path / "state.json"
+    state.save(checkpoint)
+
+    state = SubmissionState.load(checkpoint)
+    assert state.update_from_file("subjects.txt") == 0
+    df = load_submissions("subjects.txt")
+    assert state.status_counts == df["submission_status"].value_counts().to_dict()
+    fresh = SubmissionState()
+    fresh.update_from_file("subjects.txt")
+    assert state.missing_counts() == fresh.missing_counts()
+    assert state.to_dict()["open_prs"] == fresh.to_dict()["open_prs"]
+    assert min(state.open_prs) == oldest_open
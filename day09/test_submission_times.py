@@ -0,0 +1,70 @@
+from datetime import time
+
+import numpy as np
+import pandas as pd
+
+from submission_times import circular_mean_seconds, mode_bin_seconds, seconds_of_day, submission_time_stats
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["student_name", "submission_datetime"]).assign(
+        submission_datetime=lambda d: pd.to_datetime(d["submission_datetime"]))
+
+
+# -------------------------
+# Tests for the array helpers
+# -------------------------
+
+def test_seconds_of_day():
+    values = pd.to_datetime(pd.Series(["2025-11-05 00:00:01", "2025-11-06 23:59:59"]))
+    assert seconds_of_day(values).tolist() == [1, 86399]
+
+
+def test_circular_mean_wraps_midnight():
+    codes = np.array([0, 0, 1, 1])
+    seconds = np.array([23 * 3600 + 50 * 60, 10 * 60, 9 * 3600, 11 * 3600])
+    assert circular_mean_seconds(codes, seconds, 2).tolist() == [0, 10 * 3600]
+
+
+def test_mode_bin_prefers_fullest_then_earliest():
+    codes = np.array([0, 0, 0, 1, 1])
+    seconds = np.array([20 * 3600 + 5, 20 * 3600 + 900, 8 * 3600, 9 * 3600, 7 * 3600])
+    assert mode_bin_seconds(codes, seconds, 2).tolist() == [20 * 3600, 7 * 3600]
+    assert mode_bin_seconds(codes, seconds, 2, bin_seconds=60).tolist() == [8 * 3600, 7 * 3600]
+
+
+# -------------------------
+# Tests for submission_time_stats
+# -------------------------
+
+def test_submission_time_stats():
+    df = frame([
+        ("Noya Levy", "2025-11-05 23:50:00"),
+        ("Noya Levy", "2025-11-06 00:10:00"),
+        ("Noya Levy", "2025-11-07 00:20:00"),
+        ("Lior Batat", "2025-11-05 20:00:00"),
+        (None, "2025-11-05 12:00:00"),
+    ])
+    stats = submission_time_stats(df)
+    assert list(stats.index) == ["Lior Batat", "Noya Levy"]
+    assert stats.loc["Lior Batat", "average_time"] == time(20, 0)
+    assert stats.loc["Noya Levy", "mode_time"] == time(0, 0)
+    average = stats.loc["Noya Levy", "average_time"]
+    assert average.hour == 0 and 5 <= average.minute <= 7
+    assert stats["submissions"].tolist() == [1, 3]
+
+
+def test_matches_groupby_for_daytime_submissions():
+    rng = np.random.default_rng(1)
+    n = 2000
+    # Times between 08:00 and 16:00 never wrap, so the circular mean is close to the plain mean
+    df = pd.DataFrame({
+        "student_name": rng.integers(0, 20, n).astype(str),
+        "submission_datetime": pd.Timestamp("2025-11-01 08:00") + pd.to_timedelta(
+            rng.integers(0, 8 * 3600, n) + 86400 * rng.integers(0, 30, n), unit="s"),
+    })
+    stats = submission_time_stats(df)
+    plain = df.groupby("student_name")["submission_datetime"].agg(
+        lambda x: (x.dt.hour * 3600 + x.dt.minute * 60 + x.dt.second).mean())
+    circular = stats["average_time"].map(lambda t: t.hour * 3600 + t.minute * 60 + t.second)
+    assert (circular - plain).abs().max() < 15 * 60
@@ -0,0 +1,123 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from submissions import (iter_submissions, load_submissions, normalize_name, parse_deadlines, parse_title,
+                         write_parquet)
+
+SAMPLE = (
+    "3\tOPEN\tDay 05 and 06 by einav litvak\t\t2026-01-04T07:53:01Z\n"
+    "2\tCLOSED\tday03-Rachel Steinitz-Eliyahu\t\t2025-11-20T10:16:53Z\n"
+    "1\tCLOSED\tDay01 by Noya Levy\t\t2025-11-05T19:56:31Z\n"
+    "\n"
+    "Day01 Dead-line: 2025.11.02 22:00 Day03 Dead-line: 2025.11.16 22:00 Day07: no deadline decided "
+    "Final Project proposal dead-line: 2026.01.11 22:00\n"
+)
+
+
+@pytest.fixture
+def subjects(tmp_path):
+    path = tmp_path / "subjects.txt"
+    path.write_text(SAMPLE, encoding="utf-8")
+    return path
+
+
+# -------------------------
+# Tests for the title and deadline patterns
+# -------------------------
+
+@pytest.mark.parametrize("title, expected", [
+    ("Day01 by Noya Levy", (["Day01"], "Noya Levy")),
+    ("day 1 Lior Batat", (["Day01"], "Lior Batat")),
+    ("Day 03 - Sriashwin Sridharan", (["Day03"], "Sriashwin Sridharan")),
+    ("Day03 and Day04 by Einav Litvak", (["Day03", "Day04"], "Einav Litvak")),
+    ("Day 05 and 06 by Einav Litvak", (["Day05", "Day06"], "Einav Litvak")),
+    ("day 08 and proposal for final project-Rachel Steinitz Eliyahu", (["Day08", "FP_PROPOSAL"], "Rachel Steinitz Eliyahu")),
+    ("Final Project Proposal by Guy Vosco", (["FP_PROPOSAL"], "Guy Vosco")),
+    ("Day08 By Achinoam Shoham", (["Day08"], "Achinoam Shoham")),
+    ("Update README", ([], None)),
+])
+def test_parse_title(title, expected):
+    assert parse_title(title) == expected
+
+
+def test_normalize_name():
+    assert normalize_name("  noya   levy ") == "Noya Levy"
+    assert normalize_name("Rachel Steinitz-Eliyahu") == "Rachel Steinitz Eliyahu"
+    assert normalize_name("hallel Azulai") == "Hallel Azulai"
+
+
+def test_parse_deadlines():
+    deadlines = parse_deadlines(SAMPLE.splitlines()[-1])
+    assert deadlines == {
+        "Day01": datetime(2025, 11, 2, 22, 0),
+        "Day03": datetime(2025, 11, 16, 22, 0),
+        "FP_PROPOSAL": datetime(2026, 1, 11, 22, 0),
+    }
+
+
+# -------------------------
+# Tests for the streaming parser and the table
+# -------------------------
+
+def test_iter_submissions_one_row_per_assignment():
+    skipped, deadlines = [], {}
+    lines = SAMPLE.splitlines(keepends=True) + ["4\tOPEN\tFix typo\t\t2026-01-05T10:00:00Z\n"]
+    rows = list(iter_submissions(lines, deadlines=deadlines, skipped=skipped))
+    assert [(r["pr_number"], r["assignment_number"]) for r in rows] == [(3, "Day05"), (3, "Day06"), (2, "Day03"), (1, "Day01")]
+    assert rows[0]["student_name"] == "Einav Litvak"
+    assert rows[0]["submission_status"] == "Open"
+    assert rows[0]["submission_datetime"] == datetime(2026, 1, 4, 7, 53, 1)
+    assert len(skipped) == 1
+    assert "Day03" in deadlines
+
+
+def test_load_submissions(subjects):
+    df = load_submissions(subjects)
+    assert len(df) == 4
+    assert isinstance(df["assignment_number"].dtype, pd.CategoricalDtype)
+    assert df["assignment_number"].cat.ordered
+    assert list(df["assignment_number"].cat.categories) == ["Day01", "Day03", "Day05", "Day06", "FP_PROPOSAL"]
+    assert df.loc[df["assignment_number"] == "Day01", "deadline"].iloc[0] == pd.Timestamp("2025-11-02 22:00")
+    assert df.loc[df["assignment_number"] == "Day05", "deadline"].isna().all()
+
+
+def test_write_parquet_round_trip(subjects, tmp_path):
+    pytest.importorskip("pyarrow")
+    target = tmp_path / "submissions.parquet"
+    assert write_parquet(subjects, target, chunk_size=2) == 4
+    df = pd.read_parquet(target)
+    expected = load_submissions(subjects)
+    assert df["pr_number"].tolist() == expected["pr_number"].tolist()
+    assert df["assignment_number"].astype(str).tolist() == expected["assignment_number"].astype(str).tolist()
+    assert isinstance(df["student_name"].dtype, pd.CategoricalDtype)
+
+
+
+def test_write_parquet_later_chunk_with_many_students(tmp_path):
+    # The first chunk has 3 students (int8 dictionary indices), the second 200
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "subjects.txt"
+    names = [f"Student {i:03d}" for i in range(3)] * 67
+    lines = [f"{400 - i}\tCLOSED\tDay01 by {name}\t\t2025-11-01T10:00:00Z\n" for i, name in enumerate(names[:200])]
+    lines += [f"{200 - i}\tOPEN\tDay01 by Other {i:03d}\t\t2025-11-02T10:00:00Z\n" for i in range(200)]
+    path.write_text("".join(lines) + "\nDay01 Dead-line: 2025.11.02 22:00\n", encoding="utf-8")
+    target = tmp_path / "submissions.parquet"
+    assert write_parquet(path, target, chunk_size=200) == 400
+    df = pd.read_parquet(target)
+    assert df["student_name"].nunique() == 203
+    assert df["student_name"].astype(str).tolist() == load_submissions(path)["student_name"].astype(str).tolist()
+
+
+def test_load_submissions_in_chunks(subjects):
+    whole = load_submissions(subjects)
+    chunked = load_submissions(subjects, chunk_size=1)
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+def test_real_subjects_file():
+    df = load_submissions("subjects.txt")
+    assert df["pr_number"].nunique() == 213
+    assert df["student_name"].notna().all()
+    assert set(df["submission_status"]) == {"Open", "Closed"}
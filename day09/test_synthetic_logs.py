@@ -0,0 +1,55 @@
+from datetime import datetime
+
+import pytest
+
+from submissions import load_submissions, read_deadlines
+from synthetic_logs import MAX_STUDENTS, assignment_schedule, generate_log, student_names
+
+
+# -------------------------
+# Tests for generate_log
+# -------------------------
+
+def test_log_parses(tmp_path):
+    path = tmp_path / "subjects.txt"
+    deadlines = generate_log(path, 2_000, students=50, assignments=4, closed_share=0.8, late_share=0.25, seed=1)
+    df = load_submissions(path)
+
+    assert len(df) == 2_000
+    assert df["pr_number"].tolist() == list(range(2_000, 0, -1))
+    # Every title variant gives back the student's name
+    assert set(df["student_name"].dropna()) <= set(student_names(50))
+    assert df["student_name"].notna().all()
+    assert read_deadlines(path) == deadlines
+    assert set(df["assignment_number"]) == {"Day01", "Day02", "Day03", "Day04", "FP_PROPOSAL", "FP_SUBMISSION"}
+
+    closed = (df["submission_status"] == "Closed").mean()
+    late = (df["submission_datetime"] > df["deadline"]).mean()
+    assert closed == pytest.approx(0.8, abs=0.04)
+    assert late == pytest.approx(0.25, abs=0.04)
+
+
+def test_time_of_day(tmp_path):
+    path = tmp_path / "subjects.txt"
+    generate_log(path, 2_000, peak_hour=9, hour_spread=1, late_share=0, seed=2)
+    hours = load_submissions(path)["submission_datetime"].dt.hour
+    assert hours.between(6, 12).mean() > 0.95
+
+
+def test_same_seed_same_log(tmp_path):
+    generate_log(tmp_path / "a.txt", 500, seed=3, chunk_rows=100)
+    generate_log(tmp_path / "b.txt", 500, seed=3, chunk_rows=100)
+    assert (tmp_path / "a.txt").read_text() == (tmp_path / "b.txt").read_text()
+
+
+def test_schedule():
+    deadlines = assignment_schedule(2, datetime(2025, 11, 2), final_project=False)
+    assert [f"{d:%Y-%m-%d %H:%M}" for d in deadlines.values()] == ["2025-11-02 22:00", "2025-11-09 22:00"]
+
+
+def test_student_names():
+    names = student_names(5_000)
+    assert len(set(names)) == 5_000
+    assert len(set(student_names(MAX_STUDENTS))) == MAX_STUDENTS
+    with pytest.raises(ValueError):
+        student_names(MAX_STUDENTS + 1)